@@ -0,0 +1 @@
+"""Docker gc inventory benchmark: Engine API socket vs `docker` CLI."""
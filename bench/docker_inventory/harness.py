@@ -0,0 +1,156 @@
+"""Time `docker_recover.py gc` inventory collection: Engine API vs `docker` CLI.
+
+Run with ``python -m bench.docker_inventory.harness``. It needs a live local
+engine and is never collected by pytest. Both paths build the same
+`GcInventory` (images, containers, volumes) that `gc` plans over. The CLI path
+forks `docker` five times per pass; the API path makes four JSON requests over
+one Unix-socket connection.
+
+``--seed 500`` first creates 500 distinct throwaway images (``FROM scratch``
+plus a unique label, so each one is a separate image ID costing no layer
+storage), which reproduces the "host with 500 images" case. ``--cleanup``
+removes them afterwards. Seeded images carry the ``clud.bench.docker-inventory``
+label and nothing else is ever touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from running_process import RunningProcess
+
+ROOT = Path(__file__).resolve().parents[2]
+DOCKER_TOOLS = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker"
+SEED_LABEL = "clud.bench.docker-inventory"
+
+
+def _load_docker_recover():
+    name = "clud_bench_docker_recover"
+    spec = importlib.util.spec_from_file_location(name, DOCKER_TOOLS / "docker_recover.py")
+    if spec is None or spec.loader is None:
+        raise RuntimeError("cannot load docker_recover.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_images(count: int) -> None:
+    for index in range(count):
+        dockerfile = f"FROM scratch\nLABEL {SEED_LABEL}={index}\n"
+        result = RunningProcess.run(
+            ["docker", "build", "-q", "-t", f"clud-bench-inventory:{index}", "-"],
+            input=dockerfile,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"seeding image {index} failed: {result.stderr.strip()}")
+
+
+def _cleanup_images() -> int:
+    listing = RunningProcess.run(
+        ["docker", "image", "ls", "-q", "--filter", f"label={SEED_LABEL}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    ids = sorted(set(listing.stdout.split()))
+    if ids:
+        RunningProcess.run(["docker", "image", "rm", "-f", *ids], capture_output=True, check=False)
+    return len(ids)
+
+
+def _time_pass(collect) -> tuple[float, Any]:
+    start = time.perf_counter()
+    inventory = collect()
+    return time.perf_counter() - start, inventory
+
+
+def _cli_inventory(dr) -> Any:
+    """`gather_gc_inventory`'s CLI fallback, forced."""
+    return dr.GcInventory(
+        images=dr._list_images(),
+        containers=dr._list_containers(),
+        volumes=dr._list_volumes(),
+    )
+
+
+def run(repeat: int) -> dict[str, Any]:
+    dr = _load_docker_recover()
+    probe = dr.engine_client()
+    if probe is None:
+        raise RuntimeError("Engine API socket unavailable; nothing to compare against")
+    probe.close()
+
+    samples: dict[str, list[float]] = {"api": [], "cli": []}
+    counts: dict[str, dict[str, int]] = {}
+    for _ in range(repeat):
+        # Interleave so engine-side caching favours neither path.
+        for label, collect in (
+            ("api", dr.gather_gc_inventory),
+            ("cli", lambda: _cli_inventory(dr)),
+        ):
+            seconds, inventory = _time_pass(collect)
+            samples[label].append(seconds)
+            counts[label] = {
+                "images": len(inventory.images),
+                "containers": len(inventory.containers),
+                "volumes": len(inventory.volumes),
+            }
+    report: dict[str, Any] = {"repeat": repeat, "paths": {}}
+    for label, values in samples.items():
+        report["paths"][label] = {
+            "counts": counts[label],
+            "median_seconds": round(statistics.median(values), 6),
+            "min_seconds": round(min(values), 6),
+            "max_seconds": round(max(values), 6),
+        }
+    api_median = report["paths"]["api"]["median_seconds"]
+    cli_median = report["paths"]["cli"]["median_seconds"]
+    report["speedup"] = round(cli_median / api_median, 2) if api_median else None
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="create N labelled scratch images first"
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="remove seeded images afterwards"
+    )
+    parser.add_argument("--json", type=Path, help="write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.seed:
+        _seed_images(args.seed)
+    try:
+        report = run(args.repeat)
+    finally:
+        if args.cleanup:
+            removed = _cleanup_images()
+            print(f"removed {removed} seeded image(s)", file=sys.stderr)
+    payload = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.json:
+        args.json.write_text(payload, encoding="utf-8")
+        print(args.json)
+    else:
+        print(payload, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""clud-git-diff parser benchmark: whole-text parse vs streamed index."""
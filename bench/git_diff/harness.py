@@ -0,0 +1,181 @@
+"""Time and memory for clud-git-diff's parser and payloads on synthetic diffs.
+
+Run with ``python -m bench.git_diff.harness``. It is never collected by
+pytest. The harness writes a synthetic unified diff (500 MB by default, or
+``--files N`` files) of a configurable shape, then measures three modes:
+
+* ``whole-text`` — the pre-streaming path: the diff is read into one str,
+  and `parse_diff` builds every file's hunks from it.
+* ``streamed`` — what the viewer does before showing the window:
+  `index_diff` reads the diff line by line, keeping only each file's byte
+  span and +/- counts. In the viewer the lines come from `stream_diff`,
+  which follows git's own spool file.
+* ``payload`` — the headless ``--export``/``--json`` path: the streamed
+  index, then every file re-read, parsed, encoded with `file_to_payload`
+  and serialized.
+
+Each mode runs in a fresh interpreter so its peak RSS is its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from running_process import RunningProcess
+
+ROOT = Path(__file__).resolve().parents[2]
+TOOL = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "git" / "clud-git-diff.py"
+MODES = ("whole-text", "streamed", "payload")
+
+
+def _load_git_diff():
+    name = "clud_bench_git_diff"
+    spec = importlib.util.spec_from_file_location(name, TOOL)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("cannot load clud-git-diff.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_synthetic_diff(path: Path, *, target_bytes: int | None = None,
+                         files: int | None = None, hunks_per_file: int = 8,
+                         hunk_lines: int = 40, line_length: int = 80) -> int:
+    """Write files of `hunks_per_file` hunks until `path` holds `files`
+    files or reaches `target_bytes`. Returns the number of files written."""
+    if target_bytes is None and files is None:
+        raise ValueError("need target_bytes or files")
+    body = "x" * max(line_length - 12, 1)
+    written = 0
+    count = 0
+    with path.open("w", encoding="utf-8", newline="\n") as fh:
+        while (count < files) if files is not None else (written < target_bytes):
+            name = f"src/module_{count:06d}.py"
+            chunk = [
+                f"diff --git a/{name} b/{name}\n",
+                "index 1111111..2222222 100644\n",
+                f"--- a/{name}\n",
+                f"+++ b/{name}\n",
+            ]
+            for h in range(hunks_per_file):
+                start = 1 + h * hunk_lines * 2
+                chunk.append(f"@@ -{start},{hunk_lines} +{start},{hunk_lines} @@\n")
+                for n in range(hunk_lines):
+                    kind = " " if n % 4 else ("-" if n % 8 else "+")
+                    chunk.append(f"{kind}{n:06d} {body}\n")
+            text = "".join(chunk)
+            fh.write(text)
+            written += len(text)
+            count += 1
+    return count
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def _child(mode: str, path: Path) -> dict[str, Any]:
+    mod = _load_git_diff()
+    start = time.perf_counter()
+    if mode == "whole-text":
+        files = list(mod.parse_diff(path.read_text(encoding="utf-8")))
+    else:
+        with path.open("rb") as fh:
+            files = mod.index_diff(fh)
+    result: dict[str, Any] = {
+        "files": len(files),
+        "time_to_file_list_seconds": round(time.perf_counter() - start, 3),
+    }
+    if mode == "payload":
+        session = mod.DiffSession(path, files)
+        parse_seconds = payload_seconds = 0.0
+        payload_bytes = 0
+        for idx in range(len(files)):
+            t0 = time.perf_counter()
+            parsed = session.read_file(idx)
+            t1 = time.perf_counter()
+            payload_bytes += len(json.dumps(mod.file_to_payload(parsed)))
+            payload_seconds += time.perf_counter() - t1
+            parse_seconds += t1 - t0
+        session.close()
+        result.update(parse_seconds=round(parse_seconds, 3),
+                      payload_seconds=round(payload_seconds, 3),
+                      payload_bytes=payload_bytes)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run(size_mb: int, *, files: int | None = None, hunks_per_file: int,
+        hunk_lines: int, line_length: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="clud-bench-git-diff-") as tmp:
+        path = Path(tmp) / "synthetic.diff"
+        file_count = write_synthetic_diff(
+            path, target_bytes=size_mb * 2**20, files=files, hunks_per_file=hunks_per_file,
+            hunk_lines=hunk_lines, line_length=line_length,
+        )
+        report: dict[str, Any] = {
+            "diff_bytes": path.stat().st_size,
+            "files": file_count,
+            "shape": {"hunks_per_file": hunks_per_file, "hunk_lines": hunk_lines,
+                      "line_length": line_length},
+            "modes": {},
+        }
+        for mode in MODES:
+            result = RunningProcess.run(
+                [sys.executable, "-m", "bench.git_diff.harness", "--child", mode, str(path)],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"{mode} failed: {result.stderr.strip()}")
+            report["modes"][mode] = json.loads(result.stdout)
+    whole = report["modes"]["whole-text"]["peak_rss_mb"]
+    streamed = report["modes"]["streamed"]["peak_rss_mb"]
+    report["rss_ratio"] = round(whole / streamed, 1) if streamed else None
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument("--files", type=int, help="write this many files instead of --size-mb")
+    parser.add_argument("--hunks-per-file", type=int, default=8)
+    parser.add_argument("--hunk-lines", type=int, default=40)
+    parser.add_argument("--line-length", type=int, default=80)
+    parser.add_argument("--json", type=Path, help="write JSON here instead of stdout")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "DIFF"), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.child:
+        mode, path = args.child
+        print(json.dumps(_child(mode, Path(path))))
+        return 0
+    report = run(args.size_mb, files=args.files, hunks_per_file=args.hunks_per_file,
+                 hunk_lines=args.hunk_lines, line_length=args.line_length)
+    payload = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.json:
+        args.json.write_text(payload, encoding="utf-8")
+        print(args.json)
+    else:
+        print(payload, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
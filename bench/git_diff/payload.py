@@ -0,0 +1,103 @@
+"""Payload bytes and serialize time: row-per-dict vs columnar sections.
+
+Run with ``python -m bench.git_diff.payload [LEFT [RIGHT]]`` inside any git
+repository (``--repo`` to point elsewhere), or with ``--synthetic-mb N`` to
+use the harness's synthetic diff instead. It is never collected by pytest.
+
+Every file in the diff is encoded both ways and passed to `json.dumps`,
+which is what pywebview does with a `js_api` return value:
+
+* ``rows`` — `hunk_to_side_by_side`: one ``{"ln", "kind", "text"}`` dict per
+  row per side, so context text appears twice.
+* ``columnar`` — `hunk_to_columns`, what the viewer sends: a row-code string,
+  old/new line-number arrays, and each text stored once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from bench.git_diff.harness import _load_git_diff, write_synthetic_diff
+
+
+def _rows_payload(mod, file) -> dict:
+    sections = []
+    for hunk in file.hunks:
+        left, right = mod.hunk_to_side_by_side(hunk)
+        sections.append({"header": f"@@ -{hunk.old_start} +{hunk.new_start} @@",
+                         "left": left, "right": right})
+    return {"path": file.path, "sections": sections}
+
+
+def measure(mod, files: list) -> dict[str, Any]:
+    encoders = {"rows": lambda f: _rows_payload(mod, f), "columnar": mod.file_to_payload}
+    report: dict[str, Any] = {"files": len(files), "formats": {}}
+    for label, encode in encoders.items():
+        total_bytes = 0
+        encode_seconds = 0.0
+        serialize_seconds = 0.0
+        for file in files:
+            start = time.perf_counter()
+            payload = encode(file)
+            encoded = time.perf_counter()
+            total_bytes += len(json.dumps(payload).encode("utf-8"))
+            serialize_seconds += time.perf_counter() - encoded
+            encode_seconds += encoded - start
+        report["formats"][label] = {
+            "payload_bytes": total_bytes,
+            "encode_seconds": round(encode_seconds, 3),
+            "serialize_seconds": round(serialize_seconds, 3),
+        }
+    rows = report["formats"]["rows"]
+    columnar = report["formats"]["columnar"]
+    report["bytes_ratio"] = round(rows["payload_bytes"] / max(columnar["payload_bytes"], 1), 2)
+    report["serialize_speedup"] = (
+        round(rows["serialize_seconds"] / columnar["serialize_seconds"], 2)
+        if columnar["serialize_seconds"] else None
+    )
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("left", nargs="?", default="HEAD~10")
+    parser.add_argument("right", nargs="?", default="HEAD")
+    parser.add_argument("--repo", type=Path, default=Path.cwd())
+    parser.add_argument("--synthetic-mb", type=int, default=0,
+                        help="measure a synthetic diff of this size instead of git")
+    parser.add_argument("--json", type=Path, help="write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    mod = _load_git_diff()
+    with tempfile.TemporaryDirectory(prefix="clud-bench-git-diff-") as tmp:
+        spool = Path(tmp) / "diff.patch"
+        if args.synthetic_mb:
+            write_synthetic_diff(spool, target_bytes=args.synthetic_mb * 2**20)
+            source = f"synthetic {args.synthetic_mb} MB"
+            with spool.open("rb") as fh:
+                files = list(mod.parse_diff(fh))
+        else:
+            repo = args.repo.resolve()
+            source = f"{repo} {args.left}..{args.right}"
+            files = list(mod.parse_diff(mod.stream_diff(args.left, args.right, spool, repo)))
+        report = {"source": source, "diff_bytes": spool.stat().st_size, **measure(mod, files)}
+    payload = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.json:
+        args.json.write_text(payload, encoding="utf-8")
+        print(args.json)
+    else:
+        print(payload, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
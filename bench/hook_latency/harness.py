@@ -0,0 +1,318 @@
+"""Cold-start cost of the managed hook scripts, stage by stage.
+
+Run with ``python -m bench.hook_latency.harness``. It is never collected by
+pytest. Every Claude tool call fires ``hooks/block-bad-cmd.py`` (PreToolUse)
+and ``hooks/telemetry.py`` (PostToolUse); ``hooks/uv_run_hook_guard.py``
+runs at session start. Each hook is launched ``--runs`` times per layer
+with a realistic payload on stdin, each launch a fresh child process:
+
+* ``interpreter`` — ``python -c pass``.
+* ``imports`` — Python loads the hook module without running `main`.
+* ``script`` — ``python <hook>``, the hook doing its work.
+* ``uv`` — ``uv run --no-project --script <hook>``, what `clud tool run`
+  execs for a PEP 723 script. Skipped when uv is not on PATH.
+* ``clud`` — ``clud tool run hooks/<hook>``, the settings wiring itself,
+  which runs the copy installed under ``~/.clud/tools``. Skipped when clud
+  is not on PATH, or with ``--no-clud``.
+
+Layers are interleaved run by run so host noise lands on all of them. The
+report gives p50/p99 per layer and a p50 breakdown into interpreter start,
+imports, work, uv resolution and clud dispatch (see `report.py`).
+
+When ``clud-block-bad-cmd`` is on PATH, block-bad-cmd is measured twice:
+as shipped, and as ``block-bad-cmd (resident)`` with
+``CLUD_BLOCK_BAD_CMD_RESIDENT=1``, once its server is listening. The guard
+is measured twice too: a full scan with ``--no-cache``, and
+``uv_run_hook_guard (cached)``, answered from the cache the warm-up fire
+filled.
+
+Hooks run without side effects outside a temp dir: telemetry goes to the
+``bench.telemetry_ingest`` stand-in's socket, the guard's result cache is
+a file in the temp dir, and the guard scans a synthetic polyglot repo whose
+hooks are all safe, so it never sleeps.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from running_process import RunningProcess
+
+from .report import LAYERS, budget_violations, summarize_hook
+
+ROOT = Path(__file__).resolve().parents[2]
+HOOKS_DIR = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "hooks"
+DEFAULT_BUDGET = ROOT / "bench" / "hook_latency" / "budget.json"
+RESIDENT_SOCKET_DIR_ENV = "CLUD_BLOCK_BAD_CMD_SOCKET_DIR"
+GUARD_CACHE_ENV = "CLUD_UV_RUN_HOOK_GUARD_CACHE"
+
+# Loads the hook under a non-__main__ name, so its imports and module-level
+# setup run but `main` does not.
+IMPORT_ONLY = (
+    "import importlib.util, sys; "
+    "spec = importlib.util.spec_from_file_location('clud_bench_hook', sys.argv[1]); "
+    "module = sys.modules['clud_bench_hook'] = importlib.util.module_from_spec(spec); "
+    "spec.loader.exec_module(module)"
+)
+
+
+@dataclass(frozen=True)
+class Hook:
+    name: str
+    rel_path: str
+    payload: str
+    args: tuple[str, ...] = ()
+    env: tuple[tuple[str, str], ...] = ()
+
+
+def _tool_payload(event: str, workdir: Path, **fields: Any) -> str:
+    return json.dumps(
+        {
+            "session_id": "0f6c2a52-bench",
+            "transcript_path": str(workdir / "transcript.jsonl"),
+            "cwd": str(workdir),
+            "permission_mode": "default",
+            "hook_event_name": event,
+            "tool_name": "Bash",
+            **fields,
+        }
+    )
+
+
+def _polyglot_repo(root: Path) -> Path:
+    """A repo the guard qualifies and scans in full, with no offenders."""
+    (root / ".claude").mkdir(parents=True)
+    (root / ".codex").mkdir()
+    (root / "ci").mkdir()
+    (root / "Cargo.toml").write_text('[workspace]\nmembers = ["crates/*"]\n', encoding="utf-8")
+    (root / "pyproject.toml").write_text(
+        '[build-system]\nrequires = ["maturin>=1.5"]\nbuild-backend = "maturin"\n',
+        encoding="utf-8",
+    )
+    (root / "ci" / "lint.sh").write_text(
+        "#!/usr/bin/env bash\nset -euo pipefail\nuv run --no-sync ruff check .\n"
+        "uv run --frozen pytest -q tests/unit\n",
+        encoding="utf-8",
+    )
+    hooks = {
+        "hooks": {
+            "PreToolUse": [
+                {"matcher": "Bash", "hooks": [{"command": "clud-block-bad-cmd"}]},
+                {"matcher": "Edit", "hooks": [{"command": "bash ./ci/lint.sh"}]},
+            ],
+            "PostToolUse": [
+                {"matcher": "*", "hooks": [{"command": "clud tool run hooks/telemetry.py"}]},
+                {"matcher": "Write", "hooks": [{"command": "uv run --no-project fmt.py"}]},
+            ],
+        }
+    }
+    for path in (root / ".claude" / "settings.json", root / ".codex" / "hooks.json"):
+        path.write_text(json.dumps(hooks, indent=2), encoding="utf-8")
+    # The guard never caches a scan that read a file modified in the last
+    # few seconds; age the fixture so the cached entry really hits.
+    stamp = time.time() - 60
+    for path in root.rglob("*"):
+        os.utime(path, (stamp, stamp))
+    return root
+
+
+def hooks_under_test(workdir: Path) -> list[Hook]:
+    command = "cargo test --workspace --all-features -- --test-threads 8"
+    guard_payload = _tool_payload(
+        "PreToolUse",
+        workdir,
+        tool_input={"command": command, "description": "Run the test suite"},
+    )
+    # The resident server needs the native binary and unix sockets; its
+    # socket dir sits in the temp dir so the server exits with the run.
+    repo = str(_polyglot_repo(workdir / "repo"))
+    resident = []
+    if os.name != "nt" and shutil.which("clud-block-bad-cmd"):
+        resident_env = (
+            ("CLUD_BLOCK_BAD_CMD_RESIDENT", "1"),
+            (RESIDENT_SOCKET_DIR_ENV, str(workdir / "resident")),
+        )
+        resident.append(
+            Hook(
+                "block-bad-cmd (resident)",
+                "hooks/block-bad-cmd.py",
+                guard_payload,
+                env=resident_env,
+            )
+        )
+    return [
+        Hook("block-bad-cmd", "hooks/block-bad-cmd.py", guard_payload),
+        *resident,
+        Hook(
+            "telemetry",
+            "hooks/telemetry.py",
+            _tool_payload(
+                "PostToolUse",
+                workdir,
+                tool_input={"command": command, "description": "Run the test suite"},
+                tool_response={
+                    "stdout": "test result: ok. 412 passed; 0 failed\n" * 40,
+                    "stderr": "",
+                    "interrupted": False,
+                },
+            ),
+        ),
+        Hook("uv_run_hook_guard", "hooks/uv_run_hook_guard.py", "", args=("--no-cache", repo)),
+        Hook("uv_run_hook_guard (cached)", "hooks/uv_run_hook_guard.py", "", args=(repo,)),
+    ]
+
+
+def layer_argv(layer: str, hook: Hook, python: str) -> list[str] | None:
+    script = str(HOOKS_DIR / Path(hook.rel_path).name)
+    if layer == "interpreter":
+        return [python, "-c", "pass"]
+    if layer == "imports":
+        return [python, "-c", IMPORT_ONLY, script]
+    if layer == "script":
+        return [python, script, *hook.args]
+    if layer == "uv":
+        return ["uv", "run", "--no-project", "--script", script, *hook.args]
+    if layer == "clud":
+        return ["clud", "tool", "run", hook.rel_path, *hook.args]
+    return None
+
+
+def _launch(argv: list[str], payload: str, env: dict[str, str], cwd: Path) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = RunningProcess.run(
+        argv,
+        input=payload,
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=cwd,
+        check=False,
+        timeout=60,
+    )
+    return time.perf_counter() - start, result.returncode
+
+
+def _hook_env(workdir: Path, socket_path: str | None) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("CLUD_DAEMON_")}
+    env["CLUD_TELEMETRY_SPOOL_DIR"] = str(workdir / "spool")
+    env[GUARD_CACHE_ENV] = str(workdir / "uv_run_hook_guard.json")
+    env["NO_COLOR"] = "1"
+    if socket_path:
+        env["CLUD_DAEMON_TELEMETRY_SOCKET"] = socket_path
+    return env
+
+
+def available_layers(no_clud: bool) -> list[str]:
+    layers = ["interpreter", "imports", "script"]
+    if shutil.which("uv"):
+        layers.append("uv")
+    if not no_clud and shutil.which("clud"):
+        layers.append("clud")
+    return [layer for layer in LAYERS if layer in layers]
+
+
+def _wait_for_resident_server(hook: Hook) -> None:
+    """The warm-up fire starts the server; measure only once it listens."""
+    socket_dir = dict(hook.env).get(RESIDENT_SOCKET_DIR_ENV)
+    if socket_dir is None:
+        return
+    deadline = time.monotonic() + 10
+    while not list(Path(socket_dir).glob("*.sock")):
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"{hook.name}: the resident server never started")
+        time.sleep(0.05)
+
+
+def run(runs: int, layers: list[str], python: str, workdir: Path, env: dict[str, str]):
+    report: dict[str, Any] = {
+        "runs": runs,
+        "python": python,
+        "native_block_bad_cmd": shutil.which("clud-block-bad-cmd") is not None,
+        "hooks": {},
+    }
+    for hook in hooks_under_test(workdir):
+        argvs = {layer: layer_argv(layer, hook, python) for layer in layers}
+        hook_env = {**env, **dict(hook.env)}
+        # One discarded pass warms the page cache and uv's script environment.
+        for argv in argvs.values():
+            _launch(argv, hook.payload, hook_env, workdir)
+        _wait_for_resident_server(hook)
+        samples: dict[str, list[float]] = {layer: [] for layer in layers}
+        exit_codes: set[int] = set()
+        for _ in range(runs):
+            for layer, argv in argvs.items():
+                seconds, returncode = _launch(argv, hook.payload, hook_env, workdir)
+                samples[layer].append(seconds)
+                exit_codes.add(returncode)
+        report["hooks"][hook.name] = {
+            **summarize_hook(samples),
+            # A hook that crashes is timed on its crash path; surface that.
+            "exit_codes": sorted(exit_codes),
+        }
+    return report
+
+
+def _start_telemetry_standin(workdir: Path) -> tuple[RunningProcess | None, str | None]:
+    if not hasattr(os, "fork"):
+        return None, None
+    from bench.telemetry_ingest.harness import _start_standin
+
+    proc, target = _start_standin(workdir)
+    return proc, target["socket"]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=30, help="launches per hook and layer")
+    parser.add_argument("--python", default=sys.executable, help="interpreter for inner layers")
+    parser.add_argument("--no-clud", action="store_true", help="skip the clud tool run layer")
+    parser.add_argument("--json", type=Path, help="write JSON here instead of stdout")
+    parser.add_argument(
+        "--budget", action="store_true", help="compare p99s against a budget and fail on excess"
+    )
+    parser.add_argument("--budget-file", type=Path, default=DEFAULT_BUDGET)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    layers = available_layers(args.no_clud)
+    with tempfile.TemporaryDirectory(prefix="clud-hook-bench-") as tmp:
+        workdir = Path(tmp)
+        standin, socket_path = _start_telemetry_standin(workdir)
+        try:
+            env = _hook_env(workdir, socket_path)
+            report = run(args.runs, layers, args.python, workdir, env)
+        finally:
+            if standin is not None:
+                standin.kill()
+    payload = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(payload, encoding="utf-8")
+        print(args.json)
+    else:
+        print(payload, end="")
+
+    budget_enabled = args.budget or os.environ.get("CLUD_BENCH_BUDGET") == "1"
+    if not budget_enabled:
+        return 0
+    budget = json.loads(args.budget_file.read_text(encoding="utf-8"))
+    if violations := budget_violations(report, budget):
+        print("hook latency budget failed:", *violations, sep="\n  ", file=sys.stderr)
+        return 1
+    print(f"hook latency budget passed against {args.budget_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Pure report assembly and budget comparison for the hook latency harness."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+#: Launch layers, innermost first. Each one is a full child process that
+#: does everything the layer before it does, plus one more stage:
+#: ``interpreter`` starts Python, ``imports`` also loads the hook module,
+#: ``script`` also runs the hook on its payload, ``uv`` launches it through
+#: ``uv run --script`` and ``clud`` through ``clud tool run``.
+LAYERS = ("interpreter", "imports", "script", "uv", "clud")
+
+#: The stage each layer adds on top of the one before it.
+STAGES = {
+    "interpreter": "interpreter_start",
+    "imports": "imports",
+    "script": "work",
+    "uv": "uv_resolution",
+    "clud": "clud_dispatch",
+}
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize_hook(samples: Mapping[str, Sequence[float]]) -> dict[str, Any]:
+    """p50/p99 per measured layer, the per-stage breakdown and the total.
+
+    `samples` maps layer name to wall seconds per launch; layers that were
+    not measured (no uv, no clud) are simply absent. A stage's cost is the
+    difference between its layer's p50 and the previous measured layer's,
+    clamped at zero since run-to-run noise can invert small stages. The
+    total is the outermost measured layer — what one hook fire costs.
+    """
+    layers: dict[str, dict[str, float]] = {}
+    breakdown: dict[str, float] = {}
+    previous = 0.0
+    outermost = None
+    for layer in LAYERS:
+        values = samples.get(layer)
+        if not values:
+            continue
+        p50 = percentile(values, 0.5) * 1000
+        p99 = percentile(values, 0.99) * 1000
+        layers[layer] = {"p50_ms": round(p50, 2), "p99_ms": round(p99, 2)}
+        breakdown[STAGES[layer]] = round(max(0.0, p50 - previous), 2)
+        previous = p50
+        outermost = layer
+    if outermost is None:
+        raise ValueError("no layer was measured")
+    return {
+        "layers": layers,
+        "breakdown_p50_ms": breakdown,
+        "total": {"layer": outermost, **layers[outermost]},
+    }
+
+
+def budget_violations(report: Mapping[str, Any], budget: Mapping[str, Any]) -> list[str]:
+    """Return human-readable violations without doing I/O or exiting.
+
+    `budget["p99_ms"]` maps hook name to the largest acceptable p99 of one
+    fire. With `budget["layer"]` the limit holds that layer's p99, whatever
+    was measured around it (a `clud` layer on top does not count against a
+    `uv` budget); a report without that layer cannot pass. Without it, the
+    limit holds the total.
+    """
+    violations: list[str] = []
+    want_layer = budget.get("layer")
+    for hook, limit in budget["p99_ms"].items():
+        measured = report["hooks"].get(hook)
+        if measured is None:
+            violations.append(f"{hook}: not measured")
+            continue
+        total = measured["total"]
+        if want_layer:
+            layer = measured["layers"].get(want_layer)
+            if layer is None:
+                violations.append(
+                    f"{hook}: measured through {total['layer']}, budget is for {want_layer}"
+                )
+                continue
+        else:
+            layer = total
+        if layer["p99_ms"] > float(limit):
+            violations.append(f"{hook}: p99 {layer['p99_ms']:.1f} ms exceeds {float(limit):.1f} ms")
+    return violations
@@ -0,0 +1,215 @@
+"""Per-event latency and daemon CPU for the two telemetry ingest lanes.
+
+Run with ``python -m bench.telemetry_ingest.harness``. It is never collected
+by pytest. Each event is sent the way ``hooks/telemetry.py`` sends it — one
+fresh connection carrying a one-entry ``TelemetryBulkIngest`` envelope:
+
+* ``socket`` — `send_socket` on ``$CLUD_DAEMON_TELEMETRY_SOCKET``.
+* ``http`` — `post_bulk` to ``$CLUD_DAEMON_HTTP_SERVER/telemetry/bulk`` with
+  the dashboard cookie from ``$CLUD_DAEMON_HTTP_TOKEN``.
+
+Lanes alternate in rounds so neither gets a warmer daemon. Daemon CPU is the
+growth of utime + stime in ``/proc/<pid>/stat`` over each lane's events, so
+it is Linux-only and reported as null elsewhere. The pid comes from
+``--daemon-pid``, or from the socket's peer credentials.
+
+``--standin`` starts `standin.py` in a child process instead, for comparing
+the lanes' client-side and transport cost without a built clud.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from running_process import RunningProcess
+
+ROOT = Path(__file__).resolve().parents[2]
+TOOL = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "hooks" / "telemetry.py"
+LANES = ("socket", "http")
+
+
+def _load_telemetry():
+    name = "clud_bench_telemetry"
+    spec = importlib.util.spec_from_file_location(name, TOOL)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("cannot load telemetry.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cpu_seconds(pid: int | None) -> float | None:
+    """utime + stime of `pid` from /proc, or None off Linux."""
+    if pid is None:
+        return None
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text(encoding="ascii")
+    except OSError:
+        return None
+    # Fields after the parenthesised comm; utime and stime are fields 14 and 15.
+    fields = stat.rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _peer_pid(path: str) -> int | None:
+    if not path or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    except OSError:
+        return None
+    return struct.unpack("3i", creds)[0]
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _start_standin(workdir: Path) -> tuple[RunningProcess, dict[str, Any]]:
+    ready = workdir / "ready.json"
+    proc = RunningProcess(
+        [
+            sys.executable,
+            "-m",
+            "bench.telemetry_ingest.standin",
+            "--socket",
+            str(workdir / "telemetry.sock"),
+            "--token",
+            "bench",
+            "--ready",
+            str(ready),
+        ],
+        cwd=ROOT,
+        check=False,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if ready.exists():
+            try:
+                target = json.loads(ready.read_text(encoding="utf-8"))
+            except ValueError:
+                target = None
+            if target:
+                return proc, {**target, "token": "bench"}
+        if proc.poll() is not None:
+            raise RuntimeError("stand-in daemon exited before binding")
+        time.sleep(0.02)
+    proc.kill()
+    raise RuntimeError("timed out waiting for the stand-in daemon")
+
+
+def run(target: dict[str, Any], events: int, rounds: int) -> dict[str, Any]:
+    tel = _load_telemetry()
+    record = tel.build_record(
+        {"tool_name": "Bash", "tool_input": {"command": "cargo test --workspace"}}
+    )
+    line = tel.encode_record(record)
+    senders: dict[str, Callable[[], bool]] = {
+        "socket": lambda: tel.send_socket(target["socket"], [line], 0),
+        "http": lambda: tel.post_bulk(target["server"], target["token"], [line], 0),
+    }
+    pid = target.get("pid")
+    samples: dict[str, list[float]] = {lane: [] for lane in LANES}
+    cpu: dict[str, float | None] = dict.fromkeys(LANES, 0.0)
+    failures = dict.fromkeys(LANES, 0)
+    per_round = max(events // rounds, 1)
+    for _ in range(rounds):
+        for lane in LANES:
+            before = _cpu_seconds(pid)
+            for _ in range(per_round):
+                start = time.perf_counter()
+                ok = senders[lane]()
+                samples[lane].append(time.perf_counter() - start)
+                failures[lane] += not ok
+            after = _cpu_seconds(pid)
+            if before is None or after is None or cpu[lane] is None:
+                cpu[lane] = None
+            else:
+                cpu[lane] += after - before
+
+    report: dict[str, Any] = {"events_per_lane": per_round * rounds, "lanes": {}}
+    report["daemon_pid"] = pid
+    for lane in LANES:
+        values = samples[lane]
+        lane_cpu = cpu[lane]
+        report["lanes"][lane] = {
+            "failures": failures[lane],
+            "p50_us": round(statistics.median(values) * 1e6, 1),
+            "p99_us": round(_percentile(values, 0.99) * 1e6, 1),
+            "daemon_cpu_us_per_event": (
+                None if lane_cpu is None else round(lane_cpu * 1e6 / len(values), 1)
+            ),
+        }
+    socket_p50 = report["lanes"]["socket"]["p50_us"]
+    http_p50 = report["lanes"]["http"]["p50_us"]
+    report["p50_speedup"] = round(http_p50 / socket_p50, 2) if socket_p50 else None
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000, help="events per lane")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--server", default=os.environ.get("CLUD_DAEMON_HTTP_SERVER", ""))
+    parser.add_argument("--token", default=os.environ.get("CLUD_DAEMON_HTTP_TOKEN", ""))
+    parser.add_argument("--socket", default=os.environ.get("CLUD_DAEMON_TELEMETRY_SOCKET", ""))
+    parser.add_argument("--daemon-pid", type=int, help="default: the socket's peer pid")
+    parser.add_argument(
+        "--standin", action="store_true", help="measure against standin.py, not the daemon"
+    )
+    parser.add_argument("--json", type=Path, help="write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    standin = None
+    with tempfile.TemporaryDirectory(prefix="clud-tel-bench-") as workdir:
+        try:
+            if args.standin:
+                standin, target = _start_standin(Path(workdir))
+            else:
+                if not args.server or not args.socket:
+                    print(
+                        "need --server and --socket (or the CLUD_DAEMON_* env), or --standin",
+                        file=sys.stderr,
+                    )
+                    return 2
+                target = {
+                    "server": args.server,
+                    "token": args.token,
+                    "socket": args.socket,
+                    "pid": args.daemon_pid or _peer_pid(args.socket),
+                }
+            report = run(target, args.events, args.rounds)
+            report["target"] = "standin" if args.standin else "daemon"
+        finally:
+            if standin is not None:
+                standin.kill()
+    payload = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.json:
+        args.json.write_text(payload, encoding="utf-8")
+        print(args.json)
+    else:
+        print(payload, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+"""A stand-in daemon speaking both telemetry ingest lanes.
+
+Run by ``bench.telemetry_ingest.harness --standin`` so the comparison works
+without a built clud. It accepts ``POST /telemetry/bulk`` with the dashboard
+cookie, and one-line frames on a 0600 unix socket, replying as the daemon
+does. Both lanes parse the envelope; neither stores it. Once bound it writes
+``{"pid", "server", "socket"}`` to the ``--ready`` file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import os
+import socketserver
+import sys
+from pathlib import Path
+from threading import Thread
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--socket", type=Path, required=True)
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--ready", type=Path, required=True)
+    args = parser.parse_args()
+    cookie = f"clud_dashboard_token={args.token}"
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.path != "/telemetry/bulk" or self.headers.get("Cookie") != cookie:
+                reply, status = b'{"error":"forbidden"}', 403
+            else:
+                accepted = len(json.loads(body)["entries"])
+                reply, status = json.dumps({"accepted": accepted}).encode(), 200
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+
+        def log_message(self, *_args):
+            pass
+
+    class FrameHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for frame in self.rfile:
+                accepted = len(json.loads(frame)["entries"])
+                self.wfile.write(json.dumps({"accepted": accepted}).encode() + b"\n")
+
+    http_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    args.socket.unlink(missing_ok=True)
+    frame_server = socketserver.ThreadingUnixStreamServer(str(args.socket), FrameHandler)
+    os.chmod(args.socket, 0o600)
+    Thread(target=frame_server.serve_forever, daemon=True).start()
+    ready = {
+        "pid": os.getpid(),
+        "server": f"http://127.0.0.1:{http_server.server_address[1]}",
+        "socket": str(args.socket),
+    }
+    args.ready.write_text(json.dumps(ready), encoding="utf-8")
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ identical behavior (same uv venv, same module objects, no subprocess fork).
 
 Invocation:
 
-    clud tool run docker/docker-build.py <stack> <path> [subcommand]
+    clud tool run docker/docker-build.py <stack> <path> <subcommand> [args]
     clud tool run docker/docker-build.py doctor
 
 `<stack>` is one of `soldr` / `python` / `cpp`. The special first arg `doctor`
@@ -44,11 +44,13 @@ from pathlib import Path
 STACKS = ("soldr", "python", "cpp")
 
 USAGE = """\
-usage: clud tool run docker/docker-build.py <stack> <path> [subcommand]
+usage: clud tool run docker/docker-build.py <stack> <path> <subcommand> [args]
        clud tool run docker/docker-build.py doctor
 
 Stacks: soldr (Rust + soldr + zccache), python (uv-managed), cpp (CMake + ccache)
-Subcommands: init | up | run -- <cmd...> | shell | verify | clean | doctor
+Subcommands: init | up | run -- <cmd...> | shell | clean | gc [--force] [--max-total-gb N]
+             | doctor
+soldr only:  verify | snapshot | seed
 """
 
 
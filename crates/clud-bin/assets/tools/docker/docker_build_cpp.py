@@ -1,26 +1,46 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#   "running-process==4.10.1",
+# ]
 # ///
 # managed-by: clud
 """docker_build_cpp.py — CMake + ccache docker-build stack.
 
-**v0 scope: `init` only.** Same status notice as docker_build_python.py;
-other subcommands return 64 (EX_USAGE) pending follow-up.
+The volume contract from zackees/clud#416, on the same lifecycle as
+docker_build_soldr.py. Labelling, group discovery and the `gc` planner are
+the soldr stack's own (imported from it), so both stacks are swept by one
+policy and each only ever sees its own groups:
 
-The volume contract this stack will follow once fleshed out:
-
-  anon volumes:
-    <proj>-build      /build            (out-of-source CMake build dir)
-    <proj>-ccache     /ccache           (CCACHE_DIR)
-    <proj>-conan      /root/.conan2     (Conan, if used)
+  named volumes:
+    clud-docker-build-cpp-<key>-build    /build          (out-of-source CMake build dir)
+    clud-docker-build-cpp-<key>-ccache   /ccache         (CCACHE_DIR)
+    clud-docker-build-cpp-<key>-conan    /root/.conan2   (Conan, if used)
   bind:
     <repo>:/src:ro
 
 `CCACHE_BASEDIR=/src` is critical — strips the absolute-path prefix
 from ccache's content hash so the cache is reusable across `$repo`
 paths on different developer machines.
+
+Usage:
+
+    clud tool run docker/docker_build_cpp.py <path> [subcommand]
+
+Subcommands:
+    init    Write Dockerfile + entry.sh + stack.toml under <path>/.clud/docker-build/cpp/
+    up      Create volumes + image; start an idle container.
+    run -- <cmd...>
+            Execute <cmd...> in the container (/src:ro, stack.toml env), then
+            print that run's ccache hit rate and the conan cache size.
+    shell   Interactive bash in the container.
+    clean   Remove the container + volumes for this path.
+    gc [--force] [--max-total-gb N]
+            Same policy as the soldr stack's `gc`, over cpp groups only.
+    doctor  No cpp-specific checks yet; `docker-build.py doctor` runs soldr's.
+
+`verify`, `snapshot` and `seed` are soldr-only and exit 64 here.
 """
 
 from __future__ import annotations
@@ -29,6 +49,15 @@ import os
 import sys
 from pathlib import Path
 
+# The soldr stack owns labelling, discovery and gc; sibling tools are
+# imported by module name. Running a tool already puts this directory on
+# `sys.path`; a test that loads one by path does not, so add it.
+_TOOLS_DIR = str(Path(__file__).resolve().parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.append(_TOOLS_DIR)
+
+import docker_build_soldr as soldr  # noqa: E402
+
 STACK = "cpp"
 
 DOCKERFILE = r"""# managed-by: clud (docker_build_cpp.py)
@@ -47,7 +76,7 @@ ENV CCACHE_DIR=/ccache \
     CCACHE_BASEDIR=/src \
     PATH=/usr/lib/ccache:$PATH
 
-RUN mkdir -p /build /ccache /src
+RUN mkdir -p /build /ccache /root/.conan2 /src
 WORKDIR /src
 CMD ["bash", "-l"]
 """
@@ -73,11 +102,24 @@ CCACHE_DIR = "/ccache"
 CCACHE_BASEDIR = "/src"
 """
 
+#: Volume role -> mount point; mirrors `[volumes]` in STACK_TOML.
+VOLUME_MOUNTS = (
+    ("build", "/build"),
+    ("ccache", "/ccache"),
+    ("conan", "/root/.conan2"),
+)
+
 NOT_IMPLEMENTED = (
     "docker_build_cpp: {sub} is not implemented in v0 — "
     "follow-up tracked in zackees/clud#421 ('NOT IN THIS ISSUE').\n"
 )
 
+USAGE = """\
+usage: clud tool run docker/docker_build_cpp.py <path> <subcommand> [args]
+
+Subcommands: init | up | run -- <cmd...> | shell | clean | gc | doctor
+"""
+
 
 def cmd_init(path: Path) -> int:
     out = path / ".clud" / "docker-build" / STACK
@@ -94,22 +136,167 @@ def cmd_init(path: Path) -> int:
     return 0
 
 
+def cmd_up(path: Path) -> int:
+    stack_dir = path / ".clud" / "docker-build" / STACK
+    dockerfile = stack_dir / "Dockerfile"
+    if not dockerfile.is_file():
+        sys.stderr.write(f"missing {dockerfile} — run `init` first\n")
+        return 2
+
+    name = soldr._container_name(path, STACK)
+    image = soldr._image_tag(path, STACK)
+    # Reuse an existing container before rebuilding (#518): rebuilding first
+    # orphans the image the running container still pins.
+    existing = soldr._docker("ps", "-aq", "-f", f"name=^{name}$",
+                             capture=True, check=False).stdout.strip()
+    if existing:
+        soldr._docker("start", name, check=False, capture=True)
+        return 0
+
+    sys.stdout.write(f"building image {image} (cached layers reused)...\n")
+    soldr._docker("build", *soldr._label_args(path, "image", STACK),
+                  "-t", image, "-f", str(dockerfile), str(stack_dir))
+    vol_args: list[str] = []
+    for role, mount in VOLUME_MOUNTS:
+        vol_args += ["-v", f"{soldr._create_volume(path, role, STACK)}:{mount}"]
+    sys.stdout.write(f"starting container {name}...\n")
+    soldr._docker("run", "-d", "--init", "--name", name,
+                  *soldr._label_args(path, "container", STACK),
+                  "-v", f"{path.resolve()}:/src:ro",
+                  *vol_args,
+                  image, "tail", "-f", "/dev/null")
+    return 0
+
+
+#: ccache >= 4 machine-readable counters that count as a hit. Older 4.x
+#: spell them `cache_hit_*`; both are summed.
+CCACHE_HIT_KEYS = frozenset({
+    "direct_cache_hit", "preprocessed_cache_hit",
+    "cache_hit_direct", "cache_hit_preprocessed",
+})
+
+
+def parse_ccache_stats(text: str) -> tuple[int, int] | None:
+    """`(hits, misses)` from `ccache --print-stats`, or None."""
+    hits = misses = 0
+    seen = False
+    for line in text.splitlines():
+        key, _, value = line.strip().partition("\t")
+        if not value.strip().isdigit():
+            continue
+        if key in CCACHE_HIT_KEYS:
+            hits += int(value)
+            seen = True
+        elif key == "cache_miss":
+            misses += int(value)
+            seen = True
+    return (hits, misses) if seen else None
+
+
+def _ccache_stats(name: str) -> tuple[int, int] | None:
+    r = soldr._docker("exec", name, "ccache", "--print-stats",
+                      capture=True, check=False)
+    return parse_ccache_stats(r.stdout or "") if r.returncode == 0 else None
+
+
+def _conan_bytes(name: str) -> int | None:
+    r = soldr._docker("exec", name, "du", "-sb", "/root/.conan2",
+                      capture=True, check=False)
+    head = (r.stdout or "").split()
+    return int(head[0]) if r.returncode == 0 and head and head[0].isdigit() else None
+
+
+def format_cache_report(delta: dict | None, conan_bytes: int | None) -> str:
+    """One line for stderr after `run`. Pure."""
+    if delta is None:
+        ccache = "ccache: stats unavailable"
+    elif delta["hit_rate"] is None:
+        ccache = "ccache: no compiles this run"
+    else:
+        ccache = (f"ccache: {delta['hits']} hit / {delta['misses']} miss "
+                  f"({delta['hit_rate']:.0%} hit rate)")
+    conan = ("conan cache: unknown" if conan_bytes is None
+             else f"conan cache: {conan_bytes / 1e9:.2f} GB")
+    return f"[docker-build cpp] {ccache}; {conan}\n"
+
+
+def cmd_run(path: Path, cmdline: list[str]) -> int:
+    if not cmdline:
+        sys.stderr.write("run: missing command (use `run -- <cmd...>`)\n")
+        return 2
+    name = soldr._container_name(path, STACK)
+    rc = cmd_up(path)
+    if rc != 0:
+        return rc
+    env_args: list[str] = []
+    for key, value in soldr.stack_env(path, STACK, STACK_TOML).items():
+        env_args += ["-e", f"{key}={value}"]
+    before = _ccache_stats(name)
+    rc = soldr._docker("exec", "-w", "/src", *env_args, name, *cmdline,
+                       check=False).returncode
+    delta = soldr.cache_delta(before, _ccache_stats(name))
+    sys.stderr.write(format_cache_report(delta, _conan_bytes(name)))
+    return rc
+
+
+def cmd_shell(path: Path) -> int:
+    rc = cmd_up(path)
+    if rc != 0:
+        return rc
+    return soldr._docker("exec", "-it", "-w", "/src", soldr._container_name(path, STACK),
+                         "bash", "-l", check=False).returncode
+
+
+def cmd_clean(path: Path) -> int:
+    soldr._docker("rm", "-f", soldr._container_name(path, STACK), check=False)
+    for role, _mount in VOLUME_MOUNTS:
+        soldr._docker("volume", "rm", soldr._volume_name(path, role, STACK), check=False)
+    sys.stdout.write(f"removed container + {STACK} volumes for {path}\n")
+    return 0
+
+
+def cmd_gc(path: Path, rest: list[str]) -> int:
+    args = soldr.parse_gc_args(rest, prog="docker_build_cpp gc")
+    return soldr.cmd_gc(path, force=args.force, max_total_gb=args.max_total_gb,
+                        stack=STACK)
+
+
 def main(argv: list[str]) -> int:
     if not argv:
-        sys.stderr.write("usage: docker_build_cpp.py <path> <subcommand>\n")
+        sys.stderr.write(USAGE)
         return 2
 
     path_arg = argv[0]
-    sub = argv[1] if len(argv) > 1 else "verify"
+    sub = argv[1] if len(argv) > 1 else None
+    rest = argv[2:]
 
     if path_arg == "doctor":
         sys.stdout.write("doctor (cpp): no checks yet — see #421\n")
         return 0
 
+    if sub is None:
+        sys.stderr.write(USAGE)
+        return 2
+
     path = Path(path_arg).resolve()
 
     if sub == "init":
         return cmd_init(path)
+    if sub == "up":
+        return cmd_up(path)
+    if sub == "run":
+        if rest and rest[0] == "--":
+            rest = rest[1:]
+        return cmd_run(path, rest)
+    if sub == "shell":
+        return cmd_shell(path)
+    if sub == "clean":
+        return cmd_clean(path)
+    if sub == "gc":
+        return cmd_gc(path, rest)
+    if sub == "doctor":
+        sys.stdout.write("doctor (cpp): no checks yet — see #421\n")
+        return 0
 
     sys.stderr.write(NOT_IMPLEMENTED.format(sub=sub))
     return 64
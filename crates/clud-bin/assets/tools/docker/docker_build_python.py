@@ -1,29 +1,53 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#   "running-process==4.10.1",
+# ]
 # ///
 # managed-by: clud
 """docker_build_python.py — uv-managed Python docker-build stack.
 
-**v0 scope: `init` only.** The other subcommands (up / run / shell /
-verify / clean / doctor) exit 64 (EX_USAGE) with a notice; they need
-the same harness wiring as the soldr stack plus a representative uv
-project to verify against. Tracked in zackees/clud#421's
-"NOT IN THIS ISSUE" section.
+The volume contract from zackees/clud#416, on the same lifecycle as
+docker_build_soldr.py (labelling, discovery and the `gc` planner are the
+soldr stack's own, imported from it):
 
-The volume contract this stack will follow once fleshed out:
-
-  anon volumes:
-    <proj>-venv         /work/.venv      (DO NOT bind-mount — symlinks)
-    <proj>-uv-cache     /root/.cache/uv
-    <proj>-pip-cache    /root/.cache/pip
+  named volumes:
+    clud-docker-build-python-<key>-venv   /venv       (DO NOT bind-mount — symlinks)
+    clud-docker-build-uv-cache            /uv-cache   (UV_CACHE_DIR, shared)
   bind:
     <repo>:/work:ro
 
 The `.venv` symlink trap is the reason this stack exists separately
 from cpp's harness — on Windows hosts NTFS does not translate POSIX
-symlinks across the FS layer; the anon volume sidesteps that.
+symlinks across the FS layer; the venv volume sidesteps that.
+
+The uv cache is one volume for *every* python group. uv's cache is already
+content-addressed (wheels and unpacked archives are keyed by hash) and safe
+for concurrent use, so the second project that needs `numpy==2.1.0` links it
+from the cache instead of downloading and unpacking it again. The volume
+carries no project key, so per-group `gc` never removes it.
+
+Usage:
+
+    clud tool run docker/docker_build_python.py <path> [subcommand]
+
+Subcommands:
+    init    Write Dockerfile + entry.sh + stack.toml under <path>/.clud/docker-build/python/
+    up      Create volumes + image; start an idle container.
+    run -- <cmd...>
+            Execute <cmd...> in the container (/work:ro, stack.toml env), then
+            print how many packages installed this run came from the shared
+            uv cache (hits), how many were fetched (misses), and the bytes the
+            hits did not have to download and unpack.
+    shell   Interactive bash in the container.
+    clean   Remove the container + venv volume for this path (the shared
+            uv cache stays).
+    gc [--force] [--max-total-gb N]
+            Same policy as the soldr stack's `gc`, over python groups only.
+    doctor  No python-specific checks yet; `docker-build.py doctor` runs soldr's.
+
+`verify`, `snapshot` and `seed` are soldr-only and exit 64 here.
 """
 
 from __future__ import annotations
@@ -32,12 +56,23 @@ import os
 import sys
 from pathlib import Path
 
+# The soldr stack owns labelling, discovery and gc; sibling tools are
+# imported by module name. Running a tool already puts this directory on
+# `sys.path`; a test that loads one by path does not, so add it.
+_TOOLS_DIR = str(Path(__file__).resolve().parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.append(_TOOLS_DIR)
+
+import docker_build_soldr as soldr  # noqa: E402
+
 STACK = "python"
 
 DOCKERFILE = r"""# managed-by: clud (docker_build_python.py)
 # uv-first Python stack. uv installs are restartable, and the
-# in-container venv lives in an anon volume so symlinks survive
-# across runs without translating through the host FS.
+# in-container venv lives in a named volume so symlinks survive
+# across runs without translating through the host FS. The uv cache
+# is a separate volume shared by every python group; it cannot hardlink
+# across volumes, hence UV_LINK_MODE=copy.
 FROM python:3.11-slim
 
 RUN apt-get update \
@@ -46,11 +81,13 @@ RUN apt-get update \
  && rm -rf /var/lib/apt/lists/* \
  && pip install --no-cache-dir uv
 
-ENV UV_CACHE_DIR=/root/.cache/uv \
-    VIRTUAL_ENV=/work/.venv \
-    PATH=/work/.venv/bin:$PATH
+ENV UV_CACHE_DIR=/uv-cache \
+    UV_PROJECT_ENVIRONMENT=/venv \
+    UV_LINK_MODE=copy \
+    VIRTUAL_ENV=/venv \
+    PATH=/venv/bin:$PATH
 
-RUN mkdir -p /work /root/.cache/uv /root/.cache/pip
+RUN mkdir -p /work /venv /uv-cache
 WORKDIR /work
 CMD ["bash", "-l"]
 """
@@ -67,13 +104,35 @@ name = "python"
 image_tag_base = "clud-docker-build-python"
 
 [volumes]
-venv = "/work/.venv"
-uv_cache = "/root/.cache/uv"
-pip_cache = "/root/.cache/pip"
+venv = "/venv"
+uv_cache = "/uv-cache"
 
 [env]
-UV_CACHE_DIR = "/root/.cache/uv"
-VIRTUAL_ENV = "/work/.venv"
+UV_CACHE_DIR = "/uv-cache"
+UV_PROJECT_ENVIRONMENT = "/venv"
+UV_LINK_MODE = "copy"
+VIRTUAL_ENV = "/venv"
+"""
+
+#: Per-group volume role -> mount point.
+VOLUME_MOUNTS = (
+    ("venv", "/venv"),
+)
+#: The one uv cache volume every python group mounts. Its name deliberately
+#: does not parse as `clud-docker-build-python-<key>-<role>`.
+UV_CACHE_VOLUME = "clud-docker-build-uv-cache"
+UV_CACHE_MOUNT = "/uv-cache"
+
+#: Lists unpacked cache archives (`cache\t<dist-info>\t<dir>`) and the venv's
+#: installed distributions (`venv\t<dist-info>`). Run before and after each
+#: `run`; the difference says what was installed and where it came from.
+INVENTORY_SCRIPT = r"""
+import glob, os
+for d in glob.glob("/uv-cache/archive-v*/*/"):
+    for info in glob.glob(d + "*.dist-info"):
+        print("cache\t" + os.path.basename(info) + "\t" + d.rstrip("/"))
+for info in glob.glob("/venv/lib/python*/site-packages/*.dist-info"):
+    print("venv\t" + os.path.basename(info))
 """
 
 NOT_IMPLEMENTED = (
@@ -81,6 +140,12 @@ NOT_IMPLEMENTED = (
     "follow-up tracked in zackees/clud#421 ('NOT IN THIS ISSUE').\n"
 )
 
+USAGE = """\
+usage: clud tool run docker/docker_build_python.py <path> <subcommand> [args]
+
+Subcommands: init | up | run -- <cmd...> | shell | clean | gc | doctor
+"""
+
 
 def cmd_init(path: Path) -> int:
     out = path / ".clud" / "docker-build" / STACK
@@ -97,25 +162,195 @@ def cmd_init(path: Path) -> int:
     return 0
 
 
+def _ensure_uv_cache_volume() -> str:
+    """Create the shared cache volume once; labelled managed + stack, but
+    with no project key, so it belongs to no gc group."""
+    ns = soldr.LABEL_NS
+    soldr._docker("volume", "create",
+                  "--label", f"{ns}.managed=true",
+                  "--label", f"{ns}.stack={STACK}",
+                  "--label", f"{ns}.role=shared-cache",
+                  "--label", f"{ns}.cache-role=uv-cache",
+                  UV_CACHE_VOLUME, check=False, capture=True)
+    return UV_CACHE_VOLUME
+
+
+def cmd_up(path: Path) -> int:
+    stack_dir = path / ".clud" / "docker-build" / STACK
+    dockerfile = stack_dir / "Dockerfile"
+    if not dockerfile.is_file():
+        sys.stderr.write(f"missing {dockerfile} — run `init` first\n")
+        return 2
+
+    name = soldr._container_name(path, STACK)
+    image = soldr._image_tag(path, STACK)
+    # Reuse an existing container before rebuilding (#518): rebuilding first
+    # orphans the image the running container still pins.
+    existing = soldr._docker("ps", "-aq", "-f", f"name=^{name}$",
+                             capture=True, check=False).stdout.strip()
+    if existing:
+        soldr._docker("start", name, check=False, capture=True)
+        return 0
+
+    sys.stdout.write(f"building image {image} (cached layers reused)...\n")
+    soldr._docker("build", *soldr._label_args(path, "image", STACK),
+                  "-t", image, "-f", str(dockerfile), str(stack_dir))
+    vol_args: list[str] = []
+    for role, mount in VOLUME_MOUNTS:
+        vol_args += ["-v", f"{soldr._create_volume(path, role, STACK)}:{mount}"]
+    vol_args += ["-v", f"{_ensure_uv_cache_volume()}:{UV_CACHE_MOUNT}"]
+    sys.stdout.write(f"starting container {name}...\n")
+    soldr._docker("run", "-d", "--init", "--name", name,
+                  *soldr._label_args(path, "container", STACK),
+                  "-v", f"{path.resolve()}:/work:ro",
+                  *vol_args,
+                  image, "tail", "-f", "/dev/null")
+    return 0
+
+
+def parse_inventory(text: str) -> tuple[dict[str, str], set[str]]:
+    """`({dist-info: cache dir}, {venv dist-info})` from INVENTORY_SCRIPT."""
+    cache: dict[str, str] = {}
+    venv: set[str] = set()
+    for line in text.splitlines():
+        parts = line.split("\t")
+        if parts[0] == "cache" and len(parts) == 3:
+            cache.setdefault(parts[1], parts[2])
+        elif parts[0] == "venv" and len(parts) == 2:
+            venv.add(parts[1])
+    return cache, venv
+
+
+def cache_reuse(before: tuple[dict[str, str], set[str]],
+                after: tuple[dict[str, str], set[str]]) -> dict:
+    """What this run installed, split by whether the shared cache already
+    held it. Pure.
+
+    A distribution new to the venv is a *hit* when its unpacked archive was
+    in the cache before the run (uv copied it, nothing was fetched) and a
+    *miss* otherwise (downloaded or built, then cached for the next group).
+    """
+    before_cache, before_venv = before
+    _after_cache, after_venv = after
+    installed = sorted(after_venv - before_venv)
+    hits = [d for d in installed if d in before_cache]
+    return {
+        "installed": len(installed),
+        "hits": hits,
+        "misses": [d for d in installed if d not in before_cache],
+        "hit_dirs": [before_cache[d] for d in hits],
+    }
+
+
+def format_reuse_report(reuse: dict | None, bytes_saved: int | None) -> str:
+    """One line for stderr after `run`. Pure."""
+    if reuse is None:
+        return "[docker-build python] uv cache: stats unavailable\n"
+    if not reuse["installed"]:
+        return "[docker-build python] uv cache: nothing installed this run\n"
+    saved = "" if bytes_saved is None else f", {bytes_saved / 1e6:.1f} MB not re-fetched"
+    return (f"[docker-build python] uv cache: {len(reuse['hits'])} hit / "
+            f"{len(reuse['misses'])} miss of {reuse['installed']} installed{saved}\n")
+
+
+def _inventory(name: str) -> tuple[dict[str, str], set[str]] | None:
+    r = soldr._docker("exec", name, "python3", "-c", INVENTORY_SCRIPT,
+                      capture=True, check=False)
+    return parse_inventory(r.stdout or "") if r.returncode == 0 else None
+
+
+def _dirs_bytes(name: str, dirs: list[str]) -> int | None:
+    if not dirs:
+        return 0
+    r = soldr._docker("exec", name, "du", "-sbc", *dirs,
+                      capture=True, check=False)
+    lines = (r.stdout or "").strip().splitlines()
+    if r.returncode != 0 or not lines:
+        return None
+    total = lines[-1].split()[0]
+    return int(total) if total.isdigit() else None
+
+
+def cmd_run(path: Path, cmdline: list[str]) -> int:
+    if not cmdline:
+        sys.stderr.write("run: missing command (use `run -- <cmd...>`)\n")
+        return 2
+    name = soldr._container_name(path, STACK)
+    rc = cmd_up(path)
+    if rc != 0:
+        return rc
+    env_args: list[str] = []
+    for key, value in soldr.stack_env(path, STACK, STACK_TOML).items():
+        env_args += ["-e", f"{key}={value}"]
+    before = _inventory(name)
+    rc = soldr._docker("exec", "-w", "/work", *env_args, name, *cmdline,
+                       check=False).returncode
+    after = _inventory(name)
+    reuse = cache_reuse(before, after) if before is not None and after is not None else None
+    saved = _dirs_bytes(name, reuse["hit_dirs"]) if reuse is not None else None
+    sys.stderr.write(format_reuse_report(reuse, saved))
+    return rc
+
+
+def cmd_shell(path: Path) -> int:
+    rc = cmd_up(path)
+    if rc != 0:
+        return rc
+    return soldr._docker("exec", "-it", "-w", "/work", soldr._container_name(path, STACK),
+                         "bash", "-l", check=False).returncode
+
+
+def cmd_clean(path: Path) -> int:
+    soldr._docker("rm", "-f", soldr._container_name(path, STACK), check=False)
+    for role, _mount in VOLUME_MOUNTS:
+        soldr._docker("volume", "rm", soldr._volume_name(path, role, STACK), check=False)
+    sys.stdout.write(f"removed container + {STACK} venv for {path} "
+                     f"(shared {UV_CACHE_VOLUME} kept)\n")
+    return 0
+
+
+def cmd_gc(path: Path, rest: list[str]) -> int:
+    args = soldr.parse_gc_args(rest, prog="docker_build_python gc")
+    return soldr.cmd_gc(path, force=args.force, max_total_gb=args.max_total_gb,
+                        stack=STACK)
+
+
 def main(argv: list[str]) -> int:
     if not argv:
-        sys.stderr.write("usage: docker_build_python.py <path> <subcommand>\n")
+        sys.stderr.write(USAGE)
         return 2
 
     path_arg = argv[0]
-    sub = argv[1] if len(argv) > 1 else "verify"
+    sub = argv[1] if len(argv) > 1 else None
+    rest = argv[2:]
 
-    if path_arg == "doctor":
+    if path_arg == "doctor" or sub == "doctor":
         # python stack doctor is a TODO — exit 0 so the trampoline's
         # cross-stack doctor sweep does not falsely fail when no python
         # check has been authored yet.
         sys.stdout.write("doctor (python): no checks yet — see #421\n")
         return 0
 
+    if sub is None:
+        sys.stderr.write(USAGE)
+        return 2
+
     path = Path(path_arg).resolve()
 
     if sub == "init":
         return cmd_init(path)
+    if sub == "up":
+        return cmd_up(path)
+    if sub == "run":
+        if rest and rest[0] == "--":
+            rest = rest[1:]
+        return cmd_run(path, rest)
+    if sub == "shell":
+        return cmd_shell(path)
+    if sub == "clean":
+        return cmd_clean(path)
+    if sub == "gc":
+        return cmd_gc(path, rest)
 
     sys.stderr.write(NOT_IMPLEMENTED.format(sub=sub))
     return 64
@@ -0,0 +1,324 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+# managed-by: clud
+"""docker_engine_api.py — minimal Docker Engine API client over the Unix socket.
+
+Shared by `docker_recover.py` and `docker_build_soldr.py`. Every list /
+inspect / remove those tools issue through the `docker` CLI forks a Go
+binary that re-reads its config, renegotiates the API version and opens a
+fresh connection, then prints text the caller has to parse back. Talking
+HTTP/1.1 to the engine socket directly returns the same data as structured
+JSON over one kept-alive connection.
+
+Stdlib only, so it adds nothing to either tool's uv environment. Not a
+general-purpose SDK: it covers exactly the endpoints the sibling tools use.
+
+The CLI stays the fallback. `connect()` returns `None` whenever the socket
+cannot be used — Windows named pipes, a `tcp://` / `ssh://` `DOCKER_HOST`,
+a missing socket, or a socket that does not answer `/_ping` — and callers
+then take their existing CLI path unchanged.
+
+The sibling tools import it by module name from this directory; running
+it directly prints the engine version, which is a handy smoke test:
+
+    clud tool run docker/docker_engine_api.py
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+import sys
+import threading
+from collections.abc import Mapping
+from urllib.parse import quote, urlencode
+
+DEFAULT_SOCKET = "/var/run/docker.sock"
+DEFAULT_TIMEOUT_SECONDS = 20.0
+#: `/_ping` is the engine's cheapest endpoint; a short budget keeps the
+#: CLI fallback prompt when the socket exists but nothing answers.
+PING_TIMEOUT_SECONDS = 2.0
+#: Methods safe to resend when a kept-alive connection turns out stale. A
+#: reset DELETE may already have removed its object on the engine side.
+RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class EngineApiError(Exception):
+    """The engine answered with an error status, or the socket failed."""
+
+    def __init__(self, message: str, *, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def resolve_socket_path(
+    env: Mapping[str, str] | None = None, *, platform_name: str | None = None
+) -> str | None:
+    """The Unix socket the engine listens on, or None when it is not one.
+
+    Honours `DOCKER_HOST` the way the CLI does: `unix://<path>` selects that
+    socket; any other scheme (`tcp://`, `ssh://`, `npipe://`) is left to the
+    CLI. Windows has no Unix-socket engine, so it always falls back.
+    """
+    values = os.environ if env is None else env
+    if (platform_name or sys.platform) == "win32":
+        return None
+    host = (values.get("DOCKER_HOST") or "").strip()
+    if not host:
+        return DEFAULT_SOCKET
+    if host.startswith("unix://"):
+        return host[len("unix://") :] or None
+    return None
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """`HTTPConnection` that dials an AF_UNIX socket instead of TCP."""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        # The host only fills the `Host:` header; the engine ignores it.
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class EngineClient:
+    """Keep-alive HTTP client for one engine socket.
+
+    One connection per thread: `http.client` connections are not
+    thread-safe, and callers fan removals out across a worker pool.
+    A worker calls `release()` to close its own connection when its task
+    is done; `close()` closes every thread's connection.
+    """
+
+    def __init__(self, socket_path: str, *, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: set[_UnixHTTPConnection] = set()
+
+    # ---- transport -------------------------------------------------------
+    def _connection(self) -> _UnixHTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self._open.add(conn)
+        return conn
+
+    def _drop_connection(self) -> None:
+        """Discard this thread's connection (stale, or told to close)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                self._open.discard(conn)
+
+    def release(self) -> None:
+        """Close the calling thread's connection. A pool worker calls this as
+        its task ends, so the pool's sockets do not outlive the pool."""
+        self._drop_connection()
+
+    def close(self) -> None:
+        self._drop_connection()
+        with self._lock:
+            conns, self._open = self._open, set()
+        for conn in conns:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, object] | None = None,
+    ) -> tuple[int, object]:
+        """Issue one request; return `(status, decoded JSON body or None)`.
+
+        A stale kept-alive connection (the engine closed it between calls)
+        is retried once on a fresh connection, for `RETRYABLE_METHODS`
+        only. Transport failures raise `EngineApiError` with `status=None`;
+        HTTP errors are returned, not raised, so callers can attribute a
+        404/409 to the object at hand.
+        """
+        target = path
+        if query:
+            target += "?" + urlencode(
+                {k: _query_value(v) for k, v in query.items() if v is not None}
+            )
+        for attempt in (0, 1):
+            conn = self._connection()
+            try:
+                conn.request(method, target, headers={"Accept": "application/json"})
+                response = conn.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self._drop_connection()
+                if attempt == 0 and method in RETRYABLE_METHODS:
+                    continue
+                raise EngineApiError(
+                    f"{method} {path}: engine closed the connection"
+                ) from None
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_connection()
+                raise EngineApiError(f"{method} {path}: {exc}") from exc
+            if response.will_close:
+                self._drop_connection()
+            return response.status, _decode(raw)
+        raise AssertionError("unreachable")
+
+    def _get(self, path: str, query: Mapping[str, object] | None = None) -> object:
+        status, body = self.request("GET", path, query)
+        if status >= 400:
+            raise EngineApiError(f"GET {path}: {_error_message(body, status)}", status=status)
+        return body
+
+    # ---- endpoints -------------------------------------------------------
+    def ping(self) -> bool:
+        try:
+            status, _body = self.request("GET", "/_ping")
+        except EngineApiError:
+            return False
+        return status == 200
+
+    def version(self) -> dict:
+        return _as_dict(self._get("/version"))
+
+    def info(self) -> dict:
+        return _as_dict(self._get("/info"))
+
+    def images(self, *, all_images: bool = True) -> list[dict]:
+        return _as_list(self._get("/images/json", {"all": all_images}))
+
+    def containers(
+        self,
+        *,
+        all_containers: bool = True,
+        filters: Mapping[str, list[str]] | None = None,
+    ) -> list[dict]:
+        return _as_list(
+            self._get("/containers/json", {"all": all_containers, "filters": filters})
+        )
+
+    def container(self, name_or_id: str) -> dict | None:
+        """`docker container inspect` for one container; None when absent."""
+        path = f"/containers/{quote(name_or_id, safe='')}/json"
+        status, body = self.request("GET", path)
+        if status == 404:
+            return None
+        if status >= 400:
+            raise EngineApiError(f"GET {path}: {_error_message(body, status)}", status=status)
+        return _as_dict(body)
+
+    def volumes(self, *, filters: Mapping[str, list[str]] | None = None) -> list[dict]:
+        body = _as_dict(self._get("/volumes", {"filters": filters}))
+        return _as_list(body.get("Volumes"))
+
+    def system_df(self) -> dict:
+        return _as_dict(self._get("/system/df"))
+
+    def remove_image(self, image_id: str, *, force: bool = False) -> tuple[int, str]:
+        return self._delete(f"/images/{quote(image_id, safe='')}", {"force": force})
+
+    def remove_container(self, container_id: str, *, force: bool = False) -> tuple[int, str]:
+        return self._delete(
+            f"/containers/{quote(container_id, safe='')}", {"force": force}
+        )
+
+    def remove_volume(self, name: str, *, force: bool = False) -> tuple[int, str]:
+        return self._delete(f"/volumes/{quote(name, safe='')}", {"force": force})
+
+    def _delete(self, path: str, query: Mapping[str, object]) -> tuple[int, str]:
+        """`(status, message)` — a per-object outcome, never raised for 4xx."""
+        status, body = self.request("DELETE", path, query)
+        return status, "" if status < 400 else _error_message(body, status)
+
+
+def _query_value(value: object) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, Mapping):
+        return json.dumps(dict(value), separators=(",", ":"))
+    return str(value)
+
+
+def _decode(raw: bytes) -> object:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        # `/_ping` answers a bare `OK`; error bodies from old engines can be
+        # plain text. Neither is worth failing the call over.
+        return raw.decode("utf-8", errors="replace")
+
+
+def _error_message(body: object, status: int) -> str:
+    if isinstance(body, dict) and isinstance(body.get("message"), str):
+        return body["message"]
+    if isinstance(body, str) and body.strip():
+        return body.strip()
+    return f"HTTP {status}"
+
+
+def _as_list(body: object) -> list[dict]:
+    return [item for item in body if isinstance(item, dict)] if isinstance(body, list) else []
+
+
+def _as_dict(body: object) -> dict:
+    return body if isinstance(body, dict) else {}
+
+
+def connect(
+    *,
+    env: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ping_timeout: float = PING_TIMEOUT_SECONDS,
+) -> EngineClient | None:
+    """An `EngineClient` for the local socket if it answers `/_ping`, else None."""
+    path = resolve_socket_path(env)
+    if path is None or not os.path.exists(path):
+        return None
+    probe = EngineClient(path, timeout=ping_timeout)
+    try:
+        if not probe.ping():
+            return None
+    finally:
+        probe.close()
+    return EngineClient(path, timeout=timeout)
+
+
+def main() -> int:
+    client = connect()
+    if client is None:
+        sys.stderr.write("docker engine socket unavailable — the CLI fallback applies\n")
+        return 1
+    try:
+        version = client.version()
+    except EngineApiError as exc:
+        sys.stderr.write(f"docker engine API error: {exc}\n")
+        return 1
+    sys.stdout.write(
+        f"docker engine {version.get('Version', 'unknown')} "
+        f"(API {version.get('ApiVersion', 'unknown')}) via {client.socket_path}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
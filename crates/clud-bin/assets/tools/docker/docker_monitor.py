@@ -0,0 +1,46 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "running-process==4.10.1",
+# ]
+# ///
+# managed-by: clud
+"""docker_monitor.py — `docker_recover.py monitor` as its own bundled tool.
+
+`clud tool run` caps every bundled tool with its entry's `command_timeout`.
+`docker_recover.py` is capped at 10 minutes, which suits `doctor` and a
+`restart`, but the monitor fits its disk trend over an hour and holds a
+30-minute cooldown between remedies, so it must run for hours. This entry
+has no wall-clock cap and no silence watchdog (it is quiet for a whole
+`--interval` between samples); stop it with Ctrl-C, or bound it with
+`--samples`.
+
+Usage:
+
+    clud tool run docker/docker_monitor.py [--interval S] [--samples N] [--allow-restart]
+
+Every flag is `docker_recover.py monitor`'s, which this runs in-process.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Sibling tools are imported by module name. Running a tool already puts
+# this directory on `sys.path`; a test that loads one by path does not, so
+# add it.
+_TOOLS_DIR = str(Path(__file__).resolve().parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.append(_TOOLS_DIR)
+
+import docker_recover  # noqa: E402
+
+
+def main(argv: list[str]) -> int:
+    return docker_recover.main(["monitor", *argv])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
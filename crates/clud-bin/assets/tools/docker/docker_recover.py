@@ -37,7 +37,9 @@ destructive action while more than one candidate stays plausible.
 Usage:
 
     clud tool run docker/docker_recover.py doctor
-    clud tool run docker/docker_recover.py gc [--age-hours N] [--dry-run]
+    clud tool run docker/docker_recover.py gc [--age-hours N] [--free-target SIZE] [--dry-run]
+    clud tool run docker/docker_recover.py monitor --samples N [--interval S] [--allow-restart]
+    clud tool run docker/docker_monitor.py [--interval S] [--allow-restart]
     clud tool run docker/docker_recover.py restart [--yes]
     clud tool run docker/docker_recover.py reset [--yes]
     clud tool run docker/docker_recover.py disk [--action compact|prune|delete|reset] \
@@ -47,15 +49,34 @@ Subcommands:
     doctor   Read-only report: client/server availability, engine error,
              host free memory + disk, Docker runtime processes, the resolved
              Docker data-disk path/size + confidence, and recent relevant
-             logs. Mutates nothing (no restart, no disk write, no rotation).
+             logs. Probes run concurrently under one deadline and their
+             latencies are printed. Mutates nothing (no restart, no disk
+             write, no rotation).
     gc       Reclaim dangling Docker objects (unused images, stopped
              containers, anonymous unreferenced volumes) older than an age
              threshold (`trim` is an alias). Default-safe: NO confirmation
              gate — pruned objects are cheap to rebuild. Never touches
              running containers, images backing a running container, or named
              volumes. The lightest rung of the escalation ladder; more
-             aggressive on the system/boot volume. Idempotent one-shot,
-             suitable for periodic cron / Task Scheduler / `clud schedule`.
+             aggressive on the system/boot volume. Removals are parallel
+             Engine API deletes (batched `docker ... rm` calls without the
+             socket); per-class counts, freed bytes and elapsed time are
+             reported, and every object that could not be removed is listed
+             with the engine's reason. `--free-target 20GiB` instead
+             ranks every safe candidate by the bytes it would free (one
+             `system df -v`, shared layers discounted) and removes the
+             fewest that reach the target, printing that plan first.
+             Idempotent one-shot, suitable for periodic cron / Task
+             Scheduler / `clud schedule`.
+    monitor  Sample engine round-trip latency, free disk, free memory and
+             the runtime process set every --interval into a rotating JSONL
+             (~/.clud/docker-recover/monitor.jsonl). When free disk is low,
+             or its trend over the window predicts it will be within
+             --horizon-hours, run gc unattended; with --allow-restart, also
+             restart after sustained engine failure. Never reset or disk.
+             This entry's runner cap is 10 minutes, so bound it with
+             --samples here (cron-style); `docker_monitor.py` runs the same
+             loop with no cap until Ctrl-C.
     restart  Restart the normal Docker runtime via a documented clean
              sequence. Containers stop; images/volumes are preserved.
              Refused without --yes. Bounded readiness wait, then verifies.
@@ -88,13 +109,16 @@ import json
 import ntpath
 import os
 import platform
+import select
 import shutil
 import sys
 import tempfile
 import time
 import typing
-from collections.abc import Mapping
-from dataclasses import dataclass, field
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 
 from running_process import (
@@ -105,6 +129,18 @@ from running_process import (
 )
 from running_process.command_render import list2cmdline
 
+# Sibling tools are imported by module name. Running a tool already puts
+# this directory on `sys.path`; a test or bench that loads one by path
+# does not, so add it.
+_TOOLS_DIR = str(Path(__file__).resolve().parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.append(_TOOLS_DIR)
+
+try:
+    import docker_engine_api
+except ImportError:  # not installed alongside: every caller keeps the CLI path
+    docker_engine_api = None
+
 # --------------------------------------------------------------------------
 # Exit codes — the public contract callers (SKILL.md, other tooling) rely on.
 # --------------------------------------------------------------------------
@@ -123,10 +159,25 @@ READY_INTERVAL_SECONDS = 2.0
 # 20s bounded poll above (10 x 2s) reports "not ready" long before the engine
 # has had a chance. Restart/reset use this longer budget instead.
 READY_ATTEMPTS_COLD = 60
+# The budget above is `attempts x interval`, but readiness is no longer a
+# fixed-interval CLI poll: each check is a socket `/_ping`, the gap between
+# checks doubles from READY_BACKOFF_INITIAL_SECONDS up to the interval, and
+# on Linux an inotify watch on the socket's directory cuts the gap short the
+# moment the engine (re)creates its socket.
+READY_BACKOFF_INITIAL_SECONDS = 0.25
 # Issue #891: the clud tool runner aborts a child that emits nothing for
 # 120s. Any wait longer than this must print a heartbeat.
 PROGRESS_HEARTBEAT_SECONDS = 15.0
 HELLO_WORLD_TIMEOUT_SECONDS = 120.0
+# `doctor`'s probes run concurrently under ONE wall-clock budget. Serially,
+# a wedged engine cost the sum of every probe's own timeout; concurrently it
+# costs the slowest one. A little above `_run`'s 20s default so a probe that
+# times out on its own still reports *its* diagnosis rather than the
+# deadline's.
+SNAPSHOT_DEADLINE_SECONDS = 25.0
+PROBE_STATUS_OK = "ok"
+PROBE_STATUS_ERROR = "error"
+PROBE_STATUS_DEADLINE = "deadline"
 
 # Engine reachability, split three ways (issue #891). Collapsing these is what
 # made a 5xx engine report as "docker CLI could not be executed": the CLI was
@@ -167,6 +218,36 @@ LOW_MEM_BYTES = 1 * 1024**3
 # rung of the escalation ladder and is halved on the system/boot volume.
 GC_DEFAULT_AGE_HOURS = 24.0
 
+# Removal fan-out. API deletes run on this many workers; the CLI fallback
+# removes up to GC_CLI_BATCH objects per `docker ... rm` invocation, with
+# the batches themselves spread over the same bounded pool. The engine
+# serialises layer deletion internally, so more workers buy little and
+# only add lock contention on its side.
+GC_REMOVE_WORKERS = 8
+GC_CLI_BATCH = 50
+GC_CLI_BATCH_TIMEOUT_SECONDS = 120.0
+
+# `monitor` defaults. The trend is a least-squares slope of free disk over
+# the trailing window; it only predicts once the window holds enough
+# samples to outvote a single large download. A remedy is not retried
+# inside the cooldown — gc needs time to show up in free space, and a
+# restart needs time to come back.
+MONITOR_INTERVAL_SECONDS = 60.0
+MONITOR_WINDOW_SECONDS = 3600.0
+MONITOR_MIN_TREND_SAMPLES = 5
+MONITOR_HORIZON_HOURS = 6.0
+MONITOR_COOLDOWN_SECONDS = 1800.0
+MONITOR_UNHEALTHY_SAMPLES = 3
+MONITOR_LOG_MAX_BYTES = 8 * 1024**2
+MONITOR_LOG_KEEP = 3
+#: Remedies `monitor` may run unattended. `reset` and `disk` are never
+#: among them: the first stops the whole WSL VM, the second is gated.
+MONITOR_AUTO_REMEDIES = ("gc", "restart")
+# Remedies that talk to the engine, so are skipped while it is down: gc
+# against a dead engine removes nothing, and would keep restart from ever
+# being reached.
+MONITOR_NEEDS_ENGINE = ("gc",)
+
 # The canonical WSL engine-disk filename Docker Desktop writes.
 DOCKER_DATA_FILENAME = "docker_data.vhdx"
 
@@ -204,6 +285,20 @@ class HealthSnapshot:
     #: One of the ENGINE_* constants (issue #891). `None` on snapshots from
     #: before the split; treated as "unknown", never as a 5xx.
     engine_state: str | None = None
+    #: Per-probe wall time from `gather_snapshot`, in submission order.
+    probe_timings: list[ProbeTiming] = field(default_factory=list)
+
+
+@dataclass
+class ProbeTiming:
+    """How long one snapshot probe took, and whether it finished in time."""
+
+    name: str
+    seconds: float
+    #: One of the PROBE_STATUS_* constants. `deadline` means the probe was
+    #: still running when the snapshot budget ran out; its value was
+    #: replaced by the probe's safe default.
+    status: str
 
 
 @dataclass
@@ -705,6 +800,8 @@ class GcPlan:
     volumes: list[GcVolume]
     age_hours: float
     on_system_volume: bool
+    # `--free-target` only: the bytes asked for (0 = plain age-based gc).
+    target_bytes: int = 0
 
     @property
     def reclaimable_bytes(self) -> int:
@@ -714,6 +811,10 @@ class GcPlan:
             + sum(v.size_bytes for v in self.volumes)
         )
 
+    @property
+    def shortfall_bytes(self) -> int:
+        return max(0, self.target_bytes - self.reclaimable_bytes)
+
     @property
     def is_empty(self) -> bool:
         return not (self.images or self.containers or self.volumes)
@@ -776,6 +877,122 @@ def plan_gc(
     return GcPlan(images, containers, volumes, age, on_system_volume)
 
 
+@dataclass
+class GcDiskUsage:
+    """Bytes each object would actually give back, from one `system df -v`.
+
+    Images carry their *unique* size — `Size` minus the layers shared with
+    other images — because deleting one image frees only the layers nobody
+    else references. Keys are short (12-hex) ids for images and containers,
+    names for volumes.
+    """
+
+    images: dict[str, int] = field(default_factory=dict)
+    containers: dict[str, int] = field(default_factory=dict)
+    volumes: dict[str, int] = field(default_factory=dict)
+
+
+def _short_id(ref: str) -> str:
+    return ref.removeprefix("sha256:")[:12]
+
+
+def plan_gc_target(
+    inventory: GcInventory,
+    usage: GcDiskUsage,
+    *,
+    target_bytes: int,
+    now: float,
+    on_system_volume: bool,
+    base_age_hours: float = GC_DEFAULT_AGE_HOURS,
+) -> GcPlan:
+    """Pick the fewest eligible objects whose reclaimable bytes reach
+    `target_bytes`. Pure — no IO.
+
+    Eligibility is `plan_gc`'s safety rule without the age gate: never a
+    running container, an image backing one, or a named / in-use volume.
+    Objects already past the age threshold are spent first (that is what a
+    plain `gc` would remove anyway); younger ones only if the target is not
+    yet met. Within each tier the largest go first, so the set is minimal in
+    object count. Sizes in the returned plan are the projected savings from
+    `usage`; the shared-layer discount makes them a floor, since removing
+    every image that shares a layer frees that layer too. A target that the
+    eligible set cannot reach selects all of it and leaves a
+    `shortfall_bytes`.
+    """
+    age = gc_age_threshold_hours(on_system_volume, base_age_hours)
+    candidates: list[tuple[bool, int, str, object]] = []
+    for img in inventory.images:
+        size = usage.images.get(_short_id(img.id), 0)
+        if not img.in_use and size > 0:
+            young = _age_hours(now, img.created_epoch) < age
+            candidates.append((young, size, "images", replace(img, size_bytes=size)))
+    for c in inventory.containers:
+        size = usage.containers.get(_short_id(c.id), 0)
+        if not c.running and size > 0:
+            young = _age_hours(now, c.created_epoch) < age
+            candidates.append((young, size, "containers", replace(c, size_bytes=size)))
+    for v in inventory.volumes:
+        size = usage.volumes.get(v.name, 0)
+        if v.anonymous and not v.in_use and size > 0:
+            # Volumes carry no age gate in `plan_gc`, so they are never "young".
+            candidates.append((False, size, "volumes", replace(v, size_bytes=size)))
+    candidates.sort(key=lambda item: (item[0], -item[1]))
+
+    picked: dict[str, list] = {"images": [], "containers": [], "volumes": []}
+    total = 0
+    for _young, size, kind, obj in candidates:
+        if total >= target_bytes:
+            break
+        picked[kind].append(obj)
+        total += size
+    return GcPlan(
+        picked["images"],
+        picked["containers"],
+        picked["volumes"],
+        age,
+        on_system_volume,
+        target_bytes=target_bytes,
+    )
+
+
+_SIZE_UNITS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 10**3,
+    "KIB": 1024,
+    "M": 1024**2,
+    "MB": 10**6,
+    "MIB": 1024**2,
+    "G": 1024**3,
+    "GB": 10**9,
+    "GIB": 1024**3,
+    "T": 1024**4,
+    "TB": 10**12,
+    "TIB": 1024**4,
+}
+
+
+def parse_byte_size(text: str) -> int:
+    """Parse a `--free-target` value (`20GiB`, `500MB`, `1.5T`) into bytes.
+
+    Strict, unlike `_parse_docker_size`: an unknown unit is an error, not a
+    silent byte count. A bare `G`/`M`/`K` is binary, as in `df -h`.
+    """
+    s = text.strip().upper()
+    num = s.rstrip("KMGTIB ")
+    unit = s[len(num) :].strip()
+    if unit not in _SIZE_UNITS:
+        raise ValueError(f"unknown size unit in {text!r}")
+    try:
+        value = float(num)
+    except ValueError:
+        raise ValueError(f"not a size: {text!r}") from None
+    if value <= 0:
+        raise ValueError(f"size must be positive: {text!r}")
+    return int(value * _SIZE_UNITS[unit])
+
+
 def recommended_remedy(report: HealthReport, *, disk_low: bool) -> list[str]:
     """Escalation ladder, lightest rung first: GC (reclaim dangling objects)
     precedes restart/reset, which precede gated VHD/disk remediation."""
@@ -797,6 +1014,137 @@ def recommended_remedy(report: HealthReport, *, disk_low: bool) -> list[str]:
     return steps
 
 
+# ---- Monitor (trend + trigger) -------------------------------------------
+@dataclass
+class MonitorSample:
+    """One `monitor` tick: what a JSONL line records."""
+
+    ts: float
+    engine_state: str
+    api_latency_ms: float | None
+    api_via: str  # "socket" or "cli"
+    free_disk_bytes: int | None
+    free_mem_bytes: int | None
+    processes: list[str] = field(default_factory=list)
+    client_present: bool = True
+    engine_error: str | None = None
+
+    def snapshot(self) -> HealthSnapshot:
+        return HealthSnapshot(
+            client_present=self.client_present,
+            server_ok=self.engine_state == ENGINE_OK,
+            engine_error=self.engine_error,
+            free_mem_bytes=self.free_mem_bytes,
+            free_disk_bytes=self.free_disk_bytes,
+            runtime_processes=list(self.processes),
+            engine_state=self.engine_state,
+        )
+
+
+@dataclass
+class MonitorDecision:
+    remedy: str | None
+    reason: str
+    disk_rate_bytes_per_hour: float | None = None
+    hours_to_low_disk: float | None = None
+
+
+def disk_trend(
+    samples: list[MonitorSample],
+    *,
+    window_seconds: float = MONITOR_WINDOW_SECONDS,
+    min_samples: int = MONITOR_MIN_TREND_SAMPLES,
+) -> float | None:
+    """Least-squares slope of free disk in bytes/hour over the trailing
+    window, or None with too few samples to call it a trend. Negative means
+    the disk is filling."""
+    if not samples:
+        return None
+    horizon = samples[-1].ts - window_seconds
+    points = [
+        (s.ts, float(s.free_disk_bytes))
+        for s in samples
+        if s.ts >= horizon and s.free_disk_bytes is not None
+    ]
+    if len(points) < min_samples:
+        return None
+    mean_t = sum(t for t, _ in points) / len(points)
+    mean_b = sum(b for _, b in points) / len(points)
+    var = sum((t - mean_t) ** 2 for t, _ in points)
+    if var == 0:
+        return None
+    cov = sum((t - mean_t) * (b - mean_b) for t, b in points)
+    return cov / var * 3600.0
+
+
+def hours_to_low_disk(free_bytes: int | None, rate_bytes_per_hour: float | None) -> float | None:
+    """Hours until free disk crosses `LOW_DISK_BYTES` at the current rate."""
+    if free_bytes is None or rate_bytes_per_hour is None or rate_bytes_per_hour >= 0:
+        return None
+    return max(0.0, (free_bytes - LOW_DISK_BYTES) / -rate_bytes_per_hour)
+
+
+def monitor_decision(
+    history: list[MonitorSample],
+    *,
+    horizon_hours: float = MONITOR_HORIZON_HOURS,
+    window_seconds: float = MONITOR_WINDOW_SECONDS,
+    last_remedy_ts: float | None = None,
+    cooldown_seconds: float = MONITOR_COOLDOWN_SECONDS,
+    allow_restart: bool = False,
+) -> MonitorDecision:
+    """Pick the lightest `recommended_remedy` rung to run now, if any. Pure.
+
+    Disk counts as low once free space is under the advisory threshold *or*
+    the trend says it will be within `horizon_hours` — that is the point of
+    monitoring: gc before the build farm's agents start failing, not after.
+    `restart` additionally needs `allow_restart` and `MONITOR_UNHEALTHY_SAMPLES`
+    consecutive unhealthy samples, so a single slow answer never bounces the
+    daemon. Rungs in `MONITOR_NEEDS_ENGINE` are passed over while the engine
+    is down. Nothing heavier than restart is ever returned.
+    """
+    latest = history[-1]
+    rate = disk_trend(history, window_seconds=window_seconds)
+    eta = hours_to_low_disk(latest.free_disk_bytes, rate)
+    report = assess_health(latest.snapshot())
+    low_now = latest.free_disk_bytes is not None and latest.free_disk_bytes < LOW_DISK_BYTES
+    predicted = eta is not None and eta <= horizon_hours
+    steps = recommended_remedy(report, disk_low=low_now or predicted)
+
+    def decide(remedy: str | None, reason: str) -> MonitorDecision:
+        return MonitorDecision(remedy, reason, rate, eta)
+
+    if not steps:
+        return decide(None, "healthy")
+    engine_up = latest.engine_state == ENGINE_OK
+    runnable = [step for step in steps if engine_up or step not in MONITOR_NEEDS_ENGINE]
+    if not runnable:
+        return decide(None, f"{steps[0]} recommended; the engine is down")
+    lightest = runnable[0]
+    if lightest not in MONITOR_AUTO_REMEDIES:
+        return decide(None, f"{lightest} recommended; never run unattended")
+    if last_remedy_ts is not None and latest.ts - last_remedy_ts < cooldown_seconds:
+        return decide(None, f"{lightest} recommended; cooling down after the last remedy")
+    if lightest == "restart":
+        streak = 0
+        for sample in reversed(history):
+            if assess_health(sample.snapshot()).healthy:
+                break
+            streak += 1
+        if streak < MONITOR_UNHEALTHY_SAMPLES:
+            return decide(None, f"engine unhealthy for {streak} sample(s); waiting")
+        if not allow_restart:
+            return decide(None, "restart recommended; pass --allow-restart to run it")
+        return decide("restart", f"engine unhealthy for {streak} samples ({report.category})")
+    if low_now:
+        return decide("gc", f"free disk below {_human_bytes(LOW_DISK_BYTES)}")
+    return decide(
+        "gc",
+        f"free disk falling {_human_bytes(int(-(rate or 0)))}/h; "
+        f"low in ~{eta:.1f}h (horizon {horizon_hours:g}h)",
+    )
+
+
 # ---- Recovery plans (pure, testable text) --------------------------------
 def windows_disk_unlock_steps(path: str) -> list[str]:
     """The step the old plan was missing (issue #891, highest-value gap).
@@ -1191,47 +1539,263 @@ def wsl_docker_distro_state(listing: str | None) -> str | None:
     return None
 
 
-def gather_snapshot() -> HealthSnapshot:
+def run_probes(
+    probes: Mapping[str, Callable[[], object]],
+    *,
+    defaults: Mapping[str, object] | None = None,
+    deadline: float = SNAPSHOT_DEADLINE_SECONDS,
+    clock=time.monotonic,
+) -> tuple[dict[str, object], list[ProbeTiming]]:
+    """Run independent probes concurrently under one overall deadline.
+
+    Returns `(results, timings)`. A probe that raises, or is still running
+    when `deadline` expires, yields its entry from `defaults` (else `None`)
+    — the same degrade-to-a-safe-default contract every IO probe already
+    follows. A straggler is abandoned, not joined: its own `_run` timeout
+    bounds the thread, and the report no longer waits for it.
+    """
+    fallback = dict(defaults or {})
+    finished: dict[str, tuple[float, str]] = {}
+
+    def timed(name: str, probe: Callable[[], object]) -> object:
+        start = clock()
+        try:
+            value = probe()
+        except Exception:
+            finished[name] = (clock() - start, PROBE_STATUS_ERROR)
+            raise
+        finished[name] = (clock() - start, PROBE_STATUS_OK)
+        return value
+
+    results: dict[str, object] = {}
+    timings: list[ProbeTiming] = []
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, len(probes)), thread_name_prefix="docker-probe"
+    )
+    try:
+        futures = {
+            name: executor.submit(timed, name, probe) for name, probe in probes.items()
+        }
+        wait_futures(futures.values(), timeout=deadline)
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = fallback.get(name)
+                timings.append(ProbeTiming(name, deadline, PROBE_STATUS_DEADLINE))
+                continue
+            seconds, status = finished.get(name, (0.0, PROBE_STATUS_ERROR))
+            results[name] = (
+                fallback.get(name) if future.exception() is not None else future.result()
+            )
+            timings.append(ProbeTiming(name, seconds, status))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results, timings
+
+
+def _probe_engine_if_present(client: bool) -> tuple[str, str | None]:
+    return probe_engine() if client else (ENGINE_CLI_MISSING, "no docker CLI")
+
+
+def gather_snapshot(*, deadline: float = SNAPSHOT_DEADLINE_SECONDS) -> HealthSnapshot:
+    """Collect a `HealthSnapshot` with every independent probe in parallel.
+
+    `docker_cli_present` is a PATH lookup and runs first; the rest share one
+    `deadline`, so a hung engine is diagnosed in a single timeout instead of
+    the sum of several. The engine is probed once: `probe_engine` runs the
+    same `docker version` call `docker_server_version` would, and keeps the
+    *state* (issue #891) so `classify_failure` can tell "server answered
+    5xx" from "server absent".
+    """
     client = docker_cli_present()
-    server = docker_server_version() if client else None
-    processes = list_docker_processes()
-    listing = wsl_list_verbose() if platform.system() == "Windows" else None
-    # Issue #891: probe once and keep the *state*, not just the message, so
-    # `classify_failure` can tell "server answered 5xx" from "server absent".
-    if server is not None:
-        engine_state, engine_error = ENGINE_OK, None
-    elif client:
-        engine_state, engine_error = probe_engine()
-    else:
-        engine_state, engine_error = ENGINE_CLI_MISSING, "no docker CLI"
+    probes: dict[str, Callable[[], object]] = {
+        "engine": lambda: _probe_engine_if_present(client),
+        "processes": list_docker_processes,
+        "free-memory": host_free_memory,
+        "free-disk": host_free_disk,
+    }
+    if platform.system() == "Windows":
+        probes["wsl-list"] = wsl_list_verbose
+    results, timings = run_probes(
+        probes,
+        defaults={
+            "engine": (
+                ENGINE_TIMEOUT,
+                f"engine probe did not finish within the {deadline:g}s snapshot "
+                "deadline (still starting, or wedged — re-run `doctor` to "
+                "distinguish)",
+            ),
+            "processes": [],
+        },
+        deadline=deadline,
+    )
+    engine_state, engine_error = results["engine"]
+    processes = results["processes"]
     return HealthSnapshot(
         client_present=client,
-        server_ok=server is not None,
+        server_ok=engine_state == ENGINE_OK,
         engine_state=engine_state,
         engine_error=engine_error,
-        free_mem_bytes=host_free_memory(),
-        free_disk_bytes=host_free_disk(),
+        free_mem_bytes=results["free-memory"],
+        free_disk_bytes=results["free-disk"],
         runtime_processes=processes,
         build_child_present=("com.docker.build" in processes) if processes else None,
-        wsl_docker_distro_state=wsl_docker_distro_state(listing),
+        wsl_docker_distro_state=wsl_docker_distro_state(results.get("wsl-list")),
+        probe_timings=timings,
     )
 
 
+class _SocketDirWatcher:
+    """inotify on the engine socket's directory (Linux only).
+
+    `wait(timeout)` blocks until an entry named like the socket is created,
+    moved in or re-attributed, or the timeout passes; it returns True on such
+    an event. Construction raises OSError wherever inotify is unavailable,
+    and the caller then falls back to plain sleeps.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _EVENT_HEADER = 16  # int wd; uint32 mask, cookie, len
+
+    def __init__(self, socket_path: str) -> None:
+        if platform.system() != "Linux":
+            raise OSError("inotify is Linux-only")
+        directory, self.name = os.path.split(socket_path)
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            init1, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError) as exc:
+            raise OSError(f"inotify unavailable: {exc}") from exc
+        fd = init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_CREATE | self.IN_MOVED_TO | self.IN_ATTRIB
+        if add_watch(fd, os.fsencode(directory or "."), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch({directory}) failed")
+        self.fd = fd
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _w, _x = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return False
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            if self.name in self._names(data):
+                return True
+
+    def _names(self, data: bytes) -> set[str]:
+        names: set[str] = set()
+        offset = 0
+        while offset + self._EVENT_HEADER <= len(data):
+            length = int.from_bytes(data[offset + 12 : offset + 16], sys.byteorder)
+            raw = data[offset + self._EVENT_HEADER : offset + self._EVENT_HEADER + length]
+            names.add(raw.split(b"\0", 1)[0].decode("utf-8", errors="replace"))
+            offset += self._EVENT_HEADER + length
+        return names
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+def _docker_context_selected(env: Mapping[str, str] | None = None) -> bool:
+    """True when a docker context other than `default` picks the engine.
+
+    `DOCKER_HOST` wins over any context. Otherwise `DOCKER_CONTEXT`, then
+    `currentContext` in the CLI config, names it; Docker Desktop for Linux
+    and rootless setups select theirs this way, and the engine is then not
+    on the default socket.
+    """
+    values = os.environ if env is None else env
+    if (values.get("DOCKER_HOST") or "").strip():
+        return False
+    name = (values.get("DOCKER_CONTEXT") or "").strip()
+    if not name:
+        config_dir = values.get("DOCKER_CONFIG") or os.path.join(
+            os.path.expanduser("~"), ".docker"
+        )
+        try:
+            with open(os.path.join(config_dir, "config.json"), encoding="utf-8") as fh:
+                name = str(json.load(fh).get("currentContext") or "")
+        except (OSError, ValueError, AttributeError):
+            name = ""
+    return bool(name) and name != "default"
+
+
+def _engine_readiness() -> tuple[Callable[[], bool], _SocketDirWatcher | None]:
+    """The cheapest readiness check this host allows, plus a socket watcher.
+
+    Which one is decided once, up front. When the engine is a local Unix
+    socket the check is a `/_ping` over it — no process spawn, whether or
+    not the socket exists yet — and its directory is watched (inotify) so
+    the wait ends the moment the engine creates it. Only a host whose
+    engine is not a local socket polls the `docker version` CLI: Windows
+    named pipes, a remote `DOCKER_HOST`, or an engine picked by a docker
+    context.
+    """
+    api = docker_engine_api
+    socket_path = api.resolve_socket_path() if api is not None else None
+    if socket_path is None or _docker_context_selected():
+
+        def cli_ready() -> bool:
+            return docker_server_version() is not None
+
+        return cli_ready, None
+
+    client = api.EngineClient(socket_path, timeout=api.PING_TIMEOUT_SECONDS)
+
+    def ready() -> bool:
+        # A fresh connection per attempt: the engine may be restarting.
+        try:
+            return client.ping()
+        finally:
+            client.release()
+
+    try:
+        watcher = _SocketDirWatcher(socket_path)
+    except OSError:  # not Linux, or the socket's directory does not exist
+        watcher = None
+    return ready, watcher
+
+
 def wait_for_docker(
-    check=docker_server_version,
+    check=None,
     *,
     attempts: int = READY_ATTEMPTS,
     interval: float = READY_INTERVAL_SECONDS,
     sleep=time.sleep,
     out=None,
+    clock=time.monotonic,
 ) -> bool:
-    """Bounded readiness poll. Returns True once `check()` is truthy.
-
-    Issue #891: callers recovering from a *cold* start pass
-    `READY_ATTEMPTS_COLD`, because Docker Desktop routinely needs 60-120s
-    while the default 10 x 2s budget declares failure at 20s. Every attempt
-    prints, so the poll keeps the clud tool runner's progress heartbeat alive
-    instead of being killed at 120s with exit 124.
+    """Bounded readiness wait. Returns True once `check()` is truthy.
+
+    The budget is `attempts x interval`, as before. Issue #891: callers
+    recovering from a *cold* start pass `READY_ATTEMPTS_COLD`, because Docker
+    Desktop routinely needs 60-120s while the default 10 x 2s budget declares
+    failure at 20s.
+
+    Without an explicit `check`, readiness is a socket `/_ping` (see
+    `_engine_readiness`) instead of a `docker version` spawn per attempt.
+    Gaps between checks back off exponentially from
+    READY_BACKOFF_INITIAL_SECONDS, capped at `interval` and at what is left
+    of the budget. On Linux an inotify wake on the socket's directory ends a
+    gap early and resets the backoff. Every attempt prints, so the poll keeps
+    the clud tool runner's progress heartbeat alive instead of being killed
+    at 120s with exit 124. The ready line reports time-to-ready.
     """
     sink = out or sys.stderr
     write = sink.write
@@ -1239,19 +1803,49 @@ def wait_for_docker(
     # under a pipe, and buffered progress is invisible progress as far as the
     # runner's watchdog is concerned.
     flush = getattr(sink, "flush", lambda: None)
+    watcher = None
+    if check is None:
+        check, watcher = _engine_readiness()
     budget = attempts * interval
-    write(f"  waiting for the engine (up to {budget:g}s, {attempts} attempts)\n")
+    how = "socket watch + backoff" if watcher is not None else "backoff"
+    write(f"  waiting for the engine (up to {budget:g}s, {how})\n")
     flush()
-    for i in range(attempts):
-        if check():
-            write(f"  engine ready after {i + 1} attempt(s)\n")
+    started = clock()
+    # Injected sleeps do not advance the clock; count them so a test's fake
+    # sleep still exhausts the budget.
+    slept = 0.0
+    delay = READY_BACKOFF_INITIAL_SECONDS
+    attempt = 0
+    try:
+        while True:
+            attempt += 1
+            if check():
+                ready_in = max(clock() - started, slept)
+                write(f"  engine ready after {attempt} attempt(s) in {ready_in:.2f}s\n")
+                flush()
+                return True
+            elapsed = max(clock() - started, slept)
+            write(
+                f"  readiness attempt {attempt} ({elapsed:.1f}s/{budget:g}s): "
+                "engine not ready\n"
+            )
             flush()
-            return True
-        write(f"  readiness attempt {i + 1}/{attempts}: engine not ready\n")
-        flush()
-        if i < attempts - 1:
-            sleep(interval)
-    return False
+            remaining = budget - elapsed
+            # `attempts` stays a floor on the number of checks, so a zero
+            # interval still means "try N times".
+            if remaining <= 0 and attempt >= attempts:
+                return False
+            pause = max(0.0, min(delay, interval, remaining))
+            if watcher is not None and watcher.wait(pause):
+                delay = READY_BACKOFF_INITIAL_SECONDS
+                continue
+            if watcher is None:
+                sleep(pause)
+                slept += pause
+            delay *= 2
+    finally:
+        if watcher is not None:
+            watcher.close()
 
 
 def verify_recovery(out=None) -> tuple[bool, list[str]]:
@@ -1267,12 +1861,34 @@ def verify_recovery(out=None) -> tuple[bool, list[str]]:
 
 
 # ---- Garbage-collection IO -----------------------------------------------
+GC_CLASSES = ("containers", "images", "volumes")
+
+
+@dataclass
+class GcFailure:
+    kind: str  # one of GC_CLASSES
+    ref: str  # image/container id or volume name
+    message: str
+
+
+@dataclass
+class GcClassStats:
+    removed: int = 0
+    failed: int = 0
+    freed_bytes: int = 0
+    seconds: float = 0.0
+
+
 @dataclass
 class GcResult:
     images_removed: int = 0
     containers_removed: int = 0
     volumes_removed: int = 0
     freed_bytes: int = 0
+    by_class: dict[str, GcClassStats] = field(
+        default_factory=lambda: {kind: GcClassStats() for kind in GC_CLASSES}
+    )
+    failures: list[GcFailure] = field(default_factory=list)
 
 
 def _parse_docker_size(text: str) -> int:
@@ -1418,7 +2034,66 @@ def _list_volumes() -> list[GcVolume]:
     return out
 
 
-def gather_gc_inventory() -> GcInventory:
+def engine_client():
+    """A connected Engine API client, or None to use the `docker` CLI."""
+    return docker_engine_api.connect() if docker_engine_api is not None else None
+
+
+def _api_gc_inventory(client) -> GcInventory:
+    """Inventory straight from the Engine API: five JSON calls, no text parsing.
+
+    Same selection semantics as the CLI listing below — `in_use` is "backs a
+    running container", `anonymous` honours the anonymous-volume label or a
+    64-hex name, `in_use` for volumes is "not dangling".
+    """
+    running = client.containers(all_containers=False)
+    running_refs = {c.get("ImageID") for c in running} | {c.get("Image") for c in running}
+    running_refs.discard(None)
+    images: list[GcImage] = []
+    for item in client.images(all_images=True):
+        tags = [t for t in (item.get("RepoTags") or []) if t != "<none>:<none>"]
+        iid = str(item.get("Id", ""))
+        images.append(
+            GcImage(
+                id=iid,
+                tags=tags,
+                created_epoch=float(item.get("Created") or time.time()),
+                size_bytes=int(item.get("Size") or 0),
+                in_use=iid in running_refs or any(t in running_refs for t in tags),
+            )
+        )
+    containers = [
+        GcContainer(
+            id=str(item.get("Id", "")),
+            running=str(item.get("State", "")).lower() == "running",
+            created_epoch=float(item.get("Created") or time.time()),
+        )
+        for item in client.containers(all_containers=True)
+    ]
+    dangling = {
+        v.get("Name") for v in client.volumes(filters={"dangling": ["true"]})
+    }
+    volumes: list[GcVolume] = []
+    for item in client.volumes():
+        name = str(item.get("Name") or "")
+        if not name:
+            continue
+        labels = item.get("Labels") or {}
+        anon = "com.docker.volume.anonymous" in labels or _looks_anonymous(name)
+        volumes.append(GcVolume(name=name, anonymous=anon, in_use=name not in dangling))
+    return GcInventory(images=images, containers=containers, volumes=volumes)
+
+
+def gather_gc_inventory(client=None) -> GcInventory:
+    """Engine API first (one connection, structured JSON); CLI as fallback."""
+    client = client if client is not None else engine_client()
+    if client is not None:
+        try:
+            return _api_gc_inventory(client)
+        except docker_engine_api.EngineApiError:
+            pass  # fall through to the CLI listing below
+        finally:
+            client.close()
     return GcInventory(
         images=_list_images(),
         containers=_list_containers(),
@@ -1426,6 +2101,78 @@ def gather_gc_inventory() -> GcInventory:
     )
 
 
+def _usage_int(value: object) -> int:
+    """A `system df` size: bytes from the API, human text from the CLI."""
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, int | float):
+        return max(0, int(value))
+    if isinstance(value, str):
+        return _parse_docker_size(value)
+    return 0
+
+
+def parse_system_df(payload: dict) -> GcDiskUsage:
+    """Fold a `system df -v` payload into per-object reclaimable bytes. Pure.
+
+    Accepts both shapes: the Engine API's `/system/df` (`Id`, byte ints,
+    `SizeRw`, `UsageData.Size`) and the CLI's `docker system df -v --format
+    '{{json .}}'` (`ID`, human-readable strings, `UniqueSize`). `SharedSize`
+    of -1 means "not computed" and is treated as nothing shared.
+    """
+    usage = GcDiskUsage()
+    for item in payload.get("Images") or []:
+        if not isinstance(item, dict):
+            continue
+        ref = str(item.get("Id") or item.get("ID") or "")
+        if not ref:
+            continue
+        if "UniqueSize" in item:
+            unique = _usage_int(item["UniqueSize"])
+        else:
+            shared = _usage_int(item.get("SharedSize"))
+            unique = max(0, _usage_int(item.get("Size")) - shared)
+        usage.images[_short_id(ref)] = unique
+    for item in payload.get("Containers") or []:
+        if not isinstance(item, dict):
+            continue
+        ref = str(item.get("Id") or item.get("ID") or "")
+        if ref:
+            size = item["SizeRw"] if "SizeRw" in item else item.get("Size")
+            usage.containers[_short_id(ref)] = _usage_int(size)
+    for item in payload.get("Volumes") or []:
+        if not isinstance(item, dict) or not item.get("Name"):
+            continue
+        data = item.get("UsageData")
+        size = data.get("Size") if isinstance(data, dict) else item.get("Size")
+        usage.volumes[str(item["Name"])] = _usage_int(size)
+    return usage
+
+
+def gather_disk_usage(client=None) -> GcDiskUsage:
+    """One `system df -v` pass — API first, CLI fallback, empty on failure.
+
+    Expensive on the engine side (it walks every layer and volume), which is
+    why `--free-target` takes it exactly once rather than per object.
+    """
+    client = client if client is not None else engine_client()
+    if client is not None:
+        try:
+            return parse_system_df(client.system_df())
+        except docker_engine_api.EngineApiError:
+            pass
+        finally:
+            client.close()
+    r = _run(["docker", "system", "df", "-v", "--format", "{{json .}}"], timeout=120.0)
+    if r is None or r.returncode != 0:
+        return GcDiskUsage()
+    try:
+        payload = json.loads(r.stdout)
+    except ValueError:
+        return GcDiskUsage()
+    return parse_system_df(payload) if isinstance(payload, dict) else GcDiskUsage()
+
+
 def _data_disk_on_system_volume() -> bool:
     if platform.system() == "Windows":
         resolution = _windows_resolution()
@@ -1434,29 +2181,276 @@ def _data_disk_on_system_volume() -> bool:
     return True  # macOS/Linux data-root typically lives on the system volume
 
 
-def execute_gc(plan: GcPlan) -> GcResult:
+# One removal target: `(ref, size_bytes)`; outcome: `(ref, error or None)`.
+_GcTarget = tuple[str, int]
+_GcOutcome = tuple[str, str | None]
+
+_CLI_RM = {
+    "containers": ["docker", "rm"],
+    "images": ["docker", "image", "rm"],
+    "volumes": ["docker", "volume", "rm"],
+}
+
+
+def _api_remove(client, kind: str, ref: str) -> _GcOutcome:
+    remove = {
+        "containers": client.remove_container,
+        "images": client.remove_image,
+        "volumes": client.remove_volume,
+    }[kind]
+    try:
+        status, message = remove(ref)
+    except docker_engine_api.EngineApiError as exc:
+        return ref, str(exc)
+    return ref, None if status < 400 else message
+
+
+def _short_refs(ref: str) -> tuple[str, ...]:
+    """The spellings the CLI may use for `ref` in an error line."""
+    bare = ref.removeprefix("sha256:")
+    return (ref, bare, bare[:12]) if bare != ref or len(bare) == 64 else (ref,)
+
+
+def attribute_cli_batch(refs: list[str], returncode: int, stderr: str) -> list[_GcOutcome]:
+    """Map one batched `docker ... rm a b c` back to per-object outcomes. Pure.
+
+    The CLI keeps going past a failing ID, prints one `Error ...` line per
+    failure naming that object (images by their 12-hex short id), and exits
+    non-zero if any failed. An object no error line mentions was removed. A
+    non-zero exit whose errors name none of the batch is charged to every
+    object, so a failure is never silently counted as freed space.
+    """
+    if returncode == 0:
+        return [(ref, None) for ref in refs]
+    lines = [line.strip() for line in stderr.splitlines() if line.strip()]
+    outcomes: list[_GcOutcome] = []
+    for ref in refs:
+        spellings = _short_refs(ref)
+        hit = next((line for line in lines if any(s in line for s in spellings)), None)
+        outcomes.append((ref, hit))
+    if all(error is None for _ref, error in outcomes):
+        reason = lines[-1] if lines else f"exit code {returncode}"
+        return [(ref, reason) for ref in refs]
+    return outcomes
+
+
+def _cli_remove_batch(kind: str, refs: list[str]) -> list[_GcOutcome]:
+    r = _run([*_CLI_RM[kind], *refs], timeout=GC_CLI_BATCH_TIMEOUT_SECONDS)
+    if r is None:
+        return [(ref, "docker CLI failed or timed out") for ref in refs]
+    return attribute_cli_batch(refs, r.returncode, r.stderr or "")
+
+
+def _remove_class(client, kind: str, targets: list[_GcTarget]) -> list[_GcOutcome]:
+    """Remove one object class on a bounded pool; outcomes in input order."""
+    if not targets:
+        return []
+    refs = [ref for ref, _size in targets]
+    if client is not None:
+        jobs = [[ref] for ref in refs]
+
+        def work(job: list[str]) -> list[_GcOutcome]:
+            # Each worker thread has its own connection; close it here, since
+            # the caller's `client.close()` may be far off (monitor's client
+            # lives as long as the monitor).
+            try:
+                return [_api_remove(client, kind, job[0])]
+            finally:
+                client.release()
+
+    else:
+        jobs = [refs[i : i + GC_CLI_BATCH] for i in range(0, len(refs), GC_CLI_BATCH)]
+
+        def work(job: list[str]) -> list[_GcOutcome]:
+            return _cli_remove_batch(kind, job)
+
+    workers = max(1, min(GC_REMOVE_WORKERS, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"gc-{kind}") as pool:
+        return [outcome for batch in pool.map(work, jobs) for outcome in batch]
+
+
+def execute_gc(plan: GcPlan, *, client=None, clock=time.monotonic) -> GcResult:
     """Remove the planned dangling objects. Never touches named volumes,
     running containers, or images backing a running container — the plan
-    already excludes those."""
+    already excludes those.
+
+    Containers go first: a stopped container pins its image and anonymous
+    volumes, so removing it first lets those deletes succeed in the same run.
+    Within a class, removals fan out (parallel API deletes, or batched CLI
+    calls without the socket); every object that could not be removed is
+    recorded in `failures` with the engine's reason, and only removed objects
+    count toward `freed_bytes`.
+    """
     result = GcResult()
-    for img in plan.images:
-        r = _run(["docker", "image", "rm", img.id])
-        if r is not None and r.returncode == 0:
-            result.images_removed += 1
-            result.freed_bytes += img.size_bytes
-    for c in plan.containers:
-        r = _run(["docker", "rm", c.id])
-        if r is not None and r.returncode == 0:
-            result.containers_removed += 1
-            result.freed_bytes += c.size_bytes
-    for v in plan.volumes:
-        r = _run(["docker", "volume", "rm", v.name])
-        if r is not None and r.returncode == 0:
-            result.volumes_removed += 1
-            result.freed_bytes += v.size_bytes
+    owned = client is None and not plan.is_empty
+    if owned:
+        client = engine_client()
+    targets: dict[str, list[_GcTarget]] = {
+        "containers": [(c.id, c.size_bytes) for c in plan.containers],
+        "images": [(i.id, i.size_bytes) for i in plan.images],
+        "volumes": [(v.name, v.size_bytes) for v in plan.volumes],
+    }
+    try:
+        for kind in GC_CLASSES:
+            sizes = dict(targets[kind])
+            stats = result.by_class[kind]
+            started = clock()
+            for ref, error in _remove_class(client, kind, targets[kind]):
+                if error is None:
+                    stats.removed += 1
+                    stats.freed_bytes += sizes.get(ref, 0)
+                else:
+                    stats.failed += 1
+                    result.failures.append(GcFailure(kind, ref, error))
+            stats.seconds = clock() - started
+    finally:
+        if owned and client is not None:
+            client.close()
+    result.containers_removed = result.by_class["containers"].removed
+    result.images_removed = result.by_class["images"].removed
+    result.volumes_removed = result.by_class["volumes"].removed
+    result.freed_bytes = sum(stats.freed_bytes for stats in result.by_class.values())
     return result
 
 
+# ---- Monitor IO ------------------------------------------------------------
+def _ping_engine(client) -> tuple[str, str | None, str]:
+    """`(ENGINE_* state, message, via)` from one cheap engine round trip.
+
+    Over the socket that is `GET /_ping`; without one it falls back to
+    `probe_engine`'s `docker version`, which is slower but classifies the
+    same way.
+    """
+    if client is None:
+        state, message = probe_engine()
+        return state, message, "cli"
+    try:
+        status, body = client.request("GET", "/_ping")
+    except docker_engine_api.EngineApiError as exc:
+        return ENGINE_UNREACHABLE, str(exc), "socket"
+    if status >= 500:
+        return ENGINE_SERVER_ERROR, f"/_ping answered HTTP {status}: {body}", "socket"
+    if status != 200:
+        return ENGINE_UNREACHABLE, f"/_ping answered HTTP {status}", "socket"
+    return ENGINE_OK, None, "socket"
+
+
+def take_monitor_sample(
+    client, *, disk_path: str | None = None, deadline: float = SNAPSHOT_DEADLINE_SECONDS
+) -> MonitorSample:
+    """One tick: engine round trip timed, host probes in parallel."""
+
+    def timed_ping() -> tuple[str, str | None, str, float]:
+        started = time.perf_counter()
+        state, message, via = _ping_engine(client)
+        return state, message, via, (time.perf_counter() - started) * 1000.0
+
+    results, _timings = run_probes(
+        {
+            "engine": timed_ping,
+            "processes": list_docker_processes,
+            "free-memory": host_free_memory,
+            "free-disk": lambda: host_free_disk(disk_path),
+        },
+        defaults={
+            "engine": (ENGINE_TIMEOUT, f"no engine answer within {deadline:g}s", "", None),
+            "processes": [],
+        },
+        deadline=deadline,
+    )
+    state, message, via, latency = results["engine"]
+    return MonitorSample(
+        ts=time.time(),
+        engine_state=state,
+        api_latency_ms=None if latency is None else round(latency, 3),
+        api_via=via or ("socket" if client is not None else "cli"),
+        free_disk_bytes=results["free-disk"],
+        free_mem_bytes=results["free-memory"],
+        processes=results["processes"],
+        client_present=client is not None or docker_cli_present(),
+        engine_error=message,
+    )
+
+
+def docker_root_dir(client) -> str | None:
+    """The engine's data root (`docker info` DockerRootDir), or None."""
+    if client is not None:
+        try:
+            root = client.info().get("DockerRootDir")
+        except docker_engine_api.EngineApiError:
+            root = None
+        if root:
+            return str(root)
+    r = _run(["docker", "info", "--format", "{{.DockerRootDir}}"])
+    if r is None or r.returncode != 0:
+        return None
+    return (r.stdout or "").strip() or None
+
+
+def monitor_disk_path(client) -> str | None:
+    """The filesystem `monitor` watches by default: the one Docker fills.
+
+    None (the current directory) when the data root is not a host path —
+    with Docker Desktop it lives inside the VM.
+    """
+    root = docker_root_dir(client)
+    return root if root and os.path.isdir(root) else None
+
+
+def _monitor_log_path() -> Path:
+    return Path.home() / ".clud" / "docker-recover" / "monitor.jsonl"
+
+
+def append_jsonl_rotating(
+    path: Path,
+    record: dict,
+    *,
+    max_bytes: int = MONITOR_LOG_MAX_BYTES,
+    keep: int = MONITOR_LOG_KEEP,
+) -> None:
+    """Append one JSON line; past `max_bytes`, shift `path` -> `path.1` ->
+    ... `path.<keep>` first. Best-effort like the other diagnostic logs: a
+    full or read-only disk must not take the monitor down with it."""
+    line = (json.dumps(record, separators=(",", ":"), sort_keys=True) + "\n").encode()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size + len(line) > max_bytes:
+            for index in range(keep, 0, -1):
+                older = path.with_name(f"{path.name}.{index}")
+                newer = path if index == 1 else path.with_name(f"{path.name}.{index - 1}")
+                if newer.exists():
+                    os.replace(newer, older)
+        with path.open("ab") as log:
+            log.write(line)
+    except OSError:
+        return
+
+
+def _run_monitor_remedy(remedy: str, out) -> dict:
+    """Execute one unattended remedy; return its JSONL event fields."""
+    started = time.monotonic()
+    if remedy == "gc":
+        plan = plan_gc(
+            gather_gc_inventory(),
+            now=time.time(),
+            on_system_volume=_data_disk_on_system_volume(),
+        )
+        result = execute_gc(plan)
+        _print_gc_classes(out, result)
+        return {
+            "ok": not result.failures,
+            "freed_bytes": result.freed_bytes,
+            "failures": len(result.failures),
+            "seconds": round(time.monotonic() - started, 3),
+        }
+    code = _run_recovery(argparse.Namespace(yes=True, force=False), label=remedy)
+    return {
+        "ok": code == EXIT_OK,
+        "exit_code": code,
+        "seconds": round(time.monotonic() - started, 3),
+    }
+
+
 # ==========================================================================
 # Presentation helpers.
 # ==========================================================================
@@ -1476,6 +2470,49 @@ def _print_report_header(out, title: str) -> None:
     out.write(f"\n=== {title} ===\n")
 
 
+def _print_probe_timings(out, timings: list[ProbeTiming]) -> None:
+    if not timings:
+        return
+    out.write("probe latency:\n")
+    width = max(len(t.name) for t in timings)
+    for timing in sorted(timings, key=lambda t: t.seconds, reverse=True):
+        out.write(f"  {timing.name:<{width}}  {timing.seconds:7.3f}s  {timing.status}\n")
+
+
+def _print_target_plan(out, plan: GcPlan) -> None:
+    out.write(
+        f"free-target plan: {_human_bytes(plan.target_bytes)} requested, "
+        f"~{_human_bytes(plan.reclaimable_bytes)} projected (shared layers not counted)\n"
+    )
+    rows: list[tuple[int, str, str]] = [
+        (i.size_bytes, "image", f"{_short_id(i.id)} {' '.join(i.tags)}".rstrip())
+        for i in plan.images
+    ]
+    rows += [(c.size_bytes, "container", _short_id(c.id)) for c in plan.containers]
+    rows += [(v.size_bytes, "volume", v.name) for v in plan.volumes]
+    for size, kind, label in sorted(rows, key=lambda row: row[0], reverse=True):
+        out.write(f"  {_human_bytes(size):>10}  {kind:<9}  {label}\n")
+    if plan.shortfall_bytes:
+        out.write(
+            f"  short by ~{_human_bytes(plan.shortfall_bytes)}: every eligible object is "
+            "selected; named volumes and running workloads are never evicted.\n"
+        )
+
+
+def _print_gc_classes(out, result: GcResult) -> None:
+    for kind in GC_CLASSES:
+        stats = result.by_class[kind]
+        if not (stats.removed or stats.failed):
+            continue
+        failed = f", {stats.failed} failed" if stats.failed else ""
+        out.write(
+            f"  {kind:<10} {stats.removed} removed{failed}, "
+            f"~{_human_bytes(stats.freed_bytes)} in {stats.seconds:.2f}s\n"
+        )
+    for failure in result.failures:
+        out.write(f"  not removed: {failure.kind} {failure.ref}: {failure.message}\n")
+
+
 def _print_resolution(out, resolution: DiskResolution) -> None:
     out.write("Docker storage resolution:\n")
     src = f" ({resolution.settings_source})" if resolution.settings_source else ""
@@ -1533,6 +2570,7 @@ def cmd_doctor(_args: argparse.Namespace) -> int:
     out.write(f"host free disk: {_human_bytes(snap.free_disk_bytes)}\n")
     out.write(f"docker runtime processes: {', '.join(snap.runtime_processes) or 'none detected'}\n")
     out.write(f"classification: {report.category}\n")
+    _print_probe_timings(out, snap.probe_timings)
 
     if system == "Windows":
         status = wsl_status()
@@ -2389,12 +3427,23 @@ def cmd_gc(args: argparse.Namespace) -> int:
     on_system = _data_disk_on_system_volume()
     free_before = host_free_disk()
     inventory = gather_gc_inventory()
-    plan = plan_gc(
-        inventory,
-        now=time.time(),
-        on_system_volume=on_system,
-        base_age_hours=args.age_hours,
-    )
+    target = getattr(args, "free_target", None)
+    if target:
+        plan = plan_gc_target(
+            inventory,
+            gather_disk_usage(),
+            target_bytes=target,
+            now=time.time(),
+            on_system_volume=on_system,
+            base_age_hours=args.age_hours,
+        )
+    else:
+        plan = plan_gc(
+            inventory,
+            now=time.time(),
+            on_system_volume=on_system,
+            base_age_hours=args.age_hours,
+        )
     out.write(
         f"data disk on system volume: {on_system}; age threshold: {plan.age_hours:g}h\n"
     )
@@ -2403,6 +3452,8 @@ def cmd_gc(args: argparse.Namespace) -> int:
         f"containers, {len(plan.volumes)} anonymous volumes "
         f"(~{_human_bytes(plan.reclaimable_bytes)})\n"
     )
+    if target:
+        _print_target_plan(out, plan)
     if args.dry_run:
         out.write("dry-run: nothing reclaimed. Named volumes are never touched.\n")
         return EXIT_OK
@@ -2413,6 +3464,7 @@ def cmd_gc(args: argparse.Namespace) -> int:
         f"containers, {result.volumes_removed} anonymous volumes; "
         f"freed ~{_human_bytes(result.freed_bytes)}\n"
     )
+    _print_gc_classes(out, result)
     out.write(
         f"free disk before -> after: {_human_bytes(free_before)} -> "
         f"{_human_bytes(host_free_disk())}\n"
@@ -2421,6 +3473,86 @@ def cmd_gc(args: argparse.Namespace) -> int:
     return EXIT_OK
 
 
+def cmd_monitor(args: argparse.Namespace, *, sleep=time.sleep) -> int:
+    """Sample the host on an interval and run the lightest safe remedy when
+    the trend says it is needed. Foreground and long-running; stop it with
+    Ctrl-C, or bound it with `--samples` for a cron-driven variant."""
+    out = sys.stdout
+    log_path = Path(args.log) if args.log else _monitor_log_path()
+    _print_report_header(out, "docker monitor")
+    out.write(
+        f"interval {args.interval:g}s; trend window {args.window_minutes:g}m; "
+        f"horizon {args.horizon_hours:g}h; log {log_path}\n"
+    )
+    client = engine_client()
+    disk_path = args.disk_path or monitor_disk_path(client)
+    out.write(f"watching free disk on {disk_path or os.getcwd()}\n")
+    out.flush()
+    window = args.window_minutes * 60.0
+    history: list[MonitorSample] = []
+    last_remedy_ts: float | None = None
+    taken = 0
+    try:
+        while True:
+            sample = take_monitor_sample(client, disk_path=disk_path)
+            history.append(sample)
+            history = [s for s in history if s.ts >= sample.ts - window]
+            decision = monitor_decision(
+                history,
+                horizon_hours=args.horizon_hours,
+                window_seconds=window,
+                last_remedy_ts=last_remedy_ts,
+                allow_restart=args.allow_restart,
+            )
+            record = {
+                **asdict(sample),
+                "disk_rate_bytes_per_hour": decision.disk_rate_bytes_per_hour,
+                "hours_to_low_disk": decision.hours_to_low_disk,
+                "remedy": decision.remedy,
+                "reason": decision.reason,
+            }
+            append_jsonl_rotating(log_path, record)
+            latency = "n/a" if sample.api_latency_ms is None else f"{sample.api_latency_ms:.1f}ms"
+            out.write(
+                f"{time.strftime('%H:%M:%S', time.localtime(sample.ts))} "
+                f"engine={sample.engine_state} latency={latency} "
+                f"disk={_human_bytes(sample.free_disk_bytes)} "
+                f"mem={_human_bytes(sample.free_mem_bytes)} -> {decision.reason}\n"
+            )
+            if decision.remedy and args.observe_only:
+                out.write(f"  observe-only: would run {decision.remedy}\n")
+            elif decision.remedy:
+                out.write(f"  running {decision.remedy}: {decision.reason}\n")
+                out.flush()
+                event = _run_monitor_remedy(decision.remedy, out)
+                last_remedy_ts = sample.ts
+                append_jsonl_rotating(
+                    log_path,
+                    {"ts": time.time(), "event": "remedy", "remedy": decision.remedy, **event},
+                )
+                if decision.remedy == "restart" and client is not None:
+                    client.close()
+                    client = engine_client()
+            out.flush()
+            taken += 1
+            if args.samples and taken >= args.samples:
+                return EXIT_OK
+            sleep(args.interval)
+    except KeyboardInterrupt:
+        out.write("monitor stopped.\n")
+        return EXIT_OK
+    finally:
+        if client is not None:
+            client.close()
+
+
+def _free_target_arg(text: str) -> int:
+    try:
+        return parse_byte_size(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="docker_recover",
@@ -2461,6 +3593,51 @@ def build_parser() -> argparse.ArgumentParser:
         "(default 24; halved on the system volume)",
     )
     p_gc.add_argument("--dry-run", action="store_true", help="report candidates without reclaiming")
+    p_gc.add_argument(
+        "--free-target",
+        type=_free_target_arg,
+        metavar="SIZE",
+        help="reclaim at least SIZE (e.g. 20GiB): the fewest eligible objects, "
+        "largest first, ranked by `docker system df -v` (ignores the age threshold "
+        "once older objects are exhausted)",
+    )
+
+    p_mon = sub.add_parser(
+        "monitor",
+        help="sample engine latency, disk, memory and processes to JSONL; "
+        "gc before the disk runs out",
+    )
+    p_mon.add_argument(
+        "--interval", type=float, default=MONITOR_INTERVAL_SECONDS, help="seconds between samples"
+    )
+    p_mon.add_argument(
+        "--samples", type=int, default=0, help="stop after N samples (default: run until Ctrl-C)"
+    )
+    p_mon.add_argument(
+        "--window-minutes",
+        type=float,
+        default=MONITOR_WINDOW_SECONDS / 60.0,
+        help="trailing window the disk trend is fitted over",
+    )
+    p_mon.add_argument(
+        "--horizon-hours",
+        type=float,
+        default=MONITOR_HORIZON_HOURS,
+        help="run gc when the trend reaches low disk within this many hours",
+    )
+    p_mon.add_argument("--log", help="JSONL path (default ~/.clud/docker-recover/monitor.jsonl)")
+    p_mon.add_argument(
+        "--disk-path",
+        help="filesystem to watch (default: the Docker data root, else the current directory)",
+    )
+    p_mon.add_argument(
+        "--allow-restart",
+        action="store_true",
+        help="also restart the runtime after sustained engine failure",
+    )
+    p_mon.add_argument(
+        "--observe-only", action="store_true", help="record and report, never run a remedy"
+    )
     return parser
 
 
@@ -2480,6 +3657,8 @@ def main(argv: list[str]) -> int:
         return cmd_disk(args)
     if args.cmd in ("gc", "trim"):
         return cmd_gc(args)
+    if args.cmd == "monitor":
+        return cmd_monitor(args)
     parser.print_help(sys.stderr)
     return EXIT_USAGE
 
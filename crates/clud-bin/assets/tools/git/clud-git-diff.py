@@ -16,23 +16,74 @@ Layout:
 Click a file in the left panel → its dual-pane diff renders to the
 right with synchronized scrolling between the two columns.
 
+git writes the diff to a temporary spool file that is parsed as it
+grows; only each file's byte span and +/- counts are kept, and the page
+embeds just that file list. A file's hunks are re-read and parsed when
+it is first shown and handed to the page through the pywebview `js_api`
+bridge; the next few files are parsed in the background, and at most
+`PAYLOAD_CACHE_SIZE` parsed files are kept. Paired removed/added lines
+get a token-level diff from a worker pool, pushed to the page as it
+finishes.
+
 Usage:
     uv run --no-project demo/diff_webview.py [LEFT [RIGHT]]
+    uv run --no-project demo/diff_webview.py [LEFT [RIGHT]] --export out.html
+    uv run --no-project demo/diff_webview.py [LEFT [RIGHT]] --json
 
 Default range: HEAD~10..HEAD
+
+`--export` writes a self-contained page with every file's payload inline,
+and `--json` prints the file list and payloads to stdout. Neither opens a
+window or needs pywebview.
 """
 
 from __future__ import annotations
 
+import argparse
+import difflib
+import hashlib
 import html
 import json
+import os
 import re
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
 
-import webview
 from running_process import RunningProcess
 
+#: Parsed per-file payloads kept in memory; older ones are re-parsed from
+#: the spooled diff if the user goes back to them.
+PAYLOAD_CACHE_SIZE = 32
+#: Files after the one on screen parsed in the background, so stepping
+#: down the list does not wait on the parser.
+PREFETCH_AHEAD = 3
+#: Fixed row height the page's windowed renderer positions rows by, and
+#: the rows drawn beyond each edge of the viewport.
+ROW_HEIGHT_PX = 20
+OVERSCAN_ROWS = 30
+#: Intra-line word diff: worker threads, cached (old, new) pairs, rows per
+#: batch pushed to the page, and the per-file time budget. Lines longer
+#: than WORDDIFF_MAX_LINE (minified bundles, lockfile blobs) are skipped.
+WORDDIFF_WORKERS = 2
+WORDDIFF_CACHE_SIZE = 4096
+WORDDIFF_BATCH_ROWS = 64
+WORDDIFF_BUDGET_SECONDS = 1.0
+WORDDIFF_MAX_LINE = 2000
+#: On-disk payload cache under `<repo>/.clud/`, keyed by resolved SHAs, and
+#: its size cap in MB (the env var overrides it; 0 turns the cache off).
+DISK_CACHE_DIR = Path(".clud") / "git-diff-cache" / "v1"
+DISK_CACHE_ENV = "CLUD_GIT_DIFF_CACHE_MB"
+DISK_CACHE_MB = 256
+#: How often `stream_diff` re-checks the spool while git is still writing.
+STREAM_POLL_SECONDS = 0.01
+
 
 # ---------- diff parsing ----------
 
@@ -50,49 +101,111 @@ class FileDiff:
     path: str
     header_lines: list[str] = field(default_factory=list)
     hunks: list[Hunk] = field(default_factory=list)
+    # Byte span of this file's section in the diff it was parsed from, so
+    # the hunks can be re-read later without being held.
+    start: int = 0
+    end: int = 0
+    added: int = 0
+    removed: int = 0
+    # The `a/` side of the header; differs from `path` on a rename.
+    old_path: str = ""
 
 
-def get_diff(rev_left: str, rev_right: str) -> str:
-    result = RunningProcess.run(
-        ["git", "diff", "--no-color", f"{rev_left}..{rev_right}"],
-        capture_output=True,
-        text=True,
-        check=False,
+def stream_diff(rev_left: str, rev_right: str, spool: Path,
+                cwd: Path | None = None) -> Iterator[bytes]:
+    """Run `git diff` into `spool` and yield its lines as git writes them.
+
+    git writes the file itself (`--output`) and this follows it, so the
+    diff is never held in memory or queued in a pipe; the spool is what
+    `DiffSession` later re-reads by byte offset. Lines keep their newline.
+    """
+    spool.write_bytes(b"")
+    proc = RunningProcess(
+        ["git", "diff", "--no-color", f"--output={spool}", f"{rev_left}..{rev_right}"],
+        cwd=cwd,
+        text=False,
+        auto_run=True,
     )
-    if result.returncode != 0 and not result.stdout:
-        return f"git diff failed (exit {result.returncode}):\n{result.stderr}"
-    return result.stdout
+    partial = b""
+    with spool.open("rb") as fh:
+        while True:
+            # Checked before reading, so a finished git has nothing left
+            # once this read comes up short.
+            finished = proc.poll() is not None
+            line = fh.readline()
+            if line.endswith(b"\n"):
+                yield partial + line
+                partial = b""
+                continue
+            partial += line
+            if finished:
+                break
+            time.sleep(STREAM_POLL_SECONDS)
+    if partial:
+        yield partial
+    if proc.returncode:
+        sys.stderr.write(f"git diff failed (exit {proc.returncode})\n")
+
 
+def parse_diff(lines: Iterable[bytes | str], *, hunks: bool = True) -> Iterator[FileDiff]:
+    """Yield each file of a unified diff as soon as its section ends.
 
-def parse_diff(diff_text: str) -> list[FileDiff]:
-    files: list[FileDiff] = []
+    `lines` is any line iterable with newlines kept — `stream_diff`, an open
+    binary file, or a str (split here). Every FileDiff carries its byte
+    span and +/- counts; `hunks=False` skips building the hunks, which is
+    all the file list needs.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines(keepends=True)
     current: FileDiff | None = None
     current_hunk: Hunk | None = None
     file_pattern = re.compile(r"^diff --git a/(.+?) b/(.+?)$")
     hunk_pattern = re.compile(r"^@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+    offset = 0
+    in_hunks = False
 
-    for raw in diff_text.splitlines():
+    for line in lines:
+        if isinstance(line, bytes):
+            size = len(line)
+            raw = line.decode("utf-8", "replace").rstrip("\r\n")
+        else:
+            size = len(line.encode("utf-8", "surrogatepass"))
+            raw = line.rstrip("\r\n")
+        start = offset
+        offset += size
         if raw.startswith("diff --git "):
             if current is not None:
                 if current_hunk is not None:
                     current.hunks.append(current_hunk)
                     current_hunk = None
-                files.append(current)
+                current.end = start
+                yield current
             m = file_pattern.match(raw)
             path = m.group(2) if m else "?"
-            current = FileDiff(path=path, header_lines=[raw])
+            current = FileDiff(path=path, header_lines=[raw], start=start,
+                               old_path=m.group(1) if m else path)
             current_hunk = None
+            in_hunks = False
         elif current is None:
             # Preamble before the first `diff --git` — skip.
             continue
         elif raw.startswith("@@"):
+            in_hunks = True
+            if not hunks:
+                continue
             if current_hunk is not None:
                 current.hunks.append(current_hunk)
             m = hunk_pattern.match(raw)
             old_start = int(m.group(1)) if m else 1
             new_start = int(m.group(2)) if m else 1
             current_hunk = Hunk(old_start=old_start, new_start=new_start)
-        elif current_hunk is not None:
+        elif in_hunks:
+            if raw.startswith("+"):
+                current.added += 1
+            elif raw.startswith("-"):
+                current.removed += 1
+            if current_hunk is None:
+                continue
             if not raw:
                 current_hunk.raw_lines.append((" ", ""))
             elif raw[0] in " +-":
@@ -105,8 +218,266 @@ def parse_diff(diff_text: str) -> list[FileDiff]:
     if current is not None:
         if current_hunk is not None:
             current.hunks.append(current_hunk)
-        files.append(current)
-    return files
+        current.end = offset
+        yield current
+
+
+def index_diff(lines: Iterable[bytes | str]) -> list[FileDiff]:
+    """The file list: every file's span and +/- counts, no hunks."""
+    return list(parse_diff(lines, hunks=False))
+
+
+def resolve_range(rev_left: str, rev_right: str,
+                  cwd: Path | None = None) -> tuple[Path, str, str] | None:
+    """`(repo root, left SHA, right SHA)` from one `git rev-parse`, or None
+    outside a repo or when either revision doesn't name a commit."""
+    result = RunningProcess.run(
+        ["git", "rev-parse", "--show-toplevel", f"{rev_left}^{{commit}}",
+         f"{rev_right}^{{commit}}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    lines = result.stdout.split("\n") if result.returncode == 0 else []
+    if len(lines) < 3 or not all(lines[:3]):
+        return None
+    return Path(lines[0]), lines[1], lines[2]
+
+
+def disk_cache_bytes(env: dict[str, str] | None = None) -> int:
+    raw = (os.environ if env is None else env).get(DISK_CACHE_ENV, "")
+    try:
+        return int(float(raw) * 2**20) if raw.strip() else DISK_CACHE_MB * 2**20
+    except ValueError:
+        return DISK_CACHE_MB * 2**20
+
+
+class DiffCache:
+    """Parsed payloads for one resolved range, on disk under the repo.
+
+    One directory per `(left SHA, right SHA)` holds the range's file list
+    (`index.json`) and one JSON payload per file path. Reads refresh a
+    file's mtime; writes evict the least recently used files, across every
+    cached range, once the cache is over `max_bytes`. Any I/O error is a
+    miss — the cache never fails a view.
+    """
+
+    def __init__(self, repo_root: Path, left_sha: str, right_sha: str, *,
+                 max_bytes: int | None = None) -> None:
+        self.root = repo_root / DISK_CACHE_DIR
+        self.repo_root = repo_root
+        self.left_sha = left_sha
+        self.right_sha = right_sha
+        self.max_bytes = disk_cache_bytes() if max_bytes is None else max_bytes
+        self.dir = self.root / f"{left_sha}..{right_sha}"
+        self._lock = threading.Lock()
+        self._total: int | None = None
+
+    def _file(self, path: str) -> Path:
+        return self.dir / (hashlib.blake2b(path.encode(), digest_size=16).hexdigest() + ".json")
+
+    def _read(self, file: Path):
+        try:
+            data = json.loads(file.read_text(encoding="utf-8"))
+            os.utime(file)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def _ensure_ignored(self) -> None:
+        """Keep the cache out of `git status` (and `git add -A`).
+
+        A `*` `.gitignore` one level above the versioned root ignores every
+        cache version and itself, so `.clud/` never shows as untracked.
+        """
+        ignore = self.root.parent / ".gitignore"
+        if not ignore.exists():
+            ignore.parent.mkdir(parents=True, exist_ok=True)
+            ignore.write_text("# managed-by: clud (clud-git-diff payload cache)\n*\n",
+                              encoding="utf-8")
+
+    def _write(self, file: Path, data) -> None:
+        raw = json.dumps(data).encode("utf-8")
+        try:
+            self._ensure_ignored()
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = file.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(raw)
+            os.replace(tmp, file)
+        except OSError:
+            return
+        with self._lock:
+            if self._total is not None:
+                self._total += len(raw)
+            over = self._total is None or self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    def load_index(self) -> list[FileDiff] | None:
+        data = self._read(self.dir / "index.json")
+        if not isinstance(data, list):
+            return None
+        return [FileDiff(path=e["path"], old_path=e["old_path"], added=e["added"],
+                         removed=e["removed"]) for e in data]
+
+    def store_index(self, entries: list[FileDiff]) -> None:
+        self._write(self.dir / "index.json", [
+            {"path": e.path, "old_path": e.old_path, "added": e.added, "removed": e.removed}
+            for e in entries
+        ])
+
+    def load(self, path: str) -> dict | None:
+        data = self._read(self._file(path))
+        return data if isinstance(data, dict) else None
+
+    def store(self, path: str, payload: dict) -> None:
+        self._write(self._file(path), payload)
+
+    def evict(self) -> int:
+        """Delete least recently used files until under `max_bytes`.
+        Returns the bytes left."""
+        files = []
+        for entry in self.root.glob("*/*.json"):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, entry))
+        files.sort()
+        total = sum(size for _mtime, size, _entry in files)
+        for _mtime, size, entry in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            try:
+                entry.parent.rmdir()  # only succeeds once the range is empty
+            except OSError:
+                pass
+        with self._lock:
+            self._total = total
+        return total
+
+
+class DiffSession:
+    """Per-file payloads for one diff, parsed on demand.
+
+    `source` is the spooled diff and `entries` its `index_diff` (built
+    from `source` when not given). `payload(idx)` reads that file's byte
+    span and parses it the first time it is asked for; results live in an
+    LRU of `cache_size` entries, and in `disk` when there is one. With no
+    `source` (a range whose file list came from `disk`), a file that
+    isn't cached is re-diffed on its own. Thread-safe: the js_api bridge
+    and the prefetch worker call in concurrently.
+    """
+
+    def __init__(self, source: Path | None, entries: list[FileDiff] | None = None, *,
+                 disk: DiffCache | None = None,
+                 cache_size: int = PAYLOAD_CACHE_SIZE,
+                 prefetch_ahead: int = PREFETCH_AHEAD) -> None:
+        self.source = source
+        self.disk = disk
+        if entries is None:
+            with source.open("rb") as fh:
+                entries = index_diff(fh)
+        self.entries = entries
+        self.cache_size = cache_size
+        self.prefetch_ahead = prefetch_ahead
+        self._cache: OrderedDict[int, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diff-prefetch")
+
+    def file_list(self) -> list[dict]:
+        return [{"path": e.path, "added": e.added, "removed": e.removed}
+                for e in self.entries]
+
+    def read_file(self, idx: int) -> FileDiff:
+        """Re-read and fully parse one file from the spool, or re-run
+        `git diff` for just that file when there is no spool."""
+        entry = self.entries[idx]
+        if self.source is None:
+            paths = dict.fromkeys([entry.old_path or entry.path, entry.path])
+            result = RunningProcess.run(
+                ["git", "diff", "--no-color", self.disk.left_sha, self.disk.right_sha,
+                 "--", *paths],
+                cwd=self.disk.repo_root,
+                capture_output=True,
+                text=False,
+                check=False,
+            )
+            parsed = next(parse_diff(result.stdout.splitlines(keepends=True)), None)
+            return parsed or FileDiff(path=entry.path)
+        with self.source.open("rb") as fh:
+            fh.seek(entry.start)
+            section = fh.read(entry.end - entry.start)
+        parsed = next(parse_diff(section.splitlines(keepends=True)), None)
+        return parsed or FileDiff(path=entry.path)
+
+    def payload(self, idx: int) -> dict | None:
+        if not 0 <= idx < len(self.entries):
+            return None
+        with self._lock:
+            if idx in self._cache:
+                self._cache.move_to_end(idx)
+                return self._cache[idx]
+        path = self.entries[idx].path
+        payload = self.disk.load(path) if self.disk is not None else None
+        if payload is None:
+            payload = file_to_payload(self.read_file(idx))
+            if self.disk is not None:
+                self.disk.store(path, payload)
+        with self._lock:
+            self._cache[idx] = payload
+            self._cache.move_to_end(idx)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return payload
+
+    def cached(self) -> list[int]:
+        with self._lock:
+            return list(self._cache)
+
+    def prefetch(self, idx: int) -> None:
+        """Parse the next `prefetch_ahead` files after `idx` in the background."""
+        for nxt in range(idx + 1, min(idx + 1 + self.prefetch_ahead, len(self.entries))):
+            with self._lock:
+                if nxt in self._cache:
+                    continue
+            self._pool.submit(self.payload, nxt)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class DiffApi:
+    """The pywebview `js_api` object: `window.pywebview.api.file(idx)`.
+
+    Only public methods are exposed to the page; the session, word differ
+    and window stay private. Once `attach` has the window, each opened
+    file's word diffs are pushed back with `evaluate_js` as they finish.
+    """
+
+    def __init__(self, session: DiffSession, words: WordDiffer | None = None) -> None:
+        self._session = session
+        self._words = words
+        self._window = None
+
+    def attach(self, window) -> None:
+        self._window = window
+
+    def file(self, idx: int) -> dict | None:
+        payload = self._session.payload(int(idx))
+        self._session.prefetch(int(idx))
+        if payload is not None and self._words is not None and self._window is not None:
+            self._words.schedule(int(idx), payload, self._push)
+        return payload
+
+    def _push(self, idx: int, batch: list) -> None:
+        self._window.evaluate_js(f"applyWordDiff({idx}, {json.dumps(batch)})")
 
 
 def hunk_to_side_by_side(
@@ -114,7 +485,11 @@ def hunk_to_side_by_side(
 ) -> tuple[list[dict], list[dict]]:
     """Convert a hunk's unified-diff lines into two parallel column
     arrays (left = old/before, right = new/after) with line numbers
-    and per-row kind tags."""
+    and per-row kind tags.
+
+    The row-per-dict reference form of `hunk_to_columns`; the page gets
+    the columnar one.
+    """
     left: list[dict] = []
     right: list[dict] = []
     pending_l: list[str] = []
@@ -154,26 +529,225 @@ def hunk_to_side_by_side(
     return left, right
 
 
+#: Row codes in a columnar section's `kinds` string.
+KIND_CTX = "c"  # context: one text, both sides
+KIND_MOD = "m"  # removed line beside an added line: two texts
+KIND_DEL = "d"  # removed line, blank on the right
+KIND_ADD = "a"  # blank on the left, added line
+
+
+def hunk_to_columns(hunk: Hunk) -> dict:
+    """Encode a hunk's aligned rows column-wise for the page.
+
+    `kinds` holds one row code per row. `ol`/`nl` hold the old/new line
+    numbers, with 0 on a blank side. `text` holds the row texts in order:
+    one text per context row (both sides show it), two per `m` row (old,
+    new), and one per `d` or `a` row. The page decodes this. It has the
+    same rows as `hunk_to_side_by_side`, without repeating the per-cell
+    keys or the context text.
+    """
+    kinds: list[str] = []
+    ol: list[int] = []
+    nl: list[int] = []
+    text: list[str] = []
+    pending_l: list[str] = []
+    pending_r: list[str] = []
+    old_ln = hunk.old_start
+    new_ln = hunk.new_start
+
+    def flush() -> None:
+        nonlocal old_ln, new_ln
+        n = max(len(pending_l), len(pending_r))
+        for i in range(n):
+            has_l = i < len(pending_l)
+            has_r = i < len(pending_r)
+            if has_l and has_r:
+                kinds.append(KIND_MOD)
+                text.append(pending_l[i])
+                text.append(pending_r[i])
+            elif has_l:
+                kinds.append(KIND_DEL)
+                text.append(pending_l[i])
+            else:
+                kinds.append(KIND_ADD)
+                text.append(pending_r[i])
+            ol.append(old_ln if has_l else 0)
+            nl.append(new_ln if has_r else 0)
+            old_ln += has_l
+            new_ln += has_r
+        pending_l.clear()
+        pending_r.clear()
+
+    for kind, line in hunk.raw_lines:
+        if kind == " ":
+            flush()
+            kinds.append(KIND_CTX)
+            ol.append(old_ln)
+            nl.append(new_ln)
+            text.append(line)
+            old_ln += 1
+            new_ln += 1
+        elif kind == "-":
+            pending_l.append(line)
+        elif kind == "+":
+            pending_r.append(line)
+    flush()
+    return {"kinds": "".join(kinds), "ol": ol, "nl": nl, "text": text}
+
+
 def file_to_payload(file: FileDiff) -> dict:
     sections: list[dict] = []
     for hunk in file.hunks:
-        left, right = hunk_to_side_by_side(hunk)
         header = f"@@ -{hunk.old_start} +{hunk.new_start} @@"
-        sections.append({"header": header, "left": left, "right": right})
+        sections.append({"header": header, **hunk_to_columns(hunk)})
     return {"path": file.path, "sections": sections}
 
 
+# ---------- intra-line word diff ----------
+
+
+_TOKEN = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def _utf16_len(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+
+def word_diff(old: str, new: str) -> tuple[list[list[int]], list[list[int]]]:
+    """Changed `[start, end)` spans in `old` and in `new`, by token.
+
+    Tokens are words, whitespace runs and single punctuation marks. Offsets
+    are UTF-16 code units, which is how the page indexes strings.
+    """
+    a = _TOKEN.findall(old)
+    b = _TOKEN.findall(new)
+    a_at = [0]
+    for tok in a:
+        a_at.append(a_at[-1] + _utf16_len(tok))
+    b_at = [0]
+    for tok in b:
+        b_at.append(b_at[-1] + _utf16_len(tok))
+    old_spans: list[list[int]] = []
+    new_spans: list[list[int]] = []
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        for spans, at, lo, hi in ((old_spans, a_at, i1, i2), (new_spans, b_at, j1, j2)):
+            if lo == hi:
+                continue
+            if spans and spans[-1][1] == at[lo]:
+                spans[-1][1] = at[hi]
+            else:
+                spans.append([at[lo], at[hi]])
+    return old_spans, new_spans
+
+
+def modified_rows(payload: dict) -> list[tuple[int, str, str]]:
+    """`(row, old, new)` for every paired del/add row of a columnar payload,
+    with `row` numbered like the page's flat row list (a header row, then
+    the section's rows)."""
+    out: list[tuple[int, str, str]] = []
+    row = 0
+    for section in payload["sections"]:
+        row += 1
+        t = 0
+        for i, code in enumerate(section["kinds"]):
+            if code == KIND_MOD:
+                out.append((row + i, section["text"][t], section["text"][t + 1]))
+                t += 2
+            else:
+                t += 1
+        row += len(section["kinds"])
+    return out
+
+
+class WordDiffer:
+    """Word diffs for opened files, computed off the js_api call.
+
+    `schedule` splits a file's paired del/add rows into batches on a small
+    thread pool and hands each finished batch of `[row, old_spans,
+    new_spans]` to `push`. Results are cached by a hash of the (old, new)
+    pair. A file stops once it has used `budget` seconds, lines longer than
+    `max_line` are skipped, and batches for a file the user has already
+    left are dropped.
+    """
+
+    def __init__(self, *, workers: int = WORDDIFF_WORKERS,
+                 cache_size: int = WORDDIFF_CACHE_SIZE,
+                 batch_rows: int = WORDDIFF_BATCH_ROWS,
+                 budget: float = WORDDIFF_BUDGET_SECONDS,
+                 max_line: int = WORDDIFF_MAX_LINE) -> None:
+        self.cache_size = cache_size
+        self.batch_rows = batch_rows
+        self.budget = budget
+        self.max_line = max_line
+        self._cache: OrderedDict[bytes, tuple[list, list]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._current = -1
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="word-diff")
+
+    def cached(self, old: str, new: str) -> tuple[list, list]:
+        key = hashlib.blake2b(f"{old}\0{new}".encode("utf-8", "surrogatepass"),
+                              digest_size=16).digest()
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                return hit
+        spans = word_diff(old, new)
+        with self._lock:
+            self._cache[key] = spans
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return spans
+
+    def schedule(self, idx: int, payload: dict, push) -> list:
+        rows = [r for r in modified_rows(payload)
+                if len(r[1]) <= self.max_line and len(r[2]) <= self.max_line]
+        with self._lock:
+            self._current = idx
+        deadline = time.monotonic() + self.budget
+        return [
+            self._pool.submit(self._run, idx, rows[i:i + self.batch_rows], deadline, push)
+            for i in range(0, len(rows), self.batch_rows)
+        ]
+
+    def _run(self, idx: int, rows: list, deadline: float, push) -> None:
+        batch = []
+        for row, old, new in rows:
+            if self._current != idx or time.monotonic() > deadline:
+                break
+            old_spans, new_spans = self.cached(old, new)
+            batch.append([row, old_spans, new_spans])
+        if batch and self._current == idx:
+            push(idx, batch)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ---------- rendering ----------
 
 
-def render_html(rev_left: str, rev_right: str, files: list[FileDiff]) -> str:
-    payloads = [file_to_payload(f) for f in files]
-    data_json = json.dumps(payloads)
+def render_html(rev_left: str, rev_right: str, files: list[dict],
+                payloads: list[dict] | None = None) -> str:
+    """The page shell: file list and stats only. `files` is
+    `DiffSession.file_list()`; hunks arrive later through `js_api`.
+
+    With `payloads` (one per file, in order) the page is self-contained
+    instead: the payloads are inlined and served by an in-page stand-in
+    for the `js_api` bridge — the `--export` form.
+    """
+    # `</` can't appear raw inside a <script> element.
+    embedded = "null" if payloads is None else json.dumps(payloads).replace("</", "<\\/")
     nav_items = []
     for i, f in enumerate(files):
-        escaped = html.escape(f.path)
+        escaped = html.escape(f["path"])
         nav_items.append(
-            f'<a class="nav-item" data-idx="{i}" href="#">{escaped}</a>'
+            f'<a class="nav-item" data-idx="{i}" href="#">'
+            f'<span class="stat"><span class="plus">+{f["added"]}</span> '
+            f'<span class="minus">-{f["removed"]}</span></span>{escaped}</a>'
         )
     nav = (
         "\n".join(nav_items)
@@ -219,7 +793,10 @@ aside h2 {{ position: sticky; top: 0; background: #252526;
              cursor: pointer; }}
 .nav-item:hover {{ background: #2a2d2e; }}
 .nav-item.active {{ background: #094771; border-left-color: #0e639c; color: #fff; }}
-.pane {{ grid-row: 2; overflow: auto; }}
+.nav-item .stat {{ float: right; margin-left: 0.5rem; font-size: 0.7rem; }}
+.nav-item .plus {{ color: #b5cea8; }}
+.nav-item .minus {{ color: #ce9178; }}
+.pane {{ grid-row: 2; overflow: auto; position: relative; }}
 .pane.left  {{ border-right: 1px solid #3c3c3c; }}
 .pane.right {{ }}
 .pane .pane-title {{ position: sticky; top: 0;
@@ -227,10 +804,12 @@ aside h2 {{ position: sticky; top: 0; background: #252526;
                       letter-spacing: 0.05em; text-transform: uppercase;
                       background: #1f2226; color: #888;
                       border-bottom: 1px solid #2a2d2e; z-index: 5; }}
-.hunk-header {{ padding: 0.4rem 1rem; color: #4ec9b0; background: #2a2d2e;
-                font-size: 0.78rem; }}
-.row {{ display: flex; font-size: 0.82rem; line-height: 1.45;
-        white-space: pre; }}
+.spacer {{ position: relative; }}
+.window {{ position: absolute; top: 0; left: 0; right: 0; will-change: transform; }}
+.row {{ display: flex; font-size: 0.82rem; height: {ROW_HEIGHT_PX}px;
+        line-height: {ROW_HEIGHT_PX}px; white-space: pre; overflow: hidden; }}
+.row.hunk-header {{ padding-left: 1rem; color: #4ec9b0; background: #2a2d2e;
+                    font-size: 0.78rem; }}
 .row .ln {{ flex: 0 0 4ch; padding: 0 0.5rem; text-align: right;
             color: #555; user-select: none; }}
 .row .text {{ flex: 1 1 auto; padding-right: 0.5rem; min-width: 0;
@@ -239,6 +818,8 @@ aside h2 {{ position: sticky; top: 0; background: #252526;
 .row.add   {{ background: rgba(101, 153, 63, 0.18); color: #b5cea8; }}
 .row.del   {{ background: rgba(204, 78, 78, 0.18); color: #ce9178; }}
 .row.blank {{ background: #1a1a1a; color: #444; }}
+.row.del mark {{ background: rgba(204, 78, 78, 0.45); color: inherit; }}
+.row.add mark {{ background: rgba(101, 153, 63, 0.45); color: inherit; }}
 .empty {{ padding: 2rem 1.5rem; color: #888; }}
 </style>
 </head>
@@ -258,37 +839,173 @@ aside h2 {{ position: sticky; top: 0; background: #252526;
 <div class="pane right"><div class="pane-title">After ({html.escape(rev_right)})</div>
 <div id="rightBody"></div></div>
 <script>
-const PAYLOADS = {data_json};
-const leftBody  = document.getElementById('leftBody');
-const rightBody = document.getElementById('rightBody');
-const items     = document.querySelectorAll('.nav-item');
-
-function renderColumn(target, rows) {{
-  const html = rows.map(r => {{
-    const ln = r.ln === null ? '' : r.ln;
-    const text = r.text
-      .replace(/&/g, '&amp;').replace(/</g, '&lt;')
-      .replace(/>/g, '&gt;') || '&nbsp;';
-    return `<div class="row ${{r.kind}}"><span class="ln">${{ln}}</span><span class="text">${{text}}</span></div>`;
-  }}).join('');
-  return html;
+const FILE_COUNT = {file_count};
+const EMBEDDED   = {embedded};
+const ROW_PX     = {ROW_HEIGHT_PX};
+const OVERSCAN   = {OVERSCAN_ROWS};
+const items      = document.querySelectorAll('.nav-item');
+const leftPane   = document.querySelector('.pane.left');
+const rightPane  = document.querySelector('.pane.right');
+
+// Windowed rendering: both panes share one flat row list (a hunk header,
+// or the left/right cells of one aligned row) and draw only the rows in
+// view plus OVERSCAN either side, into a fixed pool of row elements. The
+// DOM is the same size for a 10-line file and a 100k-line one.
+const NO_ROWS = {{ length: 0, kinds: [], ol: [], nl: [], lt: [], rt: [], text: [] }};
+let rows = NO_ROWS;
+const panes = [
+  {{ el: leftPane,  body: document.getElementById('leftBody'),  side: 'left'  }},
+  {{ el: rightPane, body: document.getElementById('rightBody'), side: 'right' }},
+];
+for (const pane of panes) {{
+  pane.msg = document.createElement('p');
+  pane.msg.className = 'empty';
+  pane.spacer = document.createElement('div');
+  pane.spacer.className = 'spacer';
+  pane.win = document.createElement('div');
+  pane.win.className = 'window';
+  pane.spacer.appendChild(pane.win);
+  pane.body.append(pane.msg, pane.spacer);
+  pane.pool = [];
+}}
+
+function buildPool() {{
+  const size = Math.ceil(leftPane.clientHeight / ROW_PX) + 2 * OVERSCAN;
+  for (const pane of panes) {{
+    pane.win.textContent = '';
+    pane.pool = [];
+    for (let k = 0; k < size; k++) {{
+      const row = document.createElement('div');
+      const ln = document.createElement('span');
+      const text = document.createElement('span');
+      ln.className = 'ln';
+      text.className = 'text';
+      row.append(ln, text);
+      pane.win.appendChild(row);
+      pane.pool.push({{ row, ln, text }});
+    }}
+  }}
 }}
 
-function showFile(idx) {{
+function rowAt(scrollTop) {{
+  return Math.max(0, Math.floor((scrollTop - panes[0].body.offsetTop) / ROW_PX));
+}}
+
+// Per side, a row code maps to [kind class, takes a text, has a line number].
+const CELL = {{
+  left:  {{ c: ['ctx', 1, 1], m: ['del', 1, 1], d: ['del', 1, 1], a: ['blank', 0, 0] }},
+  right: {{ c: ['ctx', 1, 1], m: ['add', 1, 1], d: ['blank', 0, 0], a: ['add', 1, 1] }},
+}};
+
+function draw(first) {{
+  const start = Math.max(0, first - OVERSCAN);
+  for (const pane of panes) {{
+    const lns = pane.side === 'left' ? rows.ol : rows.nl;
+    const tix = pane.side === 'left' ? rows.lt : rows.rt;
+    pane.win.style.transform = `translateY(${{start * ROW_PX}}px)`;
+    pane.pool.forEach((slot, k) => {{
+      const r = start + k;
+      if (r >= rows.length) {{ slot.row.style.display = 'none'; return; }}
+      slot.row.style.display = '';
+      const code = rows.kinds[r];
+      if (code === 'h') {{
+        slot.row.className = 'row hunk-header';
+        slot.ln.textContent = '';
+        slot.text.textContent = rows.text[tix[r]];
+        return;
+      }}
+      const [kind, hasText, hasLn] = CELL[pane.side][code];
+      slot.row.className = `row ${{kind}}`;
+      slot.ln.textContent = hasLn ? lns[r] : '';
+      const text = (hasText && rows.text[tix[r]]) || '\u00a0';
+      const spans = code === 'm' && wordSpans.get(r);
+      if (spans) setMarked(slot.text, text, spans[pane.side === 'left' ? 0 : 1]);
+      else slot.text.textContent = text;
+    }});
+  }}
+}}
+
+// Intra-line word diff: Python pushes `[row, oldSpans, newSpans]` batches
+// for the file on screen as its worker pool finishes them.
+let wordSpans = new Map();
+function applyWordDiff(idx, batch) {{
+  if (idx !== showing) return;
+  for (const [r, oldSpans, newSpans] of batch) wordSpans.set(r, [oldSpans, newSpans]);
+  draw(rowAt(leftPane.scrollTop));
+}}
+
+function setMarked(target, text, spans) {{
+  target.textContent = '';
+  let at = 0;
+  for (const [start, end] of spans) {{
+    if (start > at) target.append(text.slice(at, start));
+    const mark = document.createElement('mark');
+    mark.textContent = text.slice(start, end);
+    target.append(mark);
+    at = end;
+  }}
+  if (at < text.length) target.append(text.slice(at));
+}}
+
+function setRows(next, message) {{
+  rows = next;
+  for (const pane of panes) {{
+    pane.msg.textContent = message || '';
+    pane.msg.style.display = message ? '' : 'none';
+    pane.spacer.style.height = `${{rows.length * ROW_PX}}px`;
+    pane.el.scrollTop = 0;
+  }}
+  draw(0);
+}}
+
+// Decode the columnar payload (`hunk_to_columns`) into one flat row list
+// for both panes: a row code per row ('h' for a hunk header), old/new
+// line numbers, and per-side indexes into one shared text array.
+function decode(file) {{
+  let length = 0;
+  for (const s of file.sections) length += 1 + s.kinds.length;
+  const kinds = new Array(length);
+  const ol = new Int32Array(length), nl = new Int32Array(length);
+  const lt = new Int32Array(length), rt = new Int32Array(length);
+  const text = [];
+  let r = 0;
+  for (const s of file.sections) {{
+    kinds[r] = 'h';
+    lt[r] = rt[r] = text.length;
+    text.push(s.header);
+    r++;
+    const base = text.length;
+    for (const t of s.text) text.push(t);
+    let t = base;
+    for (let i = 0; i < s.kinds.length; i++, r++) {{
+      const code = s.kinds[i];
+      kinds[r] = code;
+      ol[r] = s.ol[i];
+      nl[r] = s.nl[i];
+      if (code === 'm') {{ lt[r] = t; rt[r] = t + 1; t += 2; }}
+      else {{ lt[r] = rt[r] = t; t += 1; }}
+    }}
+  }}
+  return {{ length, kinds, ol, nl, lt, rt, text }};
+}}
+
+// Hunks are fetched per file from Python (`DiffApi.file`), which also
+// parses the next few files in the background. A newer click wins over a
+// slower, older response.
+let showing = -1;
+async function showFile(idx) {{
+  showing = idx;
+  wordSpans = new Map();
   items.forEach(i => i.classList.toggle('active', Number(i.dataset.idx) === idx));
-  const file = PAYLOADS[idx];
+  setRows(NO_ROWS, '(loading…)');
+  const file = await window.pywebview.api.file(idx);
+  if (showing !== idx) return;
   if (!file) {{
-    leftBody.innerHTML  = '<p class="empty">(nothing to show)</p>';
-    rightBody.innerHTML = '<p class="empty">(nothing to show)</p>';
+    setRows(NO_ROWS, '(nothing to show)');
     return;
   }}
-  let leftHtml = '', rightHtml = '';
-  for (const section of file.sections) {{
-    leftHtml  += `<div class="hunk-header">${{section.header}}</div>` + renderColumn(null, section.left);
-    rightHtml += `<div class="hunk-header">${{section.header}}</div>` + renderColumn(null, section.right);
-  }}
-  leftBody.innerHTML  = leftHtml  || '<p class="empty">(no hunks)</p>';
-  rightBody.innerHTML = rightHtml || '<p class="empty">(no hunks)</p>';
+  const next = decode(file);
+  setRows(next, next.length ? '' : '(no hunks)');
 }}
 
 items.forEach(item => {{
@@ -298,45 +1015,135 @@ items.forEach(item => {{
   }});
 }});
 
-// Synchronized scrolling between the two panes.
-const leftPane  = document.querySelector('.pane.left');
-const rightPane = document.querySelector('.pane.right');
+// Synchronized scrolling: both panes have identical geometry, so one
+// scrollTop gives the shared row index; redraw at most once per frame.
 let syncing = false;
+let pending = false;
 function syncFrom(src, dst) {{
   if (syncing) return;
   syncing = true;
   dst.scrollTop = src.scrollTop;
+  if (!pending) {{
+    pending = true;
+    requestAnimationFrame(() => {{
+      pending = false;
+      draw(rowAt(src.scrollTop));
+    }});
+  }}
   requestAnimationFrame(() => {{ syncing = false; }});
 }}
 leftPane.addEventListener('scroll',  () => syncFrom(leftPane,  rightPane));
 rightPane.addEventListener('scroll', () => syncFrom(rightPane, leftPane));
+window.addEventListener('resize', () => {{
+  buildPool();
+  draw(rowAt(leftPane.scrollTop));
+}});
 
-if (PAYLOADS.length > 0) showFile(0);
+buildPool();
+if (EMBEDDED) {{
+  // Exported page: no Python behind it, every payload is inline.
+  window.pywebview = {{ api: {{ file: async idx => EMBEDDED[idx] ?? null }} }};
+  if (FILE_COUNT > 0) showFile(0);
+}} else {{
+  window.addEventListener('pywebviewready', () => {{
+    if (FILE_COUNT > 0) showFile(0);
+  }});
+}}
 </script>
 </body>
 </html>"""
 
 
-def main() -> int:
-    args = sys.argv[1:]
-    rev_left = args[0] if len(args) >= 1 else "HEAD~10"
-    rev_right = args[1] if len(args) >= 2 else "HEAD"
+def export(session: DiffSession, rev_left: str, rev_right: str, *,
+           html_out: Path | None = None, as_json: bool = False) -> int:
+    """The headless modes: parse every file once and write the page or
+    JSON, with no window."""
+    files = session.file_list()
+    payloads = [session.payload(i) for i in range(len(files))]
+    if html_out is not None:
+        html_out.write_text(render_html(rev_left, rev_right, files, payloads),
+                            encoding="utf-8")
+        sys.stderr.write(f"wrote {html_out} ({len(files)} files)\n")
+    if as_json:
+        doc = {
+            "left": rev_left,
+            "right": rev_right,
+            "files": [{**f, **p} for f, p in zip(files, payloads, strict=True)],
+        }
+        sys.stdout.write(json.dumps(doc) + "\n")
+    return 0
 
-    diff = get_diff(rev_left, rev_right)
-    files = parse_diff(diff)
-    page = render_html(rev_left, rev_right, files)
 
-    title = f"git diff {rev_left}..{rev_right}"
-    print(
-        f"clud diff demo: opening native webview "
-        f"({len(files)} file{'s' if len(files) != 1 else ''})…",
-        flush=True,
-    )
-    webview.create_window(title, html=page, width=1600, height=950)
-    webview.start()  # blocks until user closes the window
+def _open_session(rev_left: str, rev_right: str, spool: Path, *,
+                  use_disk: bool = True) -> DiffSession:
+    """A session for the range. If both sides resolve to SHAs and the range
+    is in the disk cache, its file list comes from there and git is not run
+    for the whole diff; otherwise the diff is streamed into `spool`."""
+    resolved = resolve_range(rev_left, rev_right) if use_disk else None
+    disk = None
+    if resolved is not None and disk_cache_bytes() > 0:
+        disk = DiffCache(*resolved)
+        entries = disk.load_index()
+        if entries is not None:
+            return DiffSession(None, entries, disk=disk)
+    entries = index_diff(stream_diff(rev_left, rev_right, spool))
+    if disk is not None:
+        disk.store_index(entries)
+    return DiffSession(spool, entries, disk=disk)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="clud-git-diff", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("left", nargs="?", default="HEAD~10")
+    parser.add_argument("right", nargs="?", default="HEAD")
+    parser.add_argument("--export", type=Path, metavar="OUT.html",
+                        help="write a self-contained page instead of opening a window")
+    parser.add_argument("--json", action="store_true",
+                        help="print the file list and payloads as JSON instead")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"skip the payload cache under <repo>/{DISK_CACHE_DIR.as_posix()}")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    rev_left, rev_right = args.left, args.right
+
+    with tempfile.TemporaryDirectory(prefix="clud-git-diff-") as tmp:
+        session = _open_session(rev_left, rev_right, Path(tmp) / "diff.patch",
+                                use_disk=not args.no_cache)
+        if args.export is not None or args.json:
+            try:
+                return export(session, rev_left, rev_right,
+                              html_out=args.export, as_json=args.json)
+            finally:
+                session.close()
+
+        # Imported here so the parser, renderer and headless modes load
+        # without a GUI stack.
+        import webview
+
+        files = session.file_list()
+        page = render_html(rev_left, rev_right, files)
+
+        title = f"git diff {rev_left}..{rev_right}"
+        print(
+            f"clud diff demo: opening native webview "
+            f"({len(files)} file{'s' if len(files) != 1 else ''})…",
+            flush=True,
+        )
+        words = WordDiffer()
+        api = DiffApi(session, words)
+        window = webview.create_window(title, html=page, js_api=api, width=1600, height=950)
+        api.attach(window)
+        try:
+            webview.start()  # blocks until user closes the window
+        finally:
+            session.close()
+            words.close()
     print("clud diff demo: closed", flush=True)
     return 0
 
-
 if __name__ == "__main__":
     raise SystemExit(main())
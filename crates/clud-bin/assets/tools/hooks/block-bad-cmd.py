@@ -13,43 +13,146 @@ This Python file remains managed for one release so existing hand-written
 hook configs that still invoke `clud tool run hooks/block-bad-cmd.py`
 continue to work. New hook wiring should invoke `clud-block-bad-cmd`
 directly to avoid launching Python or uv.
+
+With `CLUD_BLOCK_BAD_CMD_RESIDENT=1` the shim skips the second launch:
+it sends the payload to a per-user `clud-block-bad-cmd --serve` on a
+unix socket and relays the verdict. The socket lives under
+`~/.clud/run/` (or `CLUD_BLOCK_BAD_CMD_SOCKET_DIR`) and is named after
+the binary's path, size and mtime, so an upgraded binary gets a fresh
+server. When no server answers, this call runs the binary once as usual
+and starts a server for the next one. Calls that set
+`CLUD_BAD_CMD_OVERRIDE` always run the binary, since the override is
+read from the deciding process's own environment. A missing binary
+allows the command, in both modes.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
+import socket
 import sys
+from pathlib import Path
 
-from running_process import PIPE, RunningProcess
+RESIDENT_ENV = "CLUD_BLOCK_BAD_CMD_RESIDENT"
+SOCKET_DIR_ENV = "CLUD_BLOCK_BAD_CMD_SOCKET_DIR"
+# Generous next to a decision (milliseconds), small next to the agent's
+# hook timeout; past it the call falls back to a one-shot run.
+SOCKET_TIMEOUT_SEC = 2.0
+# AF_UNIX paths are capped at 104-108 bytes depending on the platform.
+SUN_PATH_BUDGET = 100
 
 
 def _native_name() -> str:
     return "clud-block-bad-cmd.exe" if os.name == "nt" else "clud-block-bad-cmd"
 
 
+def socket_path(native: str) -> Path:
+    """The resident server's socket for this exact build of `native`."""
+    resolved = Path(native).resolve()
+    st = resolved.stat()
+    build = f"{resolved}|{st.st_size}|{st.st_mtime_ns}".encode()
+    key = hashlib.sha256(build).hexdigest()[:16]
+    base = os.environ.get(SOCKET_DIR_ENV) or str(Path.home() / ".clud" / "run")
+    path = Path(base) / f"block-bad-cmd-{key}.sock"
+    if len(str(path)) > SUN_PATH_BUDGET:
+        path = Path("/tmp") / f"clud-{os.getuid()}-block-bad-cmd-{key}.sock"
+    return path
+
+
+def ask_server(path: Path, raw: bytes) -> dict | None:
+    """One exchange with the resident server; None when it cannot answer."""
+    request = {
+        "stdin": raw.decode("utf-8", errors="replace"),
+        "cwd": os.getcwd(),
+        "allow_hybrid_uv_run": os.environ.get("CLUD_UV_RUST_ALLOW_ALL") == "1",
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SOCKET_TIMEOUT_SEC)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as replies:
+                reply = json.loads(replies.readline())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(reply, dict) or not isinstance(reply.get("exit_code"), int):
+        return None
+    return reply
+
+
+def _start_server(native: str, path: Path) -> None:
+    """Start `--serve` detached; a server that is already up just exits."""
+    from running_process import ContainedProcessGroup
+
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        group = ContainedProcessGroup(originator="clud-block-bad-cmd-serve")
+        group.spawn_daemon([native, "--serve", str(path)])
+    except Exception:
+        pass
+
+
+def _relay(stdout: bytes | str, stderr: bytes | str) -> None:
+    for stream, data in ((sys.stdout, stdout), (sys.stderr, stderr)):
+        if data:
+            stream.buffer.write(data.encode("utf-8") if isinstance(data, str) else data)
+            stream.buffer.flush()
+
+
+def _resident_enabled() -> bool:
+    return (
+        os.environ.get(RESIDENT_ENV) == "1"
+        and hasattr(socket, "AF_UNIX")
+        and os.name != "nt"
+        and not os.environ.get("CLUD_BAD_CMD_OVERRIDE")
+    )
+
+
 def main() -> int:
+    raw = sys.stdin.buffer.read()
+    native = shutil.which(_native_name())
+    if native is None:
+        print(
+            "[block-bad-cmd hook] clud-block-bad-cmd not found on PATH; "
+            "allowing command for compatibility. Reinstall or upgrade clud.",
+            file=sys.stderr,
+        )
+        return 0
+    if _resident_enabled():
+        try:
+            path = socket_path(native)
+        except OSError:
+            path = None
+        reply = ask_server(path, raw) if path is not None else None
+        if reply is not None:
+            _relay(reply.get("stdout") or "", reply.get("stderr") or "")
+            return reply["exit_code"]
+        if path is not None:
+            _start_server(native, path)
+    # Imported here so a resident-mode hit stays on the standard library.
+    from running_process import PIPE, RunningProcess
+
     try:
         completed = RunningProcess.run(
-            [_native_name()],
-            input=sys.stdin.buffer.read(),
+            [native],
+            input=raw,
             stdout=PIPE,
             stderr=PIPE,
             text=False,
             check=False,
         )
-    except FileNotFoundError:
+    except (FileNotFoundError, RuntimeError):
+        # Raced with an uninstall, or not executable: fail open as above.
         print(
-            "[block-bad-cmd hook] clud-block-bad-cmd not found on PATH; "
+            "[block-bad-cmd hook] clud-block-bad-cmd could not be started; "
             "allowing command for compatibility. Reinstall or upgrade clud.",
             file=sys.stderr,
         )
         return 0
-    if completed.stdout:
-        sys.stdout.buffer.write(completed.stdout)
-        sys.stdout.buffer.flush()
-    if completed.stderr:
-        sys.stderr.buffer.write(completed.stderr)
-        sys.stderr.buffer.flush()
+    _relay(completed.stdout, completed.stderr)
     return completed.returncode
 
 
@@ -4,7 +4,7 @@
 # dependencies = []
 # ///
 # managed-by: clud
-"""telemetry.py — PostToolUse hook that ships one record to the clud daemon.
+"""telemetry.py — PostToolUse hook that spools one record for the clud daemon.
 
 Hook contract (mirrors Claude Code PostToolUse payloads):
 - Input: JSON object on stdin with `tool_name`, `tool_input`,
@@ -20,12 +20,31 @@ installer's overwrite behavior. Hand-edit at your own risk — drop the
 marker if you want the installer to leave your copy alone.
 
 Behavior:
-- If `$CLUD_DAEMON_HTTP_SERVER` is unset/empty, exits 0 silently.
-- Otherwise POSTs a JSON envelope to `<server>/telemetry/log` matching
-  the daemon's `TelemetryIngest` schema (parent_pid, time_ms, cmd, cwd,
-  env where every key starts with `CLUD_`).
-- 2s HTTP timeout — hook callers must not hang on a dead daemon.
-- Stdlib only (urllib.request); no third-party deps in the venv.
+- If neither `$CLUD_DAEMON_TELEMETRY_SOCKET` nor `$CLUD_DAEMON_HTTP_SERVER`
+  is set, exits 0 silently.
+- Fast path: with `$CLUD_DAEMON_TELEMETRY_SOCKET` set (unix daemons), the
+  record goes to the daemon as one newline-terminated frame on that
+  socket: a `TelemetryBulkIngest` envelope, the same JSON the
+  `/telemetry/bulk` route takes. No HTTP, no spool.
+- Otherwise (no socket, or the frame was not sent or was refused) appends
+  one compact JSON line, the daemon's `TelemetryIngest` schema
+  (parent_pid, time_ms, cmd, cwd, env where every key starts with
+  `CLUD_`), to a per-session spool with a single `O_APPEND` write, and
+  exits. No network I/O on this path;
+  records survive a daemon that is down or restarting.
+- A spool past `SPOOL_MAX_BYTES` is not grown further: the record is
+  counted in `<session>.dropped` instead and reported to the daemon.
+- One flusher (`telemetry.py --flush`) ships the spools in batches, over
+  the socket when there is one, else to `<server>/telemetry/bulk`. The
+  hook starts it lazily when nobody holds the flusher lock; it exits after
+  `FLUSH_IDLE_EXIT_SEC` without a successful batch, so a dead daemon never
+  leaves it running.
+- Spools live in `$CLUD_TELEMETRY_SPOOL_DIR`, default
+  `~/.clud/telemetry/spool`.
+- Stdlib only, so `uv run` never resolves an environment for a fire. The
+  flusher is launched with `os.posix_spawn` in a new session (a detached
+  `os.spawnv` on Windows) with stdio on the null device; urllib is
+  imported only inside the flusher.
 
 Recommended `~/.claude/settings.json` wiring (matcher "*", async):
 
@@ -45,14 +64,45 @@ from __future__ import annotations
 import json
 import os
 import queue
+import re
+import socket
 import sys
 import threading
 import time
-import urllib.request
+from pathlib import Path
 from typing import Any
 
-# Tight cap — hook callers must never wait on a stuck daemon.
+# Tight cap — the flusher must never wedge on a stuck daemon.
 HTTP_TIMEOUT_SEC = 2.0
+# The local socket answers in well under a millisecond; a connect or send
+# slower than this means a wedged daemon, and the record goes to the spool.
+SOCKET_TIMEOUT_SEC = 0.5
+# The reply wait. The daemon ingests a frame before it answers, so a frame
+# that was fully sent counts as delivered even when no reply comes in time.
+SOCKET_REPLY_TIMEOUT_SEC = 1.0
+SOCKET_ENV = "CLUD_DAEMON_TELEMETRY_SOCKET"
+SPOOL_DIR_ENV = "CLUD_TELEMETRY_SPOOL_DIR"
+SPOOL_SUFFIX = ".jsonl"
+SENDING_SUFFIX = ".sending"
+DROPPED_SUFFIX = ".dropped"
+FLUSH_LOCK_NAME = "flush.lock"
+# Where the hook leaves the daemon address for the flusher: daemon
+# children start with a sanitized environment, and the token must not
+# ride on a command line other users can read.
+FLUSH_TARGET_NAME = "flush.json"
+# Per-session spool cap. Past it the hook counts a drop instead of
+# writing, so a daemon that is down for hours can't fill the disk.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+# One bulk request stays well under the daemon's 1 MiB body cap.
+FLUSH_BATCH_MAX_BYTES = 512 * 1024
+FLUSH_POLL_SEC = 0.2
+FLUSH_IDLE_EXIT_SEC = 5.0
+# A hook that opened a spool just before the flusher claimed it may
+# still be inside its single write; give it this long to land.
+FLUSH_CLAIM_GRACE_SEC = 0.05
+SESSION_KEY_MAX_LEN = 64
+# Never ship the dashboard capability inside a record (matches `clud log`).
+TOKEN_ENV = "CLUD_DAEMON_HTTP_TOKEN"
 # Truncate the cmd summary so the dashboard table stays readable and
 # the in-memory ring buffer doesn't bloat on huge tool_input blobs.
 CMD_MAX_LEN = 200
@@ -143,10 +193,375 @@ def _read_stdin_bounded() -> str:
     return b"".join(chunks).decode("utf-8", errors="replace").lstrip("\ufeff")
 
 
-def main() -> int:
+def _spool_dir() -> Path:
+    override = os.environ.get(SPOOL_DIR_ENV, "").strip()
+    if override:
+        return Path(override)
+    return Path.home() / ".clud" / "telemetry" / "spool"
+
+
+def _session_key(payload: dict[str, Any]) -> str:
+    """File-name-safe spool key: the clud session, else the hook's parent."""
+    raw = (
+        os.environ.get("CLUD_SESSION_ID")
+        or str(payload.get("session_id") or "")
+        or f"pid-{os.getppid()}"
+    )
+    key = re.sub(r"[^A-Za-z0-9_.-]", "_", raw)[:SESSION_KEY_MAX_LEN].strip(".")
+    return key or f"pid-{os.getppid()}"
+
+
+def build_record(payload: dict[str, Any]) -> dict[str, Any]:
+    """One `TelemetryIngest` record for a PostToolUse payload."""
+    return {
+        "parent_pid": os.getppid(),
+        "time_ms": int(time.time() * 1000),
+        "cmd": _cmd_summary(payload),
+        # Hook payload's `cwd` reflects Claude Code's cwd at fire
+        # time; fall back to ours when absent.
+        "cwd": payload.get("cwd") or os.getcwd(),
+        # Every CLUD_* env var, verbatim. Callers can use this as a
+        # tagging mechanism (e.g. CLUD_SESSION_ID, CLUD_TASK, ...).
+        "env": {k: v for k, v in os.environ.items() if k.startswith("CLUD_") and k != TOKEN_ENV},
+    }
+
+
+def _append(path: Path, data: bytes) -> None:
+    """One `O_APPEND` write, so concurrent hooks never interleave lines."""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def spool_record(spool_dir: Path, key: str, record: dict[str, Any]) -> bool:
+    """Append `record` to the session's spool; False if it was dropped."""
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    spool = spool_dir / (key + SPOOL_SUFFIX)
+    try:
+        size = spool.stat().st_size
+    except FileNotFoundError:
+        size = 0
+    if size >= SPOOL_MAX_BYTES:
+        # One byte per dropped record; the flusher reports the file size.
+        _append(spool_dir / (key + DROPPED_SUFFIX), b".")
+        return False
+    _append(spool, encode_record(record) + b"\n")
+    return True
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _bulk_body(lines: list[bytes], dropped: int) -> bytes:
+    """The `TelemetryBulkIngest` envelope both ingest lanes accept."""
+    return b'{"entries":[' + b",".join(lines) + b'],"dropped":' + str(dropped).encode() + b"}"
+
+
+def send_socket(path: str, lines: list[bytes], dropped: int) -> bool:
+    """Send one envelope as a frame on the daemon's telemetry socket.
+
+    The frame is the envelope plus `\\n`; the daemon answers one line,
+    `{"accepted": N}`. True when every record was accepted, or when the
+    whole frame went out but the reply missed `SOCKET_REPLY_TIMEOUT_SEC`:
+    spooling it then would only ship it twice. False when the frame did not
+    fully leave or the daemon refused it.
+    """
+    if not path or not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SOCKET_TIMEOUT_SEC)
+            sock.connect(path)
+            sock.sendall(_bulk_body(lines, dropped) + b"\n")
+            sock.settimeout(SOCKET_REPLY_TIMEOUT_SEC)
+            try:
+                with sock.makefile("rb") as replies:
+                    reply = replies.readline()
+            except TimeoutError:
+                return True
+    except OSError:
+        return False
+    try:
+        return json.loads(reply).get("accepted") == len(lines)
+    except (ValueError, AttributeError):
+        return False
+
+
+class _FlushLock:
+    """Non-blocking exclusive lock on `<spool>/flush.lock`.
+
+    Held for the lifetime of a flusher, so at most one ships at a time.
+    The OS releases it when the holder exits, crashed or not.
+    """
+
+    def __init__(self, spool_dir: Path) -> None:
+        self.fd = os.open(spool_dir / FLUSH_LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o600)
+        self.held = False
+
+    def acquire(self) -> bool:
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                msvcrt.locking(self.fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        self.held = True
+        return True
+
+    def close(self) -> None:
+        if self.held and sys.platform == "win32":
+            import msvcrt
+
+            try:
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+        os.close(self.fd)
+        self.held = False
+
+
+def flusher_running(spool_dir: Path) -> bool:
+    lock = _FlushLock(spool_dir)
+    try:
+        return not lock.acquire()
+    finally:
+        lock.close()
+
+
+def _spawn_flusher(spool_dir: Path, server: str, token: str, sock_path: str) -> None:
+    """Start `telemetry.py --flush <spool>` as a detached child that outlives the hook.
+
+    The child gets its own session and the null device for stdio, so it
+    neither holds the hook's pipes open nor dies with the hook's group.
+    """
+    target = spool_dir / FLUSH_TARGET_NAME
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        target = {"server": server, "token": token, "socket": sock_path}
+        os.write(fd, json.dumps(target).encode("utf-8"))
+    finally:
+        os.close(fd)
+    argv = [sys.executable, str(Path(__file__).resolve()), "--flush", str(spool_dir)]
+    if sys.platform == "win32":
+        os.spawnv(os.P_DETACH, sys.executable, argv)
+        return
+    null = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0) for fd in (0, 1, 2)]
+    os.posix_spawn(sys.executable, argv, os.environ, file_actions=null, setsid=True)
+
+
+def _flush_target(spool_dir: Path) -> tuple[str, str, str]:
     try:
-        server = os.environ.get("CLUD_DAEMON_HTTP_SERVER", "").strip()
-        if not server:
+        target = json.loads((spool_dir / FLUSH_TARGET_NAME).read_text(encoding="utf-8"))
+        return tuple(str(target.get(k) or "") for k in ("server", "token", "socket"))
+    except (OSError, ValueError, AttributeError):
+        return "", "", ""
+
+
+def _claim(spool_dir: Path) -> list[Path]:
+    """Rename live spools to `.sending` and return every claimed file.
+
+    A `.sending` file left by a failed pass is shipped before its
+    session's live spool is claimed again, so order within a session holds.
+    """
+    claimed = False
+    for spool in spool_dir.glob("*" + SPOOL_SUFFIX):
+        sending = spool.with_name(spool.name + SENDING_SUFFIX)
+        if sending.exists():
+            continue
+        try:
+            spool.rename(sending)
+            claimed = True
+        except OSError:
+            continue
+    if claimed:
+        time.sleep(FLUSH_CLAIM_GRACE_SEC)
+    return sorted(spool_dir.glob("*" + SPOOL_SUFFIX + SENDING_SUFFIX))
+
+
+def _claim_dropped(spool_dir: Path) -> tuple[int, list[Path]]:
+    total = 0
+    files = []
+    for counter in spool_dir.glob("*" + DROPPED_SUFFIX):
+        sending = counter.with_name(counter.name + SENDING_SUFFIX)
+        try:
+            if not sending.exists():
+                counter.rename(sending)
+        except OSError:
+            continue
+    for sending in spool_dir.glob("*" + DROPPED_SUFFIX + SENDING_SUFFIX):
+        try:
+            total += sending.stat().st_size
+        except OSError:
+            continue
+        files.append(sending)
+    return total, files
+
+
+def _valid_lines(raw: bytes) -> tuple[list[bytes], int]:
+    """Spool lines worth shipping, plus how many were unusable.
+
+    A torn or oversized line would make the daemon reject its whole batch
+    on every retry, so it is counted as dropped here instead.
+    """
+    lines: list[bytes] = []
+    bad = 0
+    for line in raw.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            ok = len(line) < FLUSH_BATCH_MAX_BYTES and isinstance(json.loads(line), dict)
+        except ValueError:
+            ok = False
+        if ok:
+            lines.append(line)
+        else:
+            bad += 1
+    return lines, bad
+
+
+def _batches(lines: list[bytes]) -> list[list[bytes]]:
+    batches: list[list[bytes]] = [[]]
+    size = 0
+    for line in lines:
+        if batches[-1] and size + len(line) > FLUSH_BATCH_MAX_BYTES:
+            batches.append([])
+            size = 0
+        batches[-1].append(line)
+        size += len(line) + 1
+    return batches
+
+
+def post_bulk(server: str, token: str, lines: list[bytes], dropped: int) -> bool:
+    """POST one batch to `/telemetry/bulk`; True when the daemon took it."""
+    import urllib.parse
+    import urllib.request
+
+    if not server:
+        return False
+    body = _bulk_body(lines, dropped)
+    headers = {"Content-Type": "application/json"}
+    host = urllib.parse.urlsplit(server).netloc
+    if host:
+        headers["Host"] = host
+    if token:
+        headers["Cookie"] = f"clud_dashboard_token={token}"
+    req = urllib.request.Request(
+        server.rstrip("/") + "/telemetry/bulk", data=body, headers=headers, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SEC) as resp:
+            return 200 <= resp.status < 300
+    except Exception:
+        return False
+
+
+def ship(server: str, token: str, sock_path: str, lines: list[bytes], dropped: int) -> bool:
+    """One batch over the telemetry socket when there is one, else HTTP."""
+    return send_socket(sock_path, lines, dropped) or post_bulk(server, token, lines, dropped)
+
+
+def flush_once(
+    spool_dir: Path, server: str, token: str, *, sock_path: str = ""
+) -> tuple[int, bool]:
+    """Ship every claimed spool. Returns `(records_shipped, all_ok)`.
+
+    A batch the daemon rejects stops the pass; the unsent tail is written
+    back to its `.sending` file so the next pass neither loses nor
+    duplicates records.
+    """
+    dropped, dropped_files = _claim_dropped(spool_dir)
+    shipped = 0
+    for sending in _claim(spool_dir):
+        try:
+            raw = sending.read_bytes()
+        except OSError:
+            continue
+        lines, bad = _valid_lines(raw)
+        if bad:
+            # Reported with the next pass's batch, like a hook-side drop.
+            key = sending.name[: -len(SPOOL_SUFFIX + SENDING_SUFFIX)]
+            _append(spool_dir / (key + DROPPED_SUFFIX), b"." * bad)
+        if not lines:
+            sending.unlink(missing_ok=True)
+            continue
+        batches = _batches(lines)
+        for n, batch in enumerate(batches):
+            if not ship(server, token, sock_path, batch, dropped):
+                rest = [line for later in batches[n:] for line in later]
+                sending.write_bytes(b"".join(line + b"\n" for line in rest))
+                return shipped, False
+            shipped += len(batch)
+            if dropped:
+                dropped = 0
+                for counter in dropped_files:
+                    counter.unlink(missing_ok=True)
+        sending.unlink(missing_ok=True)
+    if dropped:
+        # Drops with nothing left to ship still reach the dashboard.
+        if not ship(server, token, sock_path, [], dropped):
+            return shipped, False
+        for counter in dropped_files:
+            counter.unlink(missing_ok=True)
+    return shipped, True
+
+
+def run_flusher(
+    spool_dir: Path,
+    server: str,
+    token: str,
+    *,
+    sock_path: str = "",
+    idle_exit_sec: float = FLUSH_IDLE_EXIT_SEC,
+) -> int:
+    """Flusher loop: hold the lock, ship until idle, exit. Returns records shipped."""
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    lock = _FlushLock(spool_dir)
+    if not lock.acquire():
+        lock.close()
+        return 0  # Another flusher owns the spools.
+    total = 0
+    try:
+        idle_since = time.monotonic()
+        while True:
+            shipped, _ok = flush_once(spool_dir, server, token, sock_path=sock_path)
+            total += shipped
+            if shipped:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= idle_exit_sec:
+                return total
+            time.sleep(FLUSH_POLL_SEC)
+    finally:
+        lock.close()
+
+
+def _server() -> str:
+    server = os.environ.get("CLUD_DAEMON_HTTP_SERVER", "").strip()
+    # Nothing could ever ship to a non-HTTP value; don't spool for it.
+    return server if server.startswith(("http://", "https://")) else ""
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        if argv[:1] == ["--flush"]:
+            spool_dir = Path(argv[1]) if len(argv) > 1 else _spool_dir()
+            server, token, sock_path = _flush_target(spool_dir)
+            if server or sock_path:
+                run_flusher(spool_dir, server, token, sock_path=sock_path)
+            return 0
+
+        server = _server()
+        sock_path = os.environ.get(SOCKET_ENV, "").strip()
+        if not server and not sock_path:
             return 0  # No daemon configured. Silent no-op.
 
         raw = _read_stdin_bounded()
@@ -157,28 +572,17 @@ def main() -> int:
             payload = json.loads(raw)
         except Exception:
             return 0  # Malformed hook payload — nothing actionable.
+        if not isinstance(payload, dict):
+            return 0
 
-        body = {
-            "parent_pid": os.getppid(),
-            "time_ms": int(time.time() * 1000),
-            "cmd": _cmd_summary(payload),
-            # Hook payload's `cwd` reflects Claude Code's cwd at fire
-            # time; fall back to ours when absent.
-            "cwd": payload.get("cwd") or os.getcwd(),
-            # Every CLUD_* env var, verbatim. Callers can use this as a
-            # tagging mechanism (e.g. CLUD_SESSION_ID, CLUD_TASK, ...).
-            "env": {k: v for k, v in os.environ.items() if k.startswith("CLUD_")},
-        }
-
-        url = server.rstrip("/") + "/telemetry/log"
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(body).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SEC):
-            pass
+        record = build_record(payload)
+        # Fast path: one frame on the daemon's local socket, no spool.
+        if send_socket(sock_path, [encode_record(record)], 0):
+            return 0
+        spool_dir = _spool_dir()
+        spool_record(spool_dir, _session_key(payload), record)
+        if not flusher_running(spool_dir):
+            _spawn_flusher(spool_dir, server, os.environ.get(TOKEN_ENV, ""), sock_path)
     except Exception:
         # Swallow EVERYTHING. The only contract is "exit 0".
         pass
@@ -33,6 +33,18 @@ etc.) the referenced script is read and grepped for the same anti-
 pattern, so a hook that wraps the offender through a shell file gets
 flagged too.
 
+`--workspace DIR` scans many checkouts in one run: DIR itself when it
+is a git checkout, every git checkout directly under it, and each
+agent worktree under `.claude/worktrees/`. Repos are scanned in
+parallel and all warnings share the single 3-second pause.
+
+Results are cached in `~/.clud/cache/uv_run_hook_guard.json` (override
+with `CLUD_UV_RUN_HOOK_GUARD_CACHE`; `--no-cache` bypasses it). An
+entry is keyed by the mtime and size of every file the scan read — the
+gate's `Cargo.toml` and `pyproject.toml`, the three hook configs, each
+followed script, and this scanner itself — so a repo whose inputs are
+unchanged is answered without re-reading any of them.
+
 Invoked via `clud tool run hooks/uv_run_hook_guard.py` so UV_CACHE_DIR
 is pinned to ~/.clud/cache/uv (issue #408 three-layer enforcement) and
 managed install lifecycle preserves user edits.
@@ -40,14 +52,18 @@ managed install lifecycle preserves user edits.
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+
 # ANSI escape sequences. Yellow for the warning, reset to clear.
 # `NO_COLOR` env var (de-facto cross-CLI standard) disables.
 def _ansi(seq: str) -> str:
@@ -75,6 +91,17 @@ SCANNED_EVENTS = ("PreToolUse", "PostToolUse")
 # uv run internally via subprocess).
 FOLLOWABLE_SCRIPT_EXTS = {".sh", ".bash", ".cmd", ".bat", ".ps1", ".py"}
 
+# Result cache. Bump the version when the entry layout changes; edits
+# to the scanning rules are covered by fingerprinting this file itself.
+CACHE_ENV = "CLUD_UV_RUN_HOOK_GUARD_CACHE"
+CACHE_VERSION = 1
+# A file modified this recently may change again within the same mtime
+# tick at the same size, so a scan that read one is not cached.
+CACHE_RACY_WINDOW_SEC = 2.0
+
+# Scans are file reads; more threads than this stop helping.
+MAX_WORKSPACE_JOBS = 16
+
 
 @dataclass(frozen=True)
 class Offender:
@@ -97,6 +124,26 @@ class Offender:
             f"  fix:     add `--no-project`, `--no-sync`, or `--frozen` to the uv run\n"
         )
 
+    def to_json(self) -> dict:
+        return {
+            "config_path": str(self.config_path),
+            "event": self.event,
+            "matcher": self.matcher,
+            "command": self.command,
+            "indirect_via": str(self.indirect_via) if self.indirect_via else None,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> Offender:
+        via = data.get("indirect_via")
+        return cls(
+            config_path=Path(data["config_path"]),
+            event=str(data["event"]),
+            matcher=str(data["matcher"]),
+            command=str(data["command"]),
+            indirect_via=Path(via) if via else None,
+        )
+
 
 def _repo_qualifies(repo_root: Path) -> bool:
     """Gate: scan only when the repo is a Python+Rust polyglot with a build backend."""
@@ -177,8 +224,8 @@ def _has_bare_uv_run(command: str) -> bool:
     return True
 
 
-def _resolve_referenced_script(command: str, repo_root: Path) -> Path | None:
-    """If the hook command starts with a local repo script, return its path."""
+def _referenced_script_candidate(command: str, repo_root: Path) -> Path | None:
+    """The in-repo script path the hook command would run, existing or not."""
     tokens = command.split()
     if not tokens:
         return None
@@ -203,13 +250,19 @@ def _resolve_referenced_script(command: str, repo_root: Path) -> Path | None:
         target.relative_to(repo_root.resolve())
     except ValueError:
         return None
-    if not target.is_file():
-        return None
     if target.suffix.lower() not in FOLLOWABLE_SCRIPT_EXTS:
         return None
     return target
 
 
+def _resolve_referenced_script(command: str, repo_root: Path) -> Path | None:
+    """If the hook command starts with a local repo script, return its path."""
+    target = _referenced_script_candidate(command, repo_root)
+    if target is None or not target.is_file():
+        return None
+    return target
+
+
 def _scan_referenced_script(
     script_path: Path,
 ) -> list[str]:
@@ -230,14 +283,21 @@ def _scan_referenced_script(
 
 def scan(repo_root: Path) -> list[Offender]:
     """Run the full scan, returning every offender found."""
+    return _scan_with_inputs(repo_root)[0]
+
+
+def _scan_with_inputs(repo_root: Path) -> tuple[list[Offender], list[Path]]:
+    """`scan`, plus every path whose contents (or absence) decided the result."""
+    inputs = [repo_root / "Cargo.toml", repo_root / "pyproject.toml"]
     if not _repo_qualifies(repo_root):
-        return []
+        return [], inputs
 
     configs: list[tuple[Path, str]] = [
         (repo_root / ".claude" / "settings.json", "claude"),
         (repo_root / ".claude" / "settings.local.json", "claude"),
         (repo_root / ".codex" / "hooks.json", "codex"),
     ]
+    inputs.extend(config_path for config_path, _ in configs)
 
     offenders: list[Offender] = []
     for config_path, kind in configs:
@@ -260,6 +320,11 @@ def scan(repo_root: Path) -> list[Offender]:
                 continue
             # The hook doesn't directly call uv run, but it might
             # wrap a local script that does. Dereference one level.
+            # A script that doesn't exist yet is still an input: creating
+            # it must invalidate a cached clean result.
+            candidate = _referenced_script_candidate(command, repo_root)
+            if candidate is not None:
+                inputs.append(candidate)
             target = _resolve_referenced_script(command, repo_root)
             if target is None:
                 continue
@@ -273,14 +338,156 @@ def scan(repo_root: Path) -> list[Offender]:
                         indirect_via=target,
                     )
                 )
-    return offenders
+    return offenders, inputs
+
+
+def _fingerprint(paths: list[Path]) -> dict[str, list[int] | None]:
+    """`[mtime_ns, size]` per path, None for a path that doesn't exist."""
+    out: dict[str, list[int] | None] = {}
+    for path in [Path(__file__), *paths]:
+        try:
+            st = path.stat()
+        except OSError:
+            out[str(path)] = None
+            continue
+        out[str(path)] = [st.st_mtime_ns, st.st_size]
+    return out
+
+
+def _is_racy(fingerprint: dict[str, list[int] | None]) -> bool:
+    cutoff = time.time_ns() - int(CACHE_RACY_WINDOW_SEC * 1e9)
+    return any(stamp is not None and stamp[0] >= cutoff for stamp in fingerprint.values())
+
+
+def cache_path() -> Path:
+    override = os.environ.get(CACHE_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".clud" / "cache" / "uv_run_hook_guard.json"
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    """The cached entries by repo root; an unreadable cache is empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    repos = data.get("repos")
+    return repos if isinstance(repos, dict) else {}
+
+
+def save_cache(path: Path, updates: dict[str, dict]) -> None:
+    """Merge `updates` into the cache file atomically. Best-effort."""
+    if not updates:
+        return
+    # Re-read so a concurrent run's entries for other repos survive.
+    repos = {**load_cache(path), **updates}
+    body = json.dumps({"version": CACHE_VERSION, "repos": repos}, sort_keys=True)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def scan_cached(repo_root: Path, cache: dict[str, dict]) -> tuple[list[Offender], dict | None]:
+    """`scan`, answered from `cache` when no input changed.
+
+    Returns the offenders and the entry to store for `repo_root`, or None
+    when the cache already holds it (or the scan read a racy file).
+    """
+    entry = cache.get(str(repo_root))
+    if isinstance(entry, dict):
+        inputs = entry.get("inputs")
+        if isinstance(inputs, dict) and _fingerprint([Path(p) for p in inputs]) == inputs:
+            try:
+                return [Offender.from_json(o) for o in entry.get("offenders", [])], None
+            except (KeyError, TypeError):
+                pass
+    offenders, paths = _scan_with_inputs(repo_root)
+    fingerprint = _fingerprint(paths)
+    if _is_racy(fingerprint):
+        return offenders, None
+    return offenders, {"inputs": fingerprint, "offenders": [o.to_json() for o in offenders]}
+
+
+def _subdirs(directory: Path) -> list[Path]:
+    try:
+        return sorted(p for p in directory.iterdir() if p.is_dir())
+    except OSError:
+        return []
+
+
+def workspace_repos(workspace: Path) -> list[Path]:
+    """Git checkouts in `workspace`: itself, its children, and their agent worktrees."""
+    checkouts = [workspace, *_subdirs(workspace)]
+    for checkout in list(checkouts):
+        checkouts.extend(_subdirs(checkout / ".claude" / "worktrees"))
+    repos: list[Path] = []
+    for checkout in checkouts:
+        resolved = checkout.resolve()
+        if resolved not in repos and (checkout / ".git").exists():
+            repos.append(resolved)
+    return repos
+
+
+def scan_many(
+    repo_roots: list[Path], *, use_cache: bool = True, jobs: int | None = None
+) -> list[Offender]:
+    """Scan every repo in parallel, in input order, through the result cache."""
+    cache_file = cache_path()
+    cache = load_cache(cache_file) if use_cache else {}
+    workers = max(1, min(jobs or MAX_WORKSPACE_JOBS, len(repo_roots)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda root: scan_cached(root, cache), repo_roots))
+    if use_cache:
+        updates = {
+            str(root): entry
+            for root, (_, entry) in zip(repo_roots, results, strict=True)
+            if entry is not None
+        }
+        save_cache(cache_file, updates)
+    return [offender for offenders, _ in results for offender in offenders]
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="uv_run_hook_guard.py",
+        description="Warn on bare `uv run` in agent hooks of Python+Rust repos.",
+    )
+    # Defaults to CWD so the clud-side caller doesn't have to compute it.
+    parser.add_argument("repos", nargs="*", type=Path, help="repo roots (default: cwd)")
+    parser.add_argument(
+        "--workspace",
+        action="append",
+        default=[],
+        type=Path,
+        metavar="DIR",
+        help="also scan every git checkout and agent worktree in DIR (repeatable)",
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="parallel scans")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the result cache")
+    return parser.parse_args(argv)
 
 
 def main(argv: list[str]) -> int:
-    # Single optional arg: the repo root. Defaults to CWD so the
-    # clud-side caller doesn't have to compute it.
-    repo_root = Path(argv[1]).resolve() if len(argv) > 1 else Path.cwd().resolve()
-    offenders = scan(repo_root)
+    args = _parse_args(argv[1:])
+    repo_roots = [repo.resolve() for repo in args.repos]
+    for workspace in args.workspace:
+        repo_roots.extend(workspace_repos(workspace.resolve()))
+    if not repo_roots and not args.workspace:
+        repo_roots = [Path.cwd().resolve()]
+    repo_roots = list(dict.fromkeys(repo_roots))
+    offenders = scan_many(repo_roots, use_cache=not args.no_cache, jobs=args.jobs)
     if not offenders:
         return 0
     sys.stderr.write(
@@ -1,3 +1,7 @@
 fn main() {
+    let args: Vec<String> = std::env::args().skip(1).collect();
+    if args.first().map(String::as_str) == Some("--serve") {
+        std::process::exit(clud::block_bad_cmd::serve_main(&args[1..]));
+    }
     std::process::exit(clud::block_bad_cmd::run());
 }
@@ -207,29 +207,74 @@ struct StdinRead {
     log_messages: Vec<String>,
 }
 
+/// What one hook fire writes and returns. Built by [`evaluate_hook`] so
+/// the one-shot binary and the resident `--serve` mode answer identically.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct HookOutcome {
+    pub stdout: String,
+    pub stderr: String,
+    pub exit_code: i32,
+}
+
+impl HookOutcome {
+    fn out(&mut self, line: impl std::fmt::Display) {
+        self.stdout.push_str(&format!("{line}\n"));
+    }
+
+    fn err(&mut self, line: impl std::fmt::Display) {
+        self.stderr.push_str(&format!("{line}\n"));
+    }
+
+    fn deny(mut self, json: Value, message: impl std::fmt::Display) -> Self {
+        self.out(json);
+        self.err(message);
+        self.exit_code = 2;
+        self
+    }
+}
+
 pub fn run() -> i32 {
     let stdin = read_stdin_bounded();
     for message in &stdin.log_messages {
         append_log(message);
     }
-    append_log(&format!("raw_stdin_bytes={}", stdin.text.len()));
+    let cwd = std::env::current_dir().unwrap_or_else(|_| PathBuf::from("."));
+    let allow_hybrid_uv_run = std::env::var("CLUD_UV_RUST_ALLOW_ALL").ok().as_deref() == Some("1");
+    let outcome = evaluate_hook(&stdin.text, &cwd, allow_hybrid_uv_run);
+    print!("{}", outcome.stdout);
+    eprint!("{}", outcome.stderr);
+    outcome.exit_code
+}
 
-    let payload: Value = match serde_json::from_str(if stdin.text.trim().is_empty() {
+/// Decide one hook fire from its raw stdin. `process_cwd` stands in for
+/// the payload's `cwd` when it has none, and `allow_hybrid_uv_run` is
+/// `CLUD_UV_RUST_ALLOW_ALL=1` as seen by the caller. The
+/// `CLUD_BAD_CMD_OVERRIDE` escape hatch is still read from this process's
+/// environment, which is why the resident client never forwards a call
+/// that sets it.
+pub fn evaluate_hook(
+    stdin_text: &str,
+    process_cwd: &Path,
+    allow_hybrid_uv_run: bool,
+) -> HookOutcome {
+    let mut outcome = HookOutcome::default();
+    append_log(&format!("raw_stdin_bytes={}", stdin_text.len()));
+
+    let payload: Value = match serde_json::from_str(if stdin_text.trim().is_empty() {
         "{}"
     } else {
-        &stdin.text
+        stdin_text
     }) {
         Ok(value) => value,
         Err(error) => {
             append_log(&format!("json_decode_error: {error}"));
-            return 0;
+            return outcome;
         }
     };
 
-    let cwd = std::env::current_dir().unwrap_or_else(|_| PathBuf::from("."));
-    let Some(payload) = parse_payload_value(&payload, &cwd) else {
+    let Some(payload) = parse_payload_value(&payload, process_cwd) else {
         append_log("unsupported_payload_shape");
-        return 0;
+        return outcome;
     };
     append_log(&format!(
         "tool_name={:?} cwd={:?} command={:?}",
@@ -241,7 +286,6 @@ pub fn run() -> i32 {
     let config =
         crate::repo_clud_config::discover_effective_clud_config(&payload.cwd).unwrap_or_default();
 
-    let allow_hybrid_uv_run = std::env::var("CLUD_UV_RUST_ALLOW_ALL").ok().as_deref() == Some("1");
     // zackees/clud#532: the repo-root lookup below shells out to `git`, so
     // it's gated on a cheap substring check — this hook fires on every
     // single Bash tool call, and the vast majority never mention `clone` or
@@ -272,7 +316,7 @@ pub fn run() -> i32 {
         append_log(message);
     }
     for warning in &evaluation.warnings {
-        eprintln!("{warning}");
+        outcome.err(warning);
     }
 
     // #967 Phase 1: session cwd pinning. Runs after the command rules so a
@@ -298,41 +342,36 @@ pub fn run() -> i32 {
         if let Some(provenance) = &evaluation.denial_provenance {
             log_bad_cmd_denied(provenance, &payload);
         }
-        println!("{}", deny_json(&reason));
-        eprintln!("{msg}");
-        return 2;
+        return outcome.deny(deny_json(&reason), msg);
     }
 
     if let Some(rewritten_command) = &evaluation.rewritten_command {
         let Some(mut updated_input) = payload.tool_input.clone() else {
             let reason = "Blocked unsafe removal: the hook payload did not contain an object-shaped tool_input to rewrite safely. Retry using a validated literal path directly.";
-            println!("{}", deny_json(reason));
-            eprintln!(
+            let msg = format!(
                 "[block-bad-cmd hook] refusing to run {:?}: {reason}",
                 payload.tool_name
             );
-            return 2;
+            return outcome.deny(deny_json(reason), msg);
         };
         let Some(input) = updated_input.as_object_mut() else {
             let reason = "Blocked unsafe removal: the hook payload did not contain an object-shaped tool_input to rewrite safely. Retry using a validated literal path directly.";
-            println!("{}", deny_json(reason));
-            eprintln!(
+            let msg = format!(
                 "[block-bad-cmd hook] refusing to run {:?}: {reason}",
                 payload.tool_name
             );
-            return 2;
+            return outcome.deny(deny_json(reason), msg);
         };
         let Some(command) = input.get_mut("command").filter(|value| value.is_string()) else {
             let reason = "Blocked unsafe removal: tool_input.command was missing or not a string, so the hook could not rewrite it safely. Retry using a validated literal path directly.";
-            println!("{}", deny_json(reason));
-            eprintln!(
+            let msg = format!(
                 "[block-bad-cmd hook] refusing to run {:?}: {reason}",
                 payload.tool_name
             );
-            return 2;
+            return outcome.deny(deny_json(reason), msg);
         };
         *command = Value::String(rewritten_command.clone());
-        println!("{}", allow_with_updated_input_json(updated_input));
+        outcome.out(allow_with_updated_input_json(updated_input));
     }
 
     // zackees/clud#532: the command is actually going to run, so any git
@@ -345,7 +384,7 @@ pub fn run() -> i32 {
     }
 
     append_log("allowed");
-    0
+    outcome
 }
 
 /// Resolve `bash.block_cd` and decide whether this command's
@@ -2237,6 +2276,10 @@ fn py_string_repr(value: &str) -> String {
 mod block_bad_cmd_io;
 use block_bad_cmd_io::*;
 
+#[path = "block_bad_cmd_serve.rs"]
+mod block_bad_cmd_serve;
+pub use block_bad_cmd_serve::serve_main;
+
 fn home_dir() -> Option<PathBuf> {
     #[cfg(windows)]
     {
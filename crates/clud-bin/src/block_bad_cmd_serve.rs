@@ -0,0 +1,244 @@
+//! Resident decision server: `clud-block-bad-cmd --serve <socket>`.
+//!
+//! The compatibility shim `hooks/block-bad-cmd.py` normally pays two
+//! process launches per Bash tool call — Python, then this binary. With
+//! `CLUD_BLOCK_BAD_CMD_RESIDENT=1` it instead sends the payload to one
+//! long-lived server per user and binary build, and relays the verdict.
+//!
+//! Protocol, one exchange per connection:
+//!
+//! - request: one line of JSON, `{"stdin": <raw hook stdin>, "cwd": <the
+//!   hook's cwd>, "allow_hybrid_uv_run": <CLUD_UV_RUST_ALLOW_ALL=1>}`;
+//! - reply: one line, `{"stdout", "stderr", "exit_code"}` exactly as the
+//!   one-shot binary would have written and returned, or `{"error"}`.
+//!
+//! Every request goes through [`evaluate_hook`], so repo config and
+//! global settings are re-read per call just like a one-shot run. The
+//! socket is `0600`. A `<socket>.lock` flock makes the first server the
+//! only one; a second `--serve` for the same path exits 0. The server
+//! exits after [`DEFAULT_IDLE_EXIT`] without requests, or as soon as its
+//! socket file is removed or replaced. Unix only.
+
+use super::*;
+
+/// How long a resident server waits for its next request before exiting.
+const DEFAULT_IDLE_EXIT: Duration = Duration::from_secs(600);
+/// Cap on one request line: the hook's own stdin cap, JSON-escaped.
+#[cfg_attr(not(unix), allow(dead_code))]
+const MAX_REQUEST_BYTES: u64 = 4 * STDIN_READ_MAX_BYTES as u64;
+/// A client that stalls mid-request must not pin a server thread.
+#[cfg_attr(not(unix), allow(dead_code))]
+const REQUEST_READ_TIMEOUT: Duration = Duration::from_secs(5);
+
+#[cfg_attr(not(unix), allow(dead_code))]
+#[derive(Debug, serde::Deserialize)]
+struct ServeRequest {
+    stdin: String,
+    cwd: PathBuf,
+    #[serde(default)]
+    allow_hybrid_uv_run: bool,
+}
+
+/// Entry point for `clud-block-bad-cmd --serve <socket> [--idle-exit-sec N]`.
+pub fn serve_main(args: &[String]) -> i32 {
+    let Some(socket) = args.first() else {
+        eprintln!("usage: clud-block-bad-cmd --serve <socket> [--idle-exit-sec N]");
+        return 2;
+    };
+    let idle_exit = match args.get(1).map(String::as_str) {
+        Some("--idle-exit-sec") => match args.get(2).and_then(|raw| raw.parse::<f64>().ok()) {
+            Some(seconds) if seconds > 0.0 && seconds.is_finite() => {
+                Duration::from_secs_f64(seconds)
+            }
+            _ => {
+                eprintln!("--idle-exit-sec needs a positive number of seconds");
+                return 2;
+            }
+        },
+        Some(other) => {
+            eprintln!("unexpected argument {other:?}");
+            return 2;
+        }
+        None => DEFAULT_IDLE_EXIT,
+    };
+    match serve(Path::new(socket), idle_exit) {
+        Ok(()) => 0,
+        Err(error) => {
+            append_log(&format!("serve_failed socket={socket:?} error={error}"));
+            eprintln!("[block-bad-cmd] cannot serve on {socket}: {error}");
+            1
+        }
+    }
+}
+
+#[cfg(not(unix))]
+fn serve(_socket: &Path, _idle_exit: Duration) -> io::Result<()> {
+    Err(io::Error::new(
+        io::ErrorKind::Unsupported,
+        "the resident server needs unix sockets",
+    ))
+}
+
+#[cfg(unix)]
+fn serve(socket: &Path, idle_exit: Duration) -> io::Result<()> {
+    use std::os::fd::AsRawFd;
+    use std::os::unix::fs::{MetadataExt, PermissionsExt};
+    use std::os::unix::net::UnixListener;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+    use std::sync::{Arc, Mutex};
+
+    /// Upper bound on how late an idle exit or a replaced socket is noticed.
+    const POLL_INTERVAL_MS: libc::c_int = 1000;
+
+    if let Some(parent) = socket.parent() {
+        std::fs::create_dir_all(parent)?;
+    }
+    let lock = OpenOptions::new()
+        .create(true)
+        .truncate(false)
+        .write(true)
+        .open(socket.with_extension("lock"))?;
+    if unsafe { libc::flock(lock.as_raw_fd(), libc::LOCK_EX | libc::LOCK_NB) } != 0 {
+        // Another server already owns this socket.
+        return Ok(());
+    }
+    let _ = std::fs::remove_file(socket);
+    let listener = UnixListener::bind(socket)?;
+    std::fs::set_permissions(socket, std::fs::Permissions::from_mode(0o600))?;
+    listener.set_nonblocking(true)?;
+    let inode = std::fs::metadata(socket)?.ino();
+    append_log(&format!("serve_started socket={socket:?}"));
+
+    let last_request = Arc::new(Mutex::new(Instant::now()));
+    let in_flight = Arc::new(AtomicUsize::new(0));
+    loop {
+        let mut poll_fd = libc::pollfd {
+            fd: listener.as_raw_fd(),
+            events: libc::POLLIN,
+            revents: 0,
+        };
+        if unsafe { libc::poll(&mut poll_fd, 1, POLL_INTERVAL_MS) } > 0 {
+            match listener.accept() {
+                Ok((stream, _)) => {
+                    stream.set_nonblocking(false)?;
+                    in_flight.fetch_add(1, Ordering::SeqCst);
+                    let last_request = Arc::clone(&last_request);
+                    let in_flight = Arc::clone(&in_flight);
+                    std::thread::spawn(move || {
+                        let _ = answer(stream);
+                        *last_request.lock().expect("serve clock poisoned") = Instant::now();
+                        in_flight.fetch_sub(1, Ordering::SeqCst);
+                    });
+                    continue;
+                }
+                Err(error) if error.kind() == io::ErrorKind::WouldBlock => {}
+                Err(error) => append_log(&format!("serve_accept_error error={error}")),
+            }
+        }
+        let replaced = std::fs::metadata(socket).map(|m| m.ino()).ok() != Some(inode);
+        let idle = in_flight.load(Ordering::SeqCst) == 0
+            && last_request.lock().expect("serve clock poisoned").elapsed() >= idle_exit;
+        if replaced || idle {
+            if !replaced {
+                let _ = std::fs::remove_file(socket);
+            }
+            append_log(&format!("serve_exit socket={socket:?} replaced={replaced}"));
+            return Ok(());
+        }
+    }
+}
+
+#[cfg(unix)]
+fn answer(stream: std::os::unix::net::UnixStream) -> io::Result<()> {
+    use std::io::BufRead;
+
+    stream.set_read_timeout(Some(REQUEST_READ_TIMEOUT))?;
+    let mut writer = stream.try_clone()?;
+    let mut line = Vec::new();
+    io::BufReader::new(stream)
+        .take(MAX_REQUEST_BYTES)
+        .read_until(b'\n', &mut line)?;
+    writer.write_all(reply_for(&line).as_bytes())
+}
+
+/// The reply line for one raw request line. Pure apart from the hook's
+/// own log appends, so the protocol is testable without a socket.
+#[cfg_attr(not(unix), allow(dead_code))]
+fn reply_for(request: &[u8]) -> String {
+    let reply = match serde_json::from_slice::<ServeRequest>(request) {
+        Ok(request) => {
+            let outcome = evaluate_hook(&request.stdin, &request.cwd, request.allow_hybrid_uv_run);
+            json!({
+                "stdout": outcome.stdout,
+                "stderr": outcome.stderr,
+                "exit_code": outcome.exit_code,
+            })
+        }
+        Err(error) => json!({ "error": format!("invalid request: {error}") }),
+    };
+    format!("{reply}\n")
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn reply_matches_the_one_shot_outcome() {
+        let cwd = std::env::temp_dir();
+        let stdin = json!({
+            "tool_name": "Bash",
+            "tool_input": { "command": concat!("bad", " cmd") },
+        })
+        .to_string();
+        let request = json!({ "stdin": stdin, "cwd": cwd }).to_string();
+
+        let reply: Value = serde_json::from_str(&reply_for(request.as_bytes())).unwrap();
+        let outcome = evaluate_hook(&stdin, &cwd, false);
+        assert_eq!(outcome.exit_code, 2);
+        assert_eq!(reply["exit_code"], outcome.exit_code);
+        assert_eq!(reply["stdout"], outcome.stdout);
+        assert_eq!(reply["stderr"], outcome.stderr);
+    }
+
+    #[test]
+    fn malformed_requests_get_an_error_not_a_verdict() {
+        let reply: Value = serde_json::from_str(&reply_for(b"{\"stdin\": 3}\n")).unwrap();
+        assert!(reply["error"].as_str().unwrap().starts_with("invalid request"));
+        assert!(reply.get("exit_code").is_none());
+    }
+
+    #[test]
+    fn serve_args_are_validated() {
+        assert_eq!(serve_main(&[]), 2);
+        let args = ["/tmp/x.sock", "--idle-exit-sec", "0"].map(String::from);
+        assert_eq!(serve_main(&args), 2);
+        let args = ["/tmp/x.sock", "--bogus"].map(String::from);
+        assert_eq!(serve_main(&args), 2);
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn a_second_server_for_the_same_socket_exits_immediately() {
+        use std::io::BufRead;
+        use std::os::unix::net::UnixStream;
+
+        let dir = tempfile::tempdir().unwrap();
+        let socket = dir.path().join("bbc.sock");
+        let first = socket.clone();
+        std::thread::spawn(move || serve(&first, Duration::from_secs(30)));
+        let deadline = Instant::now() + Duration::from_secs(5);
+        while !socket.exists() && Instant::now() < deadline {
+            std::thread::sleep(Duration::from_millis(10));
+        }
+        assert!(serve(&socket, Duration::from_secs(30)).is_ok());
+
+        let mut stream = UnixStream::connect(&socket).unwrap();
+        let request = json!({ "stdin": "{}", "cwd": dir.path() });
+        stream.write_all(format!("{request}\n").as_bytes()).unwrap();
+        let mut reply = String::new();
+        io::BufReader::new(stream).read_line(&mut reply).unwrap();
+        let reply: Value = serde_json::from_str(&reply).unwrap();
+        assert_eq!(reply["exit_code"], 0);
+    }
+}
@@ -42,8 +42,8 @@ use crate::session_registry::LiveSession;
 #[path = "http_response.rs"]
 mod http_response;
 use http_response::{
-    find_body_start, json_error_bytes, read_body, respond_capability_bootstrap, respond_html,
-    respond_json, respond_text,
+    find_body_start, json_error_bytes, read_body, read_body_limited, respond_capability_bootstrap,
+    respond_html, respond_json, respond_text,
 };
 
 /// Supplier of live session-registry rows. Injected at the dashboard
@@ -101,6 +101,11 @@ const DASHBOARD_HTML: &str = include_str!("../../assets/dashboard/index.html");
 /// daemon. The purge payload is two short JSON fields; 16 KiB is generous.
 const MAX_REQUEST_BODY_BYTES: usize = 16 * 1024;
 
+/// Cap on a `POST /telemetry/bulk` body. The hook-side flusher batches up
+/// to a few hundred spooled records per request, so it needs more room
+/// than the single-record routes.
+pub(super) const MAX_BULK_BODY_BYTES: usize = 1024 * 1024;
+
 /// Issue #469 (beta): per-PID cap on telemetry entries. A runaway logger
 /// can't grow this past N — oldest entries get dropped first.
 const TELEMETRY_PER_PID_CAP: usize = 500;
@@ -130,6 +135,45 @@ pub struct TelemetryIngest {
     pub env: BTreeMap<String, String>,
 }
 
+/// `POST /telemetry/bulk` body — a batch of spooled records shipped by the
+/// `hooks/telemetry.py` flusher, plus how many records the hook dropped
+/// since the last batch (spool over its size cap).
+#[derive(Debug, Clone, Deserialize)]
+pub struct TelemetryBulkIngest {
+    pub entries: Vec<TelemetryIngest>,
+    #[serde(default)]
+    pub dropped: u64,
+}
+
+/// Which route a telemetry ingest arrived on. Counted separately in
+/// [`TelemetryIngestStats`] so the dashboard shows how much traffic takes
+/// the local-socket fast path versus HTTP.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum TelemetryLane {
+    /// `POST /telemetry/log` — one record per request.
+    Http,
+    /// `POST /telemetry/bulk` — a spool batch.
+    HttpBulk,
+    /// One frame on the daemon's telemetry socket.
+    Socket,
+}
+
+/// Ingest counters returned by `GET /telemetry/stats`. `lag_ms_*` is the
+/// age of the oldest record in a request when it reached the daemon —
+/// how far the spool flusher is behind the hooks feeding it.
+#[derive(Debug, Clone, Default, Serialize, Deserialize)]
+pub struct TelemetryIngestStats {
+    pub requests: u64,
+    pub bulk_requests: u64,
+    #[serde(default)]
+    pub socket_requests: u64,
+    pub entries: u64,
+    pub dropped: u64,
+    pub lag_ms_last: u64,
+    pub lag_ms_max: u64,
+    pub last_at_ms: u64,
+}
+
 /// Compact per-PID view returned inside `/state.json` — totals only, so
 /// the polled summary stays bounded regardless of entry count. The
 /// per-entry detail (with envs) lives behind `/telemetry/by-pid/<pid>`.
@@ -158,6 +202,7 @@ pub struct TelemetryStore {
 #[derive(Debug, Default)]
 struct TelemetryStoreInner {
     by_pid: HashMap<u32, VecDeque<TelemetryEntry>>,
+    stats: TelemetryIngestStats,
 }
 
 impl TelemetryStore {
@@ -176,6 +221,67 @@ impl TelemetryStore {
         }
     }
 
+    /// Account for one ingest request: `entries` records received,
+    /// `dropped` records the sender lost before shipping, and the oldest
+    /// record's `time_ms` for the lag gauge.
+    pub fn record_ingest(
+        &self,
+        lane: TelemetryLane,
+        entries: usize,
+        dropped: u64,
+        oldest_time_ms: u64,
+        received_at_ms: u64,
+    ) {
+        let mut guard = self.inner.lock().expect("telemetry store poisoned");
+        let stats = &mut guard.stats;
+        stats.requests += 1;
+        match lane {
+            TelemetryLane::Http => {}
+            TelemetryLane::HttpBulk => stats.bulk_requests += 1,
+            TelemetryLane::Socket => stats.socket_requests += 1,
+        }
+        stats.entries += entries as u64;
+        stats.dropped += dropped;
+        if entries > 0 {
+            let lag = received_at_ms.saturating_sub(oldest_time_ms);
+            stats.lag_ms_last = lag;
+            stats.lag_ms_max = stats.lag_ms_max.max(lag);
+        }
+        stats.last_at_ms = received_at_ms;
+    }
+
+    /// Store one bulk envelope and account for it. Shared by
+    /// `POST /telemetry/bulk` and the telemetry socket so both lanes feed
+    /// the same ring buffers and counters. Returns the records accepted.
+    pub fn ingest_bulk(&self, payload: TelemetryBulkIngest, lane: TelemetryLane) -> usize {
+        let received_at_ms = current_unix_millis();
+        let accepted = payload.entries.len();
+        let oldest = payload
+            .entries
+            .iter()
+            .map(|e| e.time_ms)
+            .min()
+            .unwrap_or(received_at_ms);
+        self.record_ingest(lane, accepted, payload.dropped, oldest, received_at_ms);
+        for entry in payload.entries {
+            self.push(TelemetryEntry {
+                parent_pid: entry.parent_pid,
+                time_ms: entry.time_ms,
+                received_at_ms,
+                cmd: entry.cmd,
+                cwd: entry.cwd,
+                env: entry.env,
+            });
+        }
+        accepted
+    }
+
+    /// Snapshot of the ingest counters.
+    pub fn stats(&self) -> TelemetryIngestStats {
+        let guard = self.inner.lock().expect("telemetry store poisoned");
+        guard.stats.clone()
+    }
+
     /// Per-PID summary keyed by parent_pid, sorted by last activity desc.
     pub fn summary(&self) -> Vec<TelemetryPidSummary> {
         let guard = self.inner.lock().expect("telemetry store poisoned");
@@ -653,6 +759,9 @@ fn run_dashboard_loop(
             (Method::Get, "/telemetry") => {
                 handle_telemetry_summary(request, &stores.telemetry);
             }
+            (Method::Get, "/telemetry/stats") => {
+                handle_telemetry_stats(request, &stores.telemetry);
+            }
             (Method::Get, "/tools") => {
                 handle_tools_summary(request, &stores.tool_telemetry);
             }
@@ -662,6 +771,9 @@ fn run_dashboard_loop(
             (Method::Post, "/telemetry/log") => {
                 handle_telemetry_log(request, &stores.telemetry);
             }
+            (Method::Post, "/telemetry/bulk") => {
+                handle_telemetry_bulk(request, &stores.telemetry);
+            }
             (Method::Post, "/tools/event") => {
                 handle_tool_event(request, &stores.tool_telemetry);
             }
@@ -798,21 +910,58 @@ fn handle_telemetry_log(mut request: Request, telemetry: &TelemetryStore) {
             return;
         }
     };
-    let received_at_ms = SystemTime::now()
-        .duration_since(UNIX_EPOCH)
-        .map(|d| d.as_millis() as u64)
-        .unwrap_or(0);
-    telemetry.push(TelemetryEntry {
-        parent_pid: payload.parent_pid,
-        time_ms: payload.time_ms,
-        received_at_ms,
-        cmd: payload.cmd,
-        cwd: payload.cwd,
-        env: payload.env,
-    });
+    telemetry.ingest_bulk(
+        TelemetryBulkIngest {
+            entries: vec![payload],
+            dropped: 0,
+        },
+        TelemetryLane::Http,
+    );
     respond_json(request, 200, b"{}");
 }
 
+/// `POST /telemetry/bulk` — one batch from the spool flusher. Same
+/// validation as `/telemetry/log`: the whole batch is rejected on a
+/// parse error so the flusher keeps the spool and retries.
+fn handle_telemetry_bulk(mut request: Request, telemetry: &TelemetryStore) {
+    let body = match read_body_limited(&mut request, MAX_BULK_BODY_BYTES) {
+        Ok(b) => b,
+        Err(err) => {
+            respond_json(
+                request,
+                400,
+                json_error_bytes(&format!("read body failed: {err}")).as_slice(),
+            );
+            return;
+        }
+    };
+    let payload: TelemetryBulkIngest = match serde_json::from_slice(&body) {
+        Ok(p) => p,
+        Err(err) => {
+            respond_json(
+                request,
+                400,
+                json_error_bytes(&format!("invalid JSON: {err}")).as_slice(),
+            );
+            return;
+        }
+    };
+    let accepted = telemetry.ingest_bulk(payload, TelemetryLane::HttpBulk);
+    let ack = serde_json::json!({ "accepted": accepted });
+    respond_json(request, 200, ack.to_string().as_bytes());
+}
+
+fn handle_telemetry_stats(request: Request, telemetry: &TelemetryStore) {
+    match serde_json::to_vec(&telemetry.stats()) {
+        Ok(bytes) => respond_json(request, 200, &bytes),
+        Err(err) => respond_json(
+            request,
+            500,
+            json_error_bytes(&format!("serialize failed: {err}")).as_slice(),
+        ),
+    }
+}
+
 fn handle_tools_summary(request: Request, tool_telemetry: &ToolTelemetryStore) {
     let view = tool_telemetry.view();
     match serde_json::to_vec(&view) {
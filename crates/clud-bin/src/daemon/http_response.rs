@@ -56,10 +56,14 @@ fn no_cache_header() -> Header {
 }
 
 pub(super) fn read_body(request: &mut Request) -> io::Result<Vec<u8>> {
+    read_body_limited(request, MAX_REQUEST_BODY_BYTES)
+}
+
+pub(super) fn read_body_limited(request: &mut Request, limit: usize) -> io::Result<Vec<u8>> {
     let mut buf = Vec::new();
     request
         .as_reader()
-        .take(MAX_REQUEST_BODY_BYTES as u64)
+        .take(limit as u64)
         .read_to_end(&mut buf)?;
     Ok(buf)
 }
@@ -20,6 +20,7 @@ mod server;
 mod session_tmp_sweep;
 mod sessions;
 mod target_sweep;
+mod telemetry_socket;
 mod top;
 mod types;
 pub mod uv_cache_sweep;
@@ -49,8 +50,9 @@ pub use cpu_alert_publish::{metrics_snapshot_path, MetricsSnapshot};
 #[cfg(windows)]
 pub(crate) use daemon_events::log_event as log_structured_event;
 pub use http::{
-    spawn_dashboard_telemetry_only, DashboardState, TelemetryEntry, TelemetryIngest,
-    TelemetryPidDetail, TelemetryPidSummary, TelemetryStore,
+    spawn_dashboard_telemetry_only, DashboardState, TelemetryBulkIngest, TelemetryEntry,
+    TelemetryIngest, TelemetryIngestStats, TelemetryLane, TelemetryPidDetail, TelemetryPidSummary,
+    TelemetryStore,
 };
 pub use paths::{default_state_dir, default_trash_dir};
 pub use types::GcWatchRoot;
@@ -151,6 +151,12 @@ pub(super) fn run_daemon(state_dir: &Path) -> i32 {
     let telemetry = TelemetryStore::new();
     let tool_telemetry = ToolTelemetryStore::new();
     let dashboard_token = crate::dashboard_auth::generate_token();
+    // Local-socket fast path for the telemetry hook: same store, no HTTP.
+    let telemetry_socket = super::telemetry_socket::spawn_telemetry_socket(
+        state_dir,
+        telemetry.clone(),
+        Some(activity.clone()),
+    );
     let dashboard_port = spawn_dashboard_with_activity(
         state_dir.to_path_buf(),
         gc_tx.clone(),
@@ -177,6 +183,12 @@ pub(super) fn run_daemon(state_dir: &Path) -> i32 {
             std::env::set_var(crate::log_event::ENV_DAEMON_HTTP_TOKEN, &dashboard_token);
         }
     }
+    if let Some(socket) = telemetry_socket.as_ref() {
+        // SAFETY: same single-threaded startup window as above.
+        unsafe {
+            std::env::set_var(crate::log_event::ENV_DAEMON_TELEMETRY_SOCKET, socket.path());
+        }
+    }
 
     // Tool installation is deferred until after readiness. `clud tool` self-heals
     // its requested file inline, so daemon bringup no longer blocks callers
@@ -409,6 +421,9 @@ pub(super) fn run_daemon(state_dir: &Path) -> i32 {
     if let Some(lane) = rp_lane {
         lane.cleanup();
     }
+    if let Some(socket) = telemetry_socket {
+        socket.cleanup();
+    }
     daemon_events::log_event(state_dir, "daemon_stopping", []);
     let _ = fs::remove_file(daemon_info_path(state_dir));
     daemon_events::log_event(state_dir, "daemon_stopped", []);
@@ -0,0 +1,201 @@
+//! Local-socket fast path for telemetry ingest.
+//!
+//! `hooks/telemetry.py` runs once per tool call. Over HTTP each record
+//! costs a TCP connect, request parsing, the dashboard capability check
+//! and a JSON response. The daemon already serves clud's own requests on
+//! the running-process frame lane (`rp_broker`), but that lane speaks
+//! prost `Frame` envelopes behind a Hello handshake, which a stdlib-only
+//! hook cannot produce. This module binds a sibling unix socket,
+//! `<state_dir>/telemetry.sock`, that carries the same envelope the
+//! `POST /telemetry/bulk` route takes:
+//!
+//! - request: one line of JSON, a [`TelemetryBulkIngest`] (a single hook
+//!   event is a one-entry batch), terminated by `\n`;
+//! - reply: one line, `{"accepted":N}` or `{"error":"..."}`.
+//!
+//! A connection may carry any number of request lines; one that sends
+//! nothing for `READ_TIMEOUT` is closed. The socket file is
+//! `0600`, so the filesystem stands in for the dashboard token: only the
+//! daemon's user can connect. The path is exported to workers as
+//! `$CLUD_DAEMON_TELEMETRY_SOCKET`. Best-effort like the frame lane — a
+//! bind failure logs one note and HTTP stays the only ingest route.
+//! Windows has no std unix-socket listener, so there the hook keeps HTTP.
+
+use std::path::{Path, PathBuf};
+
+use sha2::{Digest, Sha256};
+
+use super::http::TelemetryStore;
+
+/// Handle to the running listener; removes the socket file on shutdown.
+#[cfg_attr(not(unix), allow(dead_code))]
+pub(super) struct TelemetrySocket {
+    path: PathBuf,
+}
+
+impl TelemetrySocket {
+    pub(super) fn path(&self) -> &Path {
+        &self.path
+    }
+
+    pub(super) fn cleanup(&self) {
+        let _ = std::fs::remove_file(&self.path);
+    }
+}
+
+/// `<state_dir>/telemetry.sock`, or a short temp-dir path when the state
+/// dir would overflow `sun_path` (same budget as the frame lane endpoint).
+#[cfg_attr(not(unix), allow(dead_code))]
+pub(super) fn telemetry_socket_path(state_dir: &Path) -> PathBuf {
+    const SUN_PATH_BUDGET: usize = 90;
+    let in_state_dir = state_dir.join("telemetry.sock");
+    if in_state_dir.as_os_str().len() <= SUN_PATH_BUDGET {
+        return in_state_dir;
+    }
+    let digest = Sha256::digest(state_dir.to_string_lossy().as_bytes());
+    let token: String = digest[..8].iter().map(|b| format!("{b:02x}")).collect();
+    std::env::temp_dir().join(format!("clud-telemetry-{token}.sock"))
+}
+
+/// Bind the telemetry socket and serve it on a detached thread.
+#[cfg(unix)]
+pub(super) fn spawn_telemetry_socket(
+    state_dir: &Path,
+    telemetry: TelemetryStore,
+    activity: Option<super::activity::DaemonActivity>,
+) -> Option<TelemetrySocket> {
+    match unix::start(&telemetry_socket_path(state_dir), telemetry, activity) {
+        Ok(socket) => Some(socket),
+        Err(err) => {
+            eprintln!("[clud] note: telemetry socket unavailable: {err}");
+            None
+        }
+    }
+}
+
+#[cfg(not(unix))]
+pub(super) fn spawn_telemetry_socket(
+    _state_dir: &Path,
+    _telemetry: TelemetryStore,
+    _activity: Option<super::activity::DaemonActivity>,
+) -> Option<TelemetrySocket> {
+    None
+}
+
+#[cfg(unix)]
+mod unix {
+    use std::io::{self, BufRead, BufReader, Read, Write};
+    use std::os::unix::fs::PermissionsExt;
+    use std::os::unix::net::{UnixListener, UnixStream};
+    use std::path::Path;
+    use std::thread;
+    use std::time::Duration;
+
+    use super::super::activity::DaemonActivity;
+    use super::super::http::{
+        TelemetryBulkIngest, TelemetryLane, TelemetryStore, MAX_BULK_BODY_BYTES,
+    };
+    use super::TelemetrySocket;
+
+    /// A client that stalls mid-frame must not pin a thread, nor the
+    /// daemon's activity guard that keeps it from idling out.
+    const READ_TIMEOUT: Duration = Duration::from_secs(5);
+
+    pub(super) fn start(
+        path: &Path,
+        telemetry: TelemetryStore,
+        activity: Option<DaemonActivity>,
+    ) -> io::Result<TelemetrySocket> {
+        // A daemon that died uncleanly leaves the socket file behind.
+        let _ = std::fs::remove_file(path);
+        let listener = UnixListener::bind(path)?;
+        std::fs::set_permissions(path, std::fs::Permissions::from_mode(0o600))?;
+        thread::Builder::new()
+            .name("clud-telemetry-socket".to_string())
+            .spawn(move || {
+                for stream in listener.incoming() {
+                    let Ok(stream) = stream else { continue };
+                    let telemetry = telemetry.clone();
+                    let activity = activity.clone();
+                    thread::spawn(move || {
+                        let _connection_guard =
+                            activity.as_ref().map(DaemonActivity::start_connection);
+                        let _ = serve_connection(stream, &telemetry);
+                    });
+                }
+            })?;
+        Ok(TelemetrySocket {
+            path: path.to_path_buf(),
+        })
+    }
+
+    fn serve_connection(stream: UnixStream, telemetry: &TelemetryStore) -> io::Result<()> {
+        stream.set_read_timeout(Some(READ_TIMEOUT))?;
+        let mut writer = stream.try_clone()?;
+        let mut reader = BufReader::new(stream);
+        let mut line = Vec::new();
+        loop {
+            line.clear();
+            let read = (&mut reader)
+                .take(MAX_BULK_BODY_BYTES as u64 + 1)
+                .read_until(b'\n', &mut line)?;
+            if read == 0 {
+                return Ok(());
+            }
+            if line.last() != Some(&b'\n') && read > MAX_BULK_BODY_BYTES {
+                writer.write_all(b"{\"error\":\"frame too large\"}\n")?;
+                return Ok(());
+            }
+            let reply = match serde_json::from_slice::<TelemetryBulkIngest>(&line) {
+                Ok(payload) => {
+                    let accepted = telemetry.ingest_bulk(payload, TelemetryLane::Socket);
+                    serde_json::json!({ "accepted": accepted })
+                }
+                Err(err) => serde_json::json!({ "error": format!("invalid JSON: {err}") }),
+            };
+            writer.write_all(format!("{reply}\n").as_bytes())?;
+        }
+    }
+}
+
+#[cfg(all(test, unix))]
+mod tests {
+    use std::io::{BufRead, BufReader, Write};
+    use std::os::unix::net::UnixStream;
+
+    use super::*;
+
+    #[test]
+    fn socket_frames_land_in_the_store_with_their_own_counter() {
+        let dir = tempfile::tempdir().expect("tempdir");
+        let telemetry = TelemetryStore::new();
+        let socket =
+            spawn_telemetry_socket(dir.path(), telemetry.clone(), None).expect("socket bound");
+        let mode = std::fs::metadata(socket.path()).expect("stat").permissions();
+        assert_eq!(std::os::unix::fs::PermissionsExt::mode(&mode) & 0o777, 0o600);
+
+        let mut stream = UnixStream::connect(socket.path()).expect("connect");
+        let mut reader = BufReader::new(stream.try_clone().expect("clone"));
+        let mut reply = String::new();
+        for pid in [7u32, 8] {
+            let frame = serde_json::json!({
+                "entries": [{ "parent_pid": pid, "time_ms": 1, "cmd": "c", "cwd": "/" }],
+                "dropped": 1,
+            });
+            stream.write_all(format!("{frame}\n").as_bytes()).expect("write");
+            reply.clear();
+            reader.read_line(&mut reply).expect("reply");
+            assert_eq!(reply.trim(), r#"{"accepted":1}"#);
+        }
+        stream.write_all(b"{\"entries\":[{}]}\n").expect("write");
+        reply.clear();
+        reader.read_line(&mut reply).expect("reply");
+        assert!(reply.contains("invalid JSON"), "got {reply}");
+
+        let stats = telemetry.stats();
+        assert_eq!((stats.socket_requests, stats.entries, stats.dropped), (2, 2, 2));
+        assert_eq!(telemetry.summary().len(), 2);
+        socket.cleanup();
+        assert!(!socket.path().exists());
+    }
+}
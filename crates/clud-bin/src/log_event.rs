@@ -28,6 +28,11 @@ pub const ENV_DAEMON_HTTP_SERVER: &str = "CLUD_DAEMON_HTTP_SERVER";
 /// child environment, so third-party pages cannot invoke mutable dashboard routes.
 pub const ENV_DAEMON_HTTP_TOKEN: &str = "CLUD_DAEMON_HTTP_TOKEN";
 
+/// Path of the daemon's telemetry unix socket (`daemon::telemetry_socket`).
+/// `hooks/telemetry.py` prefers it over HTTP when set; unset on Windows
+/// and whenever the socket failed to bind.
+pub const ENV_DAEMON_TELEMETRY_SOCKET: &str = "CLUD_DAEMON_TELEMETRY_SOCKET";
+
 /// HTTP POST timeout for the logger. Tight on purpose — hook callers
 /// must not block on a stuck daemon.
 const POST_TIMEOUT: Duration = Duration::from_secs(2);
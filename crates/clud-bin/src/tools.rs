@@ -40,6 +40,10 @@ pub const DEFAULT_RESUMABLE_TIMEOUT: Duration = Duration::from_secs(60 * 20);
 /// build). Entries may override.
 pub const DEFAULT_KILLABLE_TIMEOUT: Duration = Duration::from_secs(60 * 60);
 
+/// `command_timeout` for a foreground tool that runs until the user stops
+/// it (e.g. `docker/docker_monitor.py`). The watchdog never fires on it.
+pub const NO_COMMAND_TIMEOUT: Duration = Duration::MAX;
+
 /// Kill-vs-resume semantics for a tool invocation. Drives how the
 /// `tool_run` wrapper handles `command_timeout` and what abort terminal
 /// it returns. See #427 for the full taxonomy.
@@ -141,7 +145,8 @@ pub const BUNDLED_TOOLS: &[BundledTool] = &[
         // Compatibility shim for hand-written hook configs that still call
         // `clud tool run hooks/block-bad-cmd.py`. The normal hot path is
         // the PyPI-shipped native `clud-block-bad-cmd` executable. The
-        // shim execs that binary, so the decision IS still the work;
+        // shim execs that binary (or, with CLUD_BLOCK_BAD_CMD_RESIDENT=1,
+        // asks its `--serve` process), so the decision IS still the work;
         // killing mid-run loses the verdict — `Killable`.
         kill_semantics: KillSemantics::Killable,
         command_timeout: Duration::from_secs(30),
@@ -156,7 +161,9 @@ pub const BUNDLED_TOOLS: &[BundledTool] = &[
         // Pre/PostToolUse hooks. Killable because the process IS the
         // work; the 3-second sleep at the end of `main()` accounts
         // for the only deliberate wall-clock spent (the warning's
-        // visibility delay). 30s backstop is comfortable headroom.
+        // visibility delay). 30s backstop is comfortable headroom;
+        // `--workspace` scans run in parallel and skip repos whose
+        // inputs are unchanged since the cached result.
         kill_semantics: KillSemantics::Killable,
         command_timeout: Duration::from_secs(30),
         progress_timeout: None,
@@ -165,13 +172,14 @@ pub const BUNDLED_TOOLS: &[BundledTool] = &[
     BundledTool {
         rel_path: "hooks/telemetry.py",
         body: include_str!("../assets/tools/hooks/telemetry.py"),
-        // PostToolUse hook (#473): ships the hook payload to the clud
-        // daemon's /telemetry/log endpoint. ALWAYS exits 0 by contract —
-        // a stuck or broken telemetry path must never block a tool call.
-        // Killable because the work IS the POST; killing mid-flight loses
-        // that one record but the tool call is unaffected (recommended
-        // wiring uses `async: true`). 30s backstop matches the other
-        // hooks; the script itself enforces a 2s HTTP timeout internally.
+        // PostToolUse hook (#473): spools the hook payload for the clud
+        // daemon; a detached `--flush` helper ships batches to
+        // /telemetry/bulk. ALWAYS exits 0 by contract — a stuck or broken
+        // telemetry path must never block a tool call. Killable because
+        // the work is one O_APPEND write; killing mid-flight loses at most
+        // that one record (recommended wiring uses `async: true`). 30s
+        // backstop matches the other hooks; the flusher enforces a 2s
+        // HTTP timeout internally.
         kill_semantics: KillSemantics::Killable,
         command_timeout: Duration::from_secs(30),
         progress_timeout: None,
@@ -226,6 +234,20 @@ pub const BUNDLED_TOOLS: &[BundledTool] = &[
         progress_timeout: Some(Duration::from_secs(60 * 10)),
         quiet_ok: false,
     },
+    // Shared stdlib Engine API client, imported by module name from this
+    // directory by `docker_recover.py` and `docker_build_soldr.py` so
+    // list/inspect/remove skip the `docker` CLI fork when the Unix socket
+    // answers. Runnable on
+    // its own as a version smoke test; `Killable` with a short backstop
+    // because a direct run is one `/version` request.
+    BundledTool {
+        rel_path: "docker/docker_engine_api.py",
+        body: include_str!("../assets/tools/docker/docker_engine_api.py"),
+        kill_semantics: KillSemantics::Killable,
+        command_timeout: Duration::from_secs(30),
+        progress_timeout: None,
+        quiet_ok: true,
+    },
     BundledTool {
         rel_path: "python/lint_deadcode.py",
         body: include_str!("../assets/tools/python/lint_deadcode.py"),
@@ -253,6 +275,19 @@ pub const BUNDLED_TOOLS: &[BundledTool] = &[
         progress_timeout: Some(Duration::from_secs(120)),
         quiet_ok: false,
     },
+    // docker-monitor — `docker_recover.py monitor` under its own entry. The
+    // monitor fits its disk trend over an hour and waits 30 minutes between
+    // remedies, so the 10-minute cap above would kill it before either
+    // settles. No wall-clock cap, and `quiet_ok` because it is silent for a
+    // whole `--interval` between samples; Ctrl-C or `--samples` stops it.
+    BundledTool {
+        rel_path: "docker/docker_monitor.py",
+        body: include_str!("../assets/tools/docker/docker_monitor.py"),
+        kill_semantics: KillSemantics::Killable,
+        command_timeout: NO_COMMAND_TIMEOUT,
+        progress_timeout: None,
+        quiet_ok: true,
+    },
 ];
 
 /// The single source of truth for the `UV_CACHE_DIR` value used by every
@@ -392,7 +427,7 @@ mod tests {
 
     /// Issue #473: the `hooks/telemetry.py` PostToolUse bridge ships in
     /// the bundle and is the documented producer for the daemon's
-    /// `/telemetry/log` endpoint (#469). If the entry is renamed or
+    /// telemetry ingest (`/telemetry/bulk`, #469). If the entry is renamed or
     /// removed, the recommended `~/.claude/settings.json` wiring
     /// (`clud tool run hooks/telemetry.py`) silently breaks.
     #[test]
@@ -498,9 +533,10 @@ mod tests {
         }
     }
 
-    /// Each per-stack tool must declare its v0 scope honestly: the
-    /// soldr stack ships init+up+run+shell+clean+doctor; python+cpp
-    /// ship init only (other subcommands exit 64). Lock that in.
+    /// Each per-stack tool must declare its scope honestly: every stack
+    /// ships the volume lifecycle (cpp and python reuse soldr's labelling
+    /// and gc planner), and only soldr has verify/snapshot/seed — the
+    /// others must still mark those as not implemented. Lock that in.
     #[test]
     fn docker_build_stack_v0_scopes_match_issue_421() {
         let soldr = BUNDLED_TOOLS
@@ -515,22 +551,30 @@ mod tests {
         ] {
             assert!(
                 soldr.body.contains(required_marker),
-                "soldr stack tool must implement `{required_marker}` in v0",
+                "soldr stack tool must implement `{required_marker}`",
             );
         }
-        for stub_stack in ["python", "cpp"] {
-            let path = format!("docker/docker_build_{stub_stack}.py");
+        for stack in ["python", "cpp"] {
+            let path = format!("docker/docker_build_{stack}.py");
             let tool = BUNDLED_TOOLS
                 .iter()
                 .find(|t| t.rel_path == path)
-                .unwrap_or_else(|| panic!("{stub_stack} stack tool must exist"));
-            assert!(
-                tool.body.contains("def cmd_init"),
-                "{stub_stack} stack must at least implement init in v0",
-            );
+                .unwrap_or_else(|| panic!("{stack} stack tool must exist"));
+            for required_marker in [
+                "def cmd_init",
+                "def cmd_up",
+                "def cmd_run",
+                "def cmd_clean",
+                "def cmd_gc",
+            ] {
+                assert!(
+                    tool.body.contains(required_marker),
+                    "{stack} stack tool must implement `{required_marker}`",
+                );
+            }
             assert!(
                 tool.body.contains("not implemented in v0"),
-                "{stub_stack} stack must clearly mark not-yet-implemented subcommands",
+                "{stack} stack must clearly mark its soldr-only subcommands",
             );
         }
     }
@@ -548,6 +592,53 @@ mod tests {
         );
     }
 
+    /// `docker_recover.py` and `docker_build_soldr.py` import the Engine API
+    /// client from their own directory. If the entry is dropped they keep
+    /// working through the CLI fallback, so nothing else would notice.
+    #[test]
+    fn bundled_includes_docker_engine_api_beside_its_consumers() {
+        let names: Vec<&str> = BUNDLED_TOOLS.iter().map(|t| t.rel_path).collect();
+        assert!(
+            names.contains(&"docker/docker_engine_api.py"),
+            "BUNDLED_TOOLS must include docker/docker_engine_api.py; got {names:?}",
+        );
+        for consumer in ["docker/docker_recover.py", "docker/docker_build_soldr.py"] {
+            let tool = BUNDLED_TOOLS
+                .iter()
+                .find(|t| t.rel_path == consumer)
+                .expect("consumer must be bundled");
+            assert!(
+                tool.body.contains("import docker_engine_api"),
+                "{consumer} must import the sibling docker_engine_api",
+            );
+        }
+    }
+
+    /// The monitor runs for hours, so it must not inherit docker_recover's
+    /// 10-minute cap: its own entry has none, and docker_recover's docs send
+    /// unbounded runs there.
+    #[test]
+    fn docker_monitor_runs_without_a_wall_clock_cap() {
+        let monitor = BUNDLED_TOOLS
+            .iter()
+            .find(|t| t.rel_path == "docker/docker_monitor.py")
+            .expect("docker_monitor.py must be in BUNDLED_TOOLS");
+        assert_eq!(monitor.command_timeout, NO_COMMAND_TIMEOUT);
+        assert!(
+            monitor.progress_timeout.is_none() || monitor.quiet_ok,
+            "the monitor is silent between samples; a progress watchdog would kill it",
+        );
+        assert!(monitor.body.contains("import docker_recover"));
+        let recover = BUNDLED_TOOLS
+            .iter()
+            .find(|t| t.rel_path == "docker/docker_recover.py")
+            .expect("docker_recover.py must be in BUNDLED_TOOLS");
+        assert!(
+            recover.body.contains("clud tool run docker/docker_monitor.py"),
+            "docker_recover.py must point unbounded monitor runs at docker_monitor.py",
+        );
+    }
+
     /// The docker-recover exit codes are the public contract every caller
     /// (SKILL.md, future tooling) depends on — lock them into the docstring.
     #[test]
@@ -19,7 +19,8 @@ use std::path::PathBuf;
 use std::time::Duration;
 
 use clud::daemon::{
-    spawn_dashboard_telemetry_only, TelemetryPidDetail, TelemetryPidSummary, TelemetryStore,
+    spawn_dashboard_telemetry_only, TelemetryIngestStats, TelemetryPidDetail,
+    TelemetryPidSummary, TelemetryStore,
 };
 use running_process::{
     CommandSpec, NativeProcess, ProcessConfig, ReadStatus, StderrMode, StdinMode,
@@ -316,6 +317,63 @@ fn telemetry_summary_endpoint_returns_independent_list() {
     );
 }
 
+/// `POST /telemetry/bulk` ingests a whole spool batch in one request and
+/// feeds the drop/lag counters behind `GET /telemetry/stats`.
+#[test]
+fn telemetry_bulk_endpoint_ingests_batches_and_counts_drops() {
+    let dir = tempfile::tempdir().expect("tempdir");
+    let telemetry = TelemetryStore::new();
+    let port = spawn_dashboard_telemetry_only(
+        dir.path().to_path_buf(),
+        9999,
+        100,
+        telemetry.clone(),
+        "test-capability".to_string(),
+    )
+    .expect("dashboard spawned");
+
+    let stats_body = fetch_path(port, "GET", "/telemetry/stats", None).expect("GET stats");
+    let stats: TelemetryIngestStats = serde_json::from_str(&stats_body).expect("parse stats");
+    assert_eq!(stats.entries, 0);
+
+    // Records timestamped in the past: the lag gauge must see them as old.
+    let entries: Vec<String> = (0..40)
+        .map(|i| {
+            format!(
+                r#"{{"parent_pid":{},"time_ms":{},"cmd":"Bash: echo {i}","cwd":"/tmp","env":{{}}}}"#,
+                300 + i % 2,
+                1_700_000_000_000u64 + i,
+            )
+        })
+        .collect();
+    let body = format!(r#"{{"entries":[{}],"dropped":3}}"#, entries.join(","));
+    assert!(body.len() > 2 * 1024, "batch should exceed a single-record body");
+    let resp =
+        fetch_path(port, "POST", "/telemetry/bulk", Some(body)).expect("POST /telemetry/bulk");
+    assert!(resp.contains(r#""accepted":40"#), "unexpected ack: {resp}");
+
+    let summary_body = fetch_path(port, "GET", "/telemetry", None).expect("GET /telemetry");
+    let summaries: Vec<TelemetryPidSummary> =
+        serde_json::from_str(&summary_body).expect("parse summary");
+    let total: usize = summaries.iter().map(|s| s.entry_count).sum();
+    assert_eq!(total, 40);
+
+    let stats_body = fetch_path(port, "GET", "/telemetry/stats", None).expect("GET stats");
+    let stats: TelemetryIngestStats = serde_json::from_str(&stats_body).expect("parse stats");
+    assert_eq!(stats.bulk_requests, 1);
+    assert_eq!(stats.entries, 40);
+    assert_eq!(stats.dropped, 3);
+    assert!(stats.lag_ms_last > 0 && stats.lag_ms_max >= stats.lag_ms_last);
+
+    // A malformed batch is rejected whole so the flusher keeps its spool.
+    let resp = fetch_path(port, "POST", "/telemetry/bulk", Some("{\"entries\":[{}]}".into()))
+        .expect("POST malformed bulk");
+    assert!(resp.contains("invalid JSON"), "expected a 400 body, got: {resp}");
+    let stats_body = fetch_path(port, "GET", "/telemetry/stats", None).expect("GET stats");
+    let stats: TelemetryIngestStats = serde_json::from_str(&stats_body).expect("parse stats");
+    assert_eq!(stats.entries, 40);
+}
+
 /// Tiny HTTP/1.0 client for the test. Mirrors the helper in
 /// `daemon::http::tests` so we don't need a real HTTP client dep.
 fn fetch_path(port: u16, method: &str, path: &str, body: Option<String>) -> io::Result<String> {
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bench.hook_latency.report import budget_violations, summarize_hook
+
+BUDGET = Path(__file__).resolve().parents[1] / "bench" / "hook_latency" / "budget.json"
+
+
+def _samples(**p50_ms: float) -> dict[str, list[float]]:
+    return {layer: [ms / 1000] * 10 for layer, ms in p50_ms.items()}
+
+
+def test_breakdown_is_the_difference_between_measured_layers() -> None:
+    summary = summarize_hook(_samples(interpreter=20, imports=70, script=75, uv=110))
+    assert summary["breakdown_p50_ms"] == {
+        "interpreter_start": 20.0,
+        "imports": 50.0,
+        "work": 5.0,
+        "uv_resolution": 35.0,
+    }
+    assert summary["total"] == {"layer": "uv", "p50_ms": 110.0, "p99_ms": 110.0}
+
+
+def test_noise_never_makes_a_stage_negative_and_missing_layers_are_skipped() -> None:
+    summary = summarize_hook(_samples(interpreter=20, imports=70, script=69, clud=120))
+    assert summary["breakdown_p50_ms"]["work"] == 0.0
+    assert summary["breakdown_p50_ms"]["clud_dispatch"] == 51.0
+    assert "uv" not in summary["layers"]
+    with pytest.raises(ValueError, match="no layer"):
+        summarize_hook({})
+
+
+def test_p99_uses_the_slow_tail() -> None:
+    samples = {"script": [0.010] * 99 + [0.500]}
+    assert summarize_hook(samples)["total"]["p99_ms"] == 500.0
+
+
+def test_budget_pass_fail_and_layer_mismatch() -> None:
+    budget = json.loads(BUDGET.read_text(encoding="utf-8"))
+    fast = summarize_hook(_samples(interpreter=20, script=60, uv=90))
+    report = {"hooks": dict.fromkeys(budget["p99_ms"], fast)}
+    assert budget_violations(report, budget) == []
+
+    slow = summarize_hook(_samples(interpreter=20, script=60, uv=900))
+    report["hooks"]["telemetry"] = slow
+    assert budget_violations(report, budget) == ["telemetry: p99 900.0 ms exceeds 250.0 ms"]
+
+    report["hooks"]["telemetry"] = summarize_hook(_samples(interpreter=20, script=60))
+    del report["hooks"]["block-bad-cmd"]
+    assert budget_violations(report, budget) == [
+        "block-bad-cmd: not measured",
+        "telemetry: measured through script, budget is for uv",
+    ]
+
+
+def test_budget_holds_its_own_layer_when_clud_is_measured_on_top() -> None:
+    budget = json.loads(BUDGET.read_text(encoding="utf-8"))
+    through_clud = summarize_hook(_samples(interpreter=20, script=60, uv=90, clud=900))
+    assert through_clud["total"]["layer"] == "clud"
+    report = {"hooks": dict.fromkeys(budget["p99_ms"], through_clud)}
+    assert budget_violations(report, budget) == []
+
+    report["hooks"]["telemetry"] = summarize_hook(_samples(script=60, uv=900, clud=950))
+    assert budget_violations(report, budget) == ["telemetry: p99 900.0 ms exceeds 250.0 ms"]
@@ -0,0 +1,139 @@
+"""The `hooks/block-bad-cmd.py` compatibility shim, one-shot and resident.
+
+A fake `clud-block-bad-cmd` on PATH stands in for the native binary: it
+denies any command containing the sentinel, and with `--serve <socket>`
+answers the resident protocol, tagging each reply so the tests can tell
+which path decided.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from tests import process
+
+ROOT = Path(__file__).resolve().parents[1]
+SHIM = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "hooks" / "block-bad-cmd.py"
+SENTINEL = "bad" + " cmd"
+
+FAKE_NATIVE = f"""#!{sys.executable}
+import json, os, socketserver, sys
+
+def decide(raw):
+    command = (json.loads(raw or "{{}}").get("tool_input") or {{}}).get("command", "")
+    if {SENTINEL!r} in command:
+        return '{{"hookSpecificOutput": {{"permissionDecision": "deny"}}}}\\n', "refusing\\n", 2
+    return "", "", 0
+
+if sys.argv[1:2] == ["--serve"]:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            stdout, stderr, code = decide(request["stdin"])
+            reply = {{"stdout": stdout, "stderr": "[served] " + stderr, "exit_code": code}}
+            self.wfile.write(json.dumps(reply).encode() + b"\\n")
+
+    server = socketserver.UnixStreamServer(sys.argv[2], Handler)
+    server.timeout = 10
+    while os.path.exists(sys.argv[2]) and server.handle_request() is None:
+        pass
+    sys.exit(0)
+
+stdout, stderr, code = decide(sys.stdin.read())
+sys.stdout.write(stdout)
+sys.stderr.write(stderr)
+sys.exit(code)
+"""
+
+
+@pytest.fixture
+def env(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    native = bin_dir / "clud-block-bad-cmd"
+    native.write_text(FAKE_NATIVE, encoding="utf-8")
+    native.chmod(0o755)
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can exceed it.
+    socket_dir = Path(tempfile.mkdtemp(prefix="clud-bbc-"))
+    env = os.environ.copy()
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    env["CLUD_BLOCK_BAD_CMD_SOCKET_DIR"] = str(socket_dir)
+    env.pop("CLUD_BAD_CMD_OVERRIDE", None)
+    try:
+        yield env
+    finally:
+        # Removing the socket is what tells a fake server to exit.
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def _fire(env: dict[str, str], command: str) -> process.CompletedProcess[str]:
+    payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": command}})
+    return process.run(
+        [sys.executable, str(SHIM)],
+        input=payload,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=30,
+    )
+
+
+def test_missing_native_binary_allows_the_command(env, tmp_path):
+    env["PATH"] = str(tmp_path / "empty")
+    result = _fire(env, SENTINEL)
+    assert result.returncode == 0
+    assert "not found on PATH" in result.stderr
+
+
+def test_one_shot_relays_the_native_verdict(env):
+    result = _fire(env, f"echo {SENTINEL}")
+    assert result.returncode == 2
+    assert "deny" in result.stdout
+    assert result.stderr.strip() == "refusing"
+    assert _fire(env, "ls").returncode == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the resident server is unix-only")
+def test_resident_mode_starts_a_server_then_asks_it(env):
+    env["CLUD_BLOCK_BAD_CMD_RESIDENT"] = "1"
+    first = _fire(env, f"echo {SENTINEL}")
+    assert (first.returncode, first.stderr.strip()) == (2, "refusing"), "first call is one-shot"
+
+    socket_dir = Path(env["CLUD_BLOCK_BAD_CMD_SOCKET_DIR"])
+    deadline = time.monotonic() + 20
+    while not list(socket_dir.glob("*.sock")) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    second = _fire(env, f"echo {SENTINEL}")
+    assert second.returncode == 2
+    assert "deny" in second.stdout
+    assert second.stderr.strip() == "[served] refusing"
+
+    # The override is read from the deciding process's env, so it bypasses the server.
+    env["CLUD_BAD_CMD_OVERRIDE"] = "some-rule: testing"
+    assert _fire(env, f"echo {SENTINEL}").stderr.strip() == "refusing"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the resident server is unix-only")
+def test_dead_socket_falls_back_to_one_shot(env, monkeypatch):
+    spec = importlib.util.spec_from_file_location("clud_block_bad_cmd_shim", SHIM)
+    assert spec is not None
+    assert spec.loader is not None
+    shim = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(shim)
+    monkeypatch.setenv(shim.SOCKET_DIR_ENV, env[shim.SOCKET_DIR_ENV])
+    # A socket file nobody listens on, as a killed server leaves behind.
+    stale = shim.socket_path(shutil.which("clud-block-bad-cmd", path=env["PATH"]))
+    stale.write_bytes(b"")
+
+    env["CLUD_BLOCK_BAD_CMD_RESIDENT"] = "1"
+    result = _fire(env, f"echo {SENTINEL}")
+    assert (result.returncode, result.stderr.strip()) == (2, "refusing")
@@ -0,0 +1,343 @@
+"""Unit tests for the bundled `git/clud-git-diff.py` viewer.
+
+The window itself needs pywebview and a display, so these tests stop at the
+Python side of the page: the streaming parser and its byte offsets, the
+lazily parsed per-file payloads behind the `js_api` bridge, and the page
+shell.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from running_process import RunningProcess
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "git" / "clud-git-diff.py"
+
+
+@pytest.fixture
+def mod():
+    name = "clud_test_git_diff"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    try:
+        yield module
+    finally:
+        sys.modules.pop(name, None)
+
+
+def _file_diff(path: str, removed: list[str], added: list[str]) -> str:
+    lines = [
+        f"diff --git a/{path} b/{path}",
+        "index 1111111..2222222 100644",
+        f"--- a/{path}",
+        f"+++ b/{path}",
+        f"@@ -1,{len(removed) + 1} +1,{len(added) + 1} @@",
+        " keep",
+        *(f"-{r}" for r in removed),
+        *(f"+{a}" for a in added),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+DIFF = (
+    _file_diff("a.py", ["old"], ["new", "hunk_body_marker"])
+    + _file_diff("b.py", [], ["x"])
+    + _file_diff("c.py", ["gone"], [])
+)
+
+
+@pytest.fixture
+def spool(tmp_path):
+    path = tmp_path / "diff.patch"
+    path.write_text(DIFF, encoding="utf-8")
+    return path
+
+
+def test_index_counts_changes_without_parsing_hunks(mod):
+    entries = mod.index_diff(DIFF)
+    assert [(e.path, e.added, e.removed) for e in entries] == [
+        ("a.py", 2, 1),
+        ("b.py", 1, 0),
+        ("c.py", 0, 1),
+    ]
+    # The `---`/`+++` header lines are not counted, and spans tile the text.
+    assert entries[0].start == 0
+    assert entries[-1].end == len(DIFF)
+    assert DIFF[entries[1].start:].startswith("diff --git a/b.py")
+    assert all(e.hunks == [] for e in entries)
+
+
+def test_parser_yields_each_file_before_reading_the_rest(mod):
+    consumed = []
+
+    def lines():
+        for line in DIFF.splitlines(keepends=True):
+            consumed.append(line)
+            yield line.encode()
+
+    first = next(mod.parse_diff(lines()))
+    assert first.path == "a.py"
+    assert len(first.hunks) == 1
+    # Only a.py plus the `diff --git` line that closed it were read.
+    assert len(consumed) == DIFF.count("\n", 0, DIFF.index("diff --git a/b.py")) + 1
+
+
+def test_offsets_are_bytes_not_characters(mod):
+    text = _file_diff("ü.txt", ["é"], ["ê"]) + _file_diff("z.txt", [], ["z"])
+    entries = mod.index_diff(text)
+    raw = text.encode()
+    assert raw[entries[1].start:].startswith(b"diff --git a/z.txt")
+    assert entries[1].end == len(raw)
+
+
+def test_payload_is_reread_from_the_spool_and_matches_the_full_parse(mod, spool):
+    session = mod.DiffSession(spool, prefetch_ahead=0)
+    try:
+        assert session.cached() == []
+        full = [mod.file_to_payload(f) for f in mod.parse_diff(DIFF)]
+        assert session.payload(1) == full[1]
+        assert session.cached() == [1]
+        assert session.payload(9) is None
+    finally:
+        session.close()
+
+
+def test_payload_cache_evicts_least_recently_used(mod, spool):
+    session = mod.DiffSession(spool, cache_size=2, prefetch_ahead=0)
+    try:
+        session.payload(0)
+        session.payload(1)
+        session.payload(0)  # refresh 0, so 1 is the oldest
+        session.payload(2)
+        assert session.cached() == [0, 2]
+    finally:
+        session.close()
+
+
+def test_api_file_prefetches_the_next_files(mod, spool):
+    session = mod.DiffSession(spool, prefetch_ahead=2)
+    api = mod.DiffApi(session)
+    assert api.file(0)["path"] == "a.py"
+    session._pool.shutdown(wait=True)
+    assert sorted(session.cached()) == [0, 1, 2]
+
+
+def test_page_embeds_the_file_list_but_no_hunks(mod, spool):
+    session = mod.DiffSession(spool)
+    try:
+        page = mod.render_html("HEAD~1", "HEAD", session.file_list())
+    finally:
+        session.close()
+    assert "+2</span>" in page
+    assert "-1</span>" in page
+    assert "const FILE_COUNT = 3;" in page
+    assert "hunk_body_marker" not in page
+    assert "pywebview.api.file" in page
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A two-commit repo as the working directory: f.txt `one` -> `two`."""
+    if shutil.which("git") is None:
+        pytest.skip("needs git")
+    root = tmp_path / "repo"
+    root.mkdir()
+    monkeypatch.chdir(root)
+
+    def git(*args):
+        RunningProcess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                           capture_output=True, check=True)
+
+    git("init", "-q")
+    (root / "f.txt").write_text("one\n")
+    git("add", "f.txt")
+    git("commit", "-qm", "one")
+    (root / "f.txt").write_text("two </script>\n")
+    git("commit", "-qam", "two")
+    return root
+
+
+def test_stream_diff_spools_git_output_and_yields_its_lines(mod, repo, tmp_path):
+    spool = tmp_path / "diff.patch"
+    lines = list(mod.stream_diff("HEAD~1", "HEAD", spool))
+    assert b"".join(lines) == spool.read_bytes()
+    assert lines[0].startswith(b"diff --git a/f.txt")
+    entries = mod.index_diff(lines)
+    assert [(e.path, e.added, e.removed) for e in entries] == [("f.txt", 1, 1)]
+
+
+def test_json_mode_prints_payloads_without_a_window(mod, repo, capsys):
+    assert mod.main(["HEAD~1", "HEAD", "--json"]) == 0
+    doc = json.loads(capsys.readouterr().out)
+    assert (doc["left"], doc["right"]) == ("HEAD~1", "HEAD")
+    [entry] = doc["files"]
+    assert (entry["path"], entry["added"], entry["removed"]) == ("f.txt", 1, 1)
+    assert entry["sections"][0]["kinds"] == "m"
+    assert "webview" not in sys.modules
+
+
+def test_export_writes_a_self_contained_page(mod, repo, tmp_path):
+    out = tmp_path / "diff.html"
+    assert mod.main(["HEAD~1", "HEAD", "--export", str(out)]) == 0
+    page = out.read_text(encoding="utf-8")
+    assert "const EMBEDDED   = [" in page
+    # The payload's own `</script>` must not close the page's script.
+    assert page.count("</script>") == 1
+    assert "two <\\/script>" in page
+
+
+def test_page_draws_rows_into_a_fixed_pool(mod):
+    page = mod.render_html("a", "b", [])
+    assert f"const ROW_PX     = {mod.ROW_HEIGHT_PX};" in page
+    assert f"height: {mod.ROW_HEIGHT_PX}px;" in page
+    assert f"const OVERSCAN   = {mod.OVERSCAN_ROWS};" in page
+    # Rows are reused via textContent, never rebuilt as an HTML string.
+    assert "innerHTML" not in page
+
+
+def _columns_to_rows(cols):
+    """Python mirror of the page's `decode`, for comparison."""
+    cell = {
+        "c": (("ctx", True), ("ctx", True)),
+        "m": (("del", True), ("add", True)),
+        "d": (("del", True), ("blank", False)),
+        "a": (("blank", False), ("add", True)),
+    }
+    left, right = [], []
+    texts = iter(cols["text"])
+    for code, o, n in zip(cols["kinds"], cols["ol"], cols["nl"], strict=True):
+        if code == "m":
+            lt, rt = next(texts), next(texts)
+        else:
+            lt = rt = next(texts)
+        (lk, lhas), (rk, rhas) = cell[code]
+        left.append({"ln": o if lhas else None, "kind": lk, "text": lt if lhas else ""})
+        right.append({"ln": n if rhas else None, "kind": rk, "text": rt if rhas else ""})
+    assert next(texts, None) is None
+    return left, right
+
+
+def test_columnar_hunk_decodes_to_the_row_form(mod):
+    hunk = mod.Hunk(old_start=10, new_start=20, raw_lines=[
+        (" ", "same"), ("-", "a"), ("-", "b"), ("+", "B"),
+        (" ", "mid"), ("+", "x"), ("+", "y"), (" ", ""), ("-", "z"),
+    ])
+    cols = mod.hunk_to_columns(hunk)
+    assert cols["kinds"] == "cmdcaacd"
+    # Context text is stored once, not per side.
+    assert cols["text"].count("same") == 1
+    assert _columns_to_rows(cols) == mod.hunk_to_side_by_side(hunk)
+
+
+def test_word_diff_marks_only_the_changed_tokens(mod):
+    old, new = mod.word_diff("total = price * qty", "total = cost * qty")
+    assert old == [[8, 13]]
+    assert new == [[8, 12]]
+    # Offsets are UTF-16 units: the astral emoji counts as two.
+    assert mod.word_diff("😀 a", "😀 b") == ([[3, 4]], [[3, 4]])
+
+
+def test_word_differ_pushes_flat_rows_and_caches_pairs(mod, monkeypatch):
+    hunk = mod.Hunk(old_start=1, new_start=1, raw_lines=[
+        (" ", "ctx"), ("-", "x = 1"), ("+", "x = 2"), ("-", "y" * 50), ("+", "z" * 50),
+    ])
+    payload = {"path": "f", "sections": [{"header": "@@", **mod.hunk_to_columns(hunk)}]}
+    assert [r[0] for r in mod.modified_rows(payload)] == [2, 3]
+
+    pushed = []
+    words = mod.WordDiffer(batch_rows=1, max_line=10)
+    try:
+        for future in words.schedule(0, payload, lambda idx, batch: pushed.append((idx, batch))):
+            future.result()
+        # The 50-char pair is over max_line and skipped.
+        assert pushed == [(0, [[2, [[4, 5]], [[4, 5]]]])]
+        calls = []
+        monkeypatch.setattr(mod, "word_diff", lambda a, b: calls.append((a, b)))
+        assert words.cached("x = 1", "x = 2") == ([[4, 5]], [[4, 5]])
+        assert calls == []
+    finally:
+        words.close()
+
+
+def test_word_differ_stops_at_the_budget_and_for_stale_files(mod):
+    payload = {"path": "f", "sections": [{"header": "@@", "kinds": "m", "ol": [1], "nl": [1],
+                                          "text": ["a", "b"]}]}
+    pushed = []
+    words = mod.WordDiffer(budget=0.0)
+    try:
+        for future in words.schedule(0, payload, lambda *a: pushed.append(a)):
+            future.result()
+        assert pushed == []  # over budget before the first row
+        words.schedule(1, payload, lambda *a: None)  # the user moved on
+        words._run(0, [(1, "a", "b")], float("inf"), lambda *a: pushed.append(a))
+        assert pushed == []
+    finally:
+        words.close()
+
+
+def test_resolve_range_returns_the_root_and_shas(mod, repo):
+    root, left, right = mod.resolve_range("HEAD~1", "HEAD")
+    assert root.resolve() == repo.resolve()
+    assert len(left) == len(right) == 40
+    assert left != right
+    assert mod.resolve_range("HEAD~1", "no-such-rev") is None
+
+
+def test_disk_cache_evicts_least_recently_used_files(mod, tmp_path):
+    cache = mod.DiffCache(tmp_path, "a" * 40, "b" * 40, max_bytes=10**6)
+    payload = {"path": "p", "sections": [{"text": ["x" * 100]}]}
+    for i, name in enumerate(("one", "two", "three")):
+        cache.store(name, payload)
+        os.utime(cache._file(name), (1000 + i, 1000 + i))
+    assert cache.load("one") == payload  # refreshes one's mtime past the others
+    size = cache._file("one").stat().st_size
+    cache.max_bytes = 2 * size
+    assert cache.evict() == 2 * size
+    assert cache.load("two") is None
+    assert cache.load("one") == payload
+    assert cache.load("three") == payload
+    assert mod.disk_cache_bytes({"CLUD_GIT_DIFF_CACHE_MB": "0"}) == 0
+    assert mod.disk_cache_bytes({}) == mod.DISK_CACHE_MB * 2**20
+
+
+def test_reopening_a_range_skips_the_full_diff(mod, repo, capsys, monkeypatch):
+    assert mod.main(["HEAD~1", "HEAD", "--json"]) == 0
+    first = json.loads(capsys.readouterr().out)
+    cache_dirs = list((repo / mod.DISK_CACHE_DIR).iterdir())
+    assert len(cache_dirs) == 1
+    assert (cache_dirs[0] / "index.json").is_file()
+
+    def no_stream(*_args, **_kwargs):
+        raise AssertionError("a cached range must not re-run the full git diff")
+
+    monkeypatch.setattr(mod, "stream_diff", no_stream)
+    assert mod.main(["HEAD~1", "HEAD", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == first
+
+    # An evicted payload is re-diffed for that file alone.
+    for cached in cache_dirs[0].glob("*.json"):
+        if cached.name != "index.json":
+            cached.unlink()
+    assert mod.main(["HEAD~1", "HEAD", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == first
+
+
+def test_cache_leaves_the_working_tree_clean(mod, repo, capsys):
+    assert mod.main(["HEAD~1", "HEAD", "--json"]) == 0
+    capsys.readouterr()
+    assert any((repo / mod.DISK_CACHE_DIR).iterdir())
+    status = RunningProcess.run(["git", "status", "--porcelain", "--untracked-files=all"],
+                                capture_output=True, text=True, check=True)
+    assert status.stdout.strip() == ""
@@ -0,0 +1,113 @@
+"""Unit tests for the cpp docker-build stack's volume lifecycle.
+
+The stack borrows labelling, discovery and the gc planner from the soldr
+stack, so these pin what is cpp's own — the volume set, the ccache stats
+parse and the post-`run` report — and that the shared gc only ever sees
+cpp groups. `_docker` is scripted; no Docker daemon is needed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker" / "docker_build_cpp.py"
+
+
+@pytest.fixture
+def mod():
+    name = "clud_test_docker_build_cpp"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    try:
+        yield module
+    finally:
+        sys.modules.pop(name, None)
+        sys.modules.pop("docker_build_soldr", None)
+
+
+@pytest.fixture
+def calls(mod, monkeypatch):
+    recorded: list[tuple[str, ...]] = []
+    stats = iter(["direct_cache_hit\t10\npreprocessed_cache_hit\t2\ncache_miss\t4\n",
+                  "direct_cache_hit\t19\npreprocessed_cache_hit\t2\ncache_miss\t5\n"])
+
+    def fake_docker(*args, check=True, capture=False):
+        recorded.append(args)
+        if "--print-stats" in args:
+            return SimpleNamespace(returncode=0, stdout=next(stats))
+        if "du" in args:
+            return SimpleNamespace(returncode=0, stdout="2500000000\t/root/.conan2\n")
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(mod.soldr, "_docker", fake_docker)
+    monkeypatch.setattr(mod.soldr, "_engine_client", lambda: None)
+    return recorded
+
+
+def test_ccache_stats_parse_both_key_spellings(mod):
+    assert mod.parse_ccache_stats(
+        "stats_updated_timestamp\t1700000000\ndirect_cache_hit\t3\n"
+        "preprocessed_cache_hit\t1\ncache_miss\t2\n") == (4, 2)
+    assert mod.parse_ccache_stats("cache_hit_direct\t5\ncache_miss\t0\n") == (5, 0)
+    assert mod.parse_ccache_stats("ccache: invalid option -- '-'") is None
+
+
+def test_up_creates_labelled_cpp_volumes(mod, calls, tmp_path):
+    mod.cmd_init(tmp_path)
+    assert mod.cmd_up(tmp_path) == 0
+    soldr = mod.soldr
+    created = [c[-1] for c in calls if c[:2] == ("volume", "create")]
+    assert created == [soldr._volume_name(tmp_path, role, "cpp")
+                       for role, _ in mod.VOLUME_MOUNTS]
+    assert all("com.clud.docker-build.stack=cpp" in c
+               for c in calls if c[:2] == ("volume", "create"))
+    (run,) = [c for c in calls if c[:2] == ("run", "-d")]
+    assert f"{created[1]}:/ccache" in run
+    assert run[-4:] == (soldr._image_tag(tmp_path, "cpp"), "tail", "-f", "/dev/null")
+
+
+def test_run_reports_ccache_hit_rate_and_conan_size(mod, calls, tmp_path, capsys):
+    mod.cmd_init(tmp_path)
+    assert mod.main([str(tmp_path), "run", "--", "cmake", "--build", "/build"]) == 0
+    (exec_call,) = [c for c in calls if c[:3] == ("exec", "-w", "/src")]
+    assert "CCACHE_BASEDIR=/src" in exec_call
+    assert exec_call[-3:] == ("cmake", "--build", "/build")
+    err = capsys.readouterr().err
+    assert "ccache: 9 hit / 1 miss (90% hit rate)" in err
+    assert "conan cache: 2.50 GB" in err
+
+
+def test_gc_sees_only_cpp_groups(mod, monkeypatch, tmp_path):
+    soldr = mod.soldr
+    ns = "com.clud.docker-build"
+    monkeypatch.setattr(soldr, "_engine_client", lambda: None)
+
+    def fake_docker(*args, check=True, capture=False):
+        if args[:2] == ("volume", "ls"):
+            return SimpleNamespace(returncode=0, stdout=(
+                "clud-docker-build-cpp-aaa-build\t\n"
+                "clud-docker-build-soldr-bbb-target\t\n"
+                f"clud-docker-build-cpp-ccc-ccache\t{ns}.stack=cpp,{ns}.project-key=ccc\n"))
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(soldr, "_docker", fake_docker)
+    keys = {g["project_key"] for g in soldr._discover_managed_groups("zzz", "cpp")}
+    assert keys == {"aaa", "ccc"}
+    assert {g["project_key"] for g in soldr._discover_managed_groups("zzz")} == {"bbb"}
+
+
+def test_soldr_only_subcommands_exit_64(mod, tmp_path, capsys):
+    assert mod.main([str(tmp_path), "verify"]) == 64
+    assert "not implemented in v0" in capsys.readouterr().err
+    assert mod.main([str(tmp_path)]) == 2
+    assert capsys.readouterr().err == mod.USAGE
@@ -0,0 +1,115 @@
+"""Unit tests for the python docker-build stack's volume lifecycle.
+
+Pins the shared, content-addressed uv cache volume (one for every python
+group, never part of a gc group) and the per-run cache reuse report. `_docker`
+is scripted; no Docker daemon is needed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker" / "docker_build_python.py"
+
+
+@pytest.fixture
+def mod():
+    name = "clud_test_docker_build_python"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    try:
+        yield module
+    finally:
+        sys.modules.pop(name, None)
+        sys.modules.pop("docker_build_soldr", None)
+
+
+BEFORE = (
+    "cache\tnumpy-2.1.0.dist-info\t/uv-cache/archive-v0/aa\n"
+    "cache\trich-13.9.0.dist-info\t/uv-cache/archive-v0/bb\n"
+    "venv\trich-13.9.0.dist-info\n"
+)
+AFTER = BEFORE + (
+    "cache\tattrs-24.2.0.dist-info\t/uv-cache/archive-v0/cc\n"
+    "venv\tnumpy-2.1.0.dist-info\n"
+    "venv\tattrs-24.2.0.dist-info\n"
+)
+
+
+def test_reuse_splits_new_installs_by_prior_cache_presence(mod):
+    reuse = mod.cache_reuse(mod.parse_inventory(BEFORE), mod.parse_inventory(AFTER))
+    assert reuse["installed"] == 2
+    assert reuse["hits"] == ["numpy-2.1.0.dist-info"]
+    assert reuse["misses"] == ["attrs-24.2.0.dist-info"]
+    assert reuse["hit_dirs"] == ["/uv-cache/archive-v0/aa"]
+    assert mod.format_reuse_report(reuse, 25_000_000) == (
+        "[docker-build python] uv cache: 1 hit / 1 miss of 2 installed, "
+        "25.0 MB not re-fetched\n")
+    noop = mod.cache_reuse(mod.parse_inventory(AFTER), mod.parse_inventory(AFTER))
+    assert "nothing installed" in mod.format_reuse_report(noop, 0)
+
+
+def test_two_groups_mount_the_same_uv_cache(mod, monkeypatch, tmp_path):
+    calls: list[tuple[str, ...]] = []
+    soldr = mod.soldr
+    monkeypatch.setattr(
+        soldr, "_docker",
+        lambda *args, **_k: calls.append(args) or SimpleNamespace(returncode=0, stdout=""))
+    for name in ("a", "b"):
+        mod.cmd_init(tmp_path / name)
+        assert mod.cmd_up(tmp_path / name) == 0
+    runs = [c for c in calls if c[:2] == ("run", "-d")]
+    assert len(runs) == 2
+    for run, name in zip(runs, ("a", "b"), strict=True):
+        assert f"{mod.UV_CACHE_VOLUME}:/uv-cache" in run
+        assert f"{soldr._volume_name(tmp_path / name, 'venv', 'python')}:/venv" in run
+    (create,) = {c for c in calls if c[:2] == ("volume", "create") and c[-1] == mod.UV_CACHE_VOLUME}
+    assert not any("project-key" in arg for arg in create)
+
+
+def test_shared_cache_is_never_a_gc_group(mod):
+    soldr = mod.soldr
+    ns = soldr.LABEL_NS
+    index = soldr.build_group_index(
+        [], [
+            {"name": mod.UV_CACHE_VOLUME, "created": 0.0,
+             "labels": {f"{ns}.managed": "true", f"{ns}.stack": "python"}},
+            {"name": "clud-docker-build-python-abc-venv", "created": 0.0, "labels": {}},
+        ], selected_key="", now=1.0, stack="python", root_exists=lambda _r: True)
+    assert set(index) == {"abc"}
+    assert index["abc"]["volumes"] == ["clud-docker-build-python-abc-venv"]
+
+
+def test_run_reports_cache_reuse(mod, monkeypatch, tmp_path, capsys):
+    soldr = mod.soldr
+    inventories = iter([BEFORE, AFTER])
+
+    def fake_docker(*args, check=True, capture=False):
+        if "python3" in args:
+            return SimpleNamespace(returncode=0, stdout=next(inventories))
+        if "du" in args:
+            return SimpleNamespace(returncode=0, stdout="40000000\t/uv-cache/archive-v0/aa\n"
+                                                        "40000000\ttotal\n")
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(soldr, "_docker", fake_docker)
+    mod.cmd_init(tmp_path)
+    assert mod.main([str(tmp_path), "run", "--", "uv", "sync", "--frozen"]) == 0
+    assert "1 hit / 1 miss of 2 installed, 40.0 MB" in capsys.readouterr().err
+
+
+def test_missing_subcommand_prints_usage(mod, tmp_path, capsys):
+    # Same as the soldr stack: no implicit `verify`, which is soldr-only.
+    assert mod.main([str(tmp_path)]) == 2
+    assert capsys.readouterr().err == mod.USAGE
+    assert mod.main([str(tmp_path), "verify"]) == 64
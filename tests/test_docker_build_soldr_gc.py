@@ -173,3 +173,65 @@ def test_rfc3339_volume_timestamps_parse(mod):
     assert mod._parse_docker_created_at("2026-07-28T11:04:46-07:00") is not None
     assert mod._parse_docker_created_at("2026-07-28T11:04:46Z") is not None
     assert mod._parse_docker_created_at("2026-07-28 11:04:46 -0700 PDT") is not None
+
+
+def test_one_inventory_pass_folds_into_a_group_index(mod):
+    """Containers and volumes from a single listing fold into per-key groups
+    that already hold everything removal needs — no per-key re-listing."""
+    ns = "com.clud.docker-build"
+    containers = [
+        {"id": "c1", "running": True, "created": 7200.0,
+         "labels": {f"{ns}.project-key": "aaa", f"{ns}.project-root": "/gone"}},
+        {"id": "c0", "running": False, "created": 3600.0,
+         "labels": {f"{ns}.project-key": "aaa"}},
+        {"id": "x", "running": True, "created": 0.0, "labels": {}},
+    ]
+    volumes = [
+        {"name": "clud-docker-build-soldr-aaa-target", "labels": {}, "created": 0.0},
+        {"name": "clud-docker-build-soldr-bbb-target", "labels": {}, "created": 0.0},
+        {"name": "clud-docker-build-soldr-bbb-cargo-home", "labels": {}, "created": None},
+        {"name": "odd-name", "labels": {f"{ns}.project-key": "bbb"}, "created": None},
+        {"name": "soldr-perf-target", "labels": {}, "created": 0.0},
+    ]
+    index = mod.build_group_index(containers, volumes, selected_key="bbb",
+                                  now=4 * 3600.0, root_exists=lambda root: False)
+    assert set(index) == {"aaa", "bbb"}
+    a, b = index["aaa"], index["bbb"]
+    assert a["containers"] == ["c0", "c1"]
+    assert a["referenced"] is True
+    assert a["root_exists"] is False
+    assert a["age_hours"] == 3.0  # oldest container wins over its volumes
+    assert b["volumes"] == ["clud-docker-build-soldr-bbb-cargo-home",
+                            "clud-docker-build-soldr-bbb-target", "odd-name"]
+    assert b["age_hours"] == 4.0  # containerless: aged by its oldest volume
+    assert b["root_exists"] is True  # no recorded root: never assumed gone
+    assert b["is_selected"] is True
+
+
+def test_cli_discovery_is_constant_in_the_number_of_groups(mod, monkeypatch):
+    from types import SimpleNamespace
+
+    calls = []
+    vols = "".join(f"clud-docker-build-soldr-k{n:02d}-target\t\n" for n in range(30))
+
+    def fake_docker(*args, **_kwargs):
+        calls.append(args)
+        if args[:2] == ("volume", "ls"):
+            return SimpleNamespace(returncode=0, stdout=vols + "unrelated\t\n")
+        if args[:2] == ("volume", "inspect"):
+            names = [a for a in args[2:] if not a.startswith(("--", "{{"))]
+            return SimpleNamespace(returncode=0, stdout="".join(
+                f"{n}\t2026-07-28T11:04:46Z\n" for n in names))
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(mod, "_engine_client", lambda: None)
+    monkeypatch.setattr(mod, "_docker", fake_docker)
+    groups = mod._discover_managed_groups("k00")
+    assert len(groups) == 30
+    assert len(calls) == 3
+    assert all(g["age_hours"] > 0 for g in groups)
+
+    calls.clear()
+    mod._remove_managed_groups(groups[1:])
+    assert len(calls) == 29  # one batched `volume rm` per group, no listing
+    assert all(c[:3] == ("volume", "rm", "-f") for c in calls)
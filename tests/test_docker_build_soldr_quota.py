@@ -0,0 +1,114 @@
+"""Disk-quota eviction for the soldr docker tool's `gc --max-total-gb`.
+
+`gc_plan` stays pure: groups arrive annotated with `total_bytes` and
+`last_used_hours`, and the quota pass evicts least-recently-used groups the
+age rules kept until the rest fit. The selected group and groups a running
+container references are never quota victims.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = (
+    ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker"
+    / "docker_build_soldr.py"
+)
+
+GB = 10**9
+
+
+@pytest.fixture(scope="module")
+def mod():
+    name = "clud_test_docker_build_soldr_quota"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop(name, None)
+
+
+def _group(key, *, gb, last_used_hours, is_selected=False, referenced=False):
+    return {
+        "project_key": key,
+        "age_hours": 1.0,
+        "root_exists": True,
+        "is_selected": is_selected,
+        "referenced": referenced,
+        "total_bytes": int(gb * GB),
+        "last_used_hours": last_used_hours,
+    }
+
+
+def test_quota_evicts_least_recently_used_until_it_fits(mod):
+    groups = [
+        _group("fresh", gb=10, last_used_hours=1),
+        _group("idle", gb=40, last_used_hours=30),
+        _group("older", gb=0.2, last_used_hours=40),
+    ]
+    remove, keep = mod.gc_plan(groups, max_total_bytes=15 * GB)
+    # LRU order, not size order: the tiny oldest group goes first, then the
+    # 40 GB one, at which point the rest fits.
+    assert remove == [("older", "quota-lru"), ("idle", "quota-lru")]
+    assert keep == [("fresh", "within-grace")]
+
+
+def test_quota_never_evicts_the_selected_or_a_referenced_group(mod):
+    groups = [
+        _group("me", gb=40, last_used_hours=100, is_selected=True),
+        _group("busy", gb=40, last_used_hours=90, referenced=True),
+        _group("idle", gb=1, last_used_hours=5),
+    ]
+    remove, keep = mod.gc_plan(groups, max_total_bytes=10 * GB)
+    assert remove == [("idle", "quota-lru")]
+    assert {k for k, _ in keep} == {"me", "busy"}
+
+
+def test_quota_only_adds_to_the_age_rules(mod):
+    groups = [
+        _group("gone", gb=5, last_used_hours=1),
+        _group("stale", gb=5, last_used_hours=60),
+        _group("ok", gb=5, last_used_hours=2),
+    ]
+    groups[0]["root_exists"] = False
+    groups[1]["age_hours"] = 60
+    remove, keep = mod.gc_plan(groups, max_total_bytes=100 * GB)
+    assert dict(remove) == {"gone": "worktree-gone", "stale": "stale-past-threshold"}
+    assert keep == [("ok", "within-grace")]
+    # No quota: sizes are ignored entirely.
+    assert mod.gc_plan(groups)[0] == remove
+
+
+def test_sizes_annotate_groups_and_parse_docker_units(mod):
+    assert mod.parse_size("1.5GB") == 1_500_000_000
+    assert mod.parse_size("512kB") == 512_000
+    assert mod.parse_size("0B") == 0
+    assert mod.parse_size("N/A") == 0
+    groups = [{"project_key": "a", "volumes": ["a-target", "a-cargo-home"]}]
+    mod.annotate_sizes(groups, {"a-target": 7 * GB})
+    assert groups[0]["volume_bytes"] == {"a-target": 7 * GB, "a-cargo-home": 0}
+    assert groups[0]["total_bytes"] == 7 * GB
+
+
+def test_last_used_follows_the_newest_container_or_volume(mod):
+    ns = "com.clud.docker-build"
+    index = mod.build_group_index(
+        [{"id": "c", "running": False, "created": 3600.0,
+          "labels": {f"{ns}.project-key": "a"}},
+         {"id": "r", "running": True, "created": 0.0,
+          "labels": {f"{ns}.project-key": "b"}}],
+        [{"name": "clud-docker-build-soldr-c-target", "labels": {}, "created": 0.0},
+         {"name": "clud-docker-build-soldr-c-cargo-home", "labels": {}, "created": 7200.0}],
+        selected_key="", now=10 * 3600.0, root_exists=lambda _r: True)
+    assert index["a"]["last_used_hours"] == 9.0
+    assert index["b"]["last_used_hours"] == 0.0  # running right now
+    assert index["c"]["last_used_hours"] == 8.0
+    assert index["c"]["age_hours"] == 10.0
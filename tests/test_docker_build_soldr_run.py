@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import sys
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 SCRIPT = (
     Path(__file__).resolve().parents[1]
     / "crates"
@@ -60,6 +63,17 @@ def test_non_cargo_commands_are_unchanged() -> None:
     ]
 
 
+def _running(module, path: Path) -> dict:
+    return {"State": {"Running": True}, "Config": {"Image": module._image_tag(path)}}
+
+
+def _env_args(module, path: Path) -> list[str]:
+    args: list[str] = []
+    for key, value in module.stack_env(path).items():
+        args += ["-e", f"{key}={value}"]
+    return args
+
+
 def test_run_uses_running_process_with_inherited_output(
     monkeypatch, tmp_path: Path
 ) -> None:
@@ -67,6 +81,7 @@ def test_run_uses_running_process_with_inherited_output(
     observed: list[tuple[list[str], dict]] = []
 
     monkeypatch.setattr(module, "cmd_up", lambda _path: 0)
+    monkeypatch.setattr(module, "_inspect_container", lambda _name: _running(module, tmp_path))
 
     def fake_run(argv: list[str], **kwargs):
         observed.append((argv, kwargs))
@@ -78,7 +93,92 @@ def test_run_uses_running_process_with_inherited_output(
     assert module.cmd_run(tmp_path, ["sh", "-c", "work"]) == 0
     assert observed == [
         (
-            ["docker", "exec", "-w", "/src", name, "sh", "-c", "work"],
+            ["docker", "exec", "-w", "/src", *_env_args(module, tmp_path),
+             name, "sh", "-c", "work"],
             {"check": False, "capture_output": False, "text": True},
         )
     ]
+
+
+def test_route_prefers_exec_into_a_healthy_idle_container(tmp_path: Path) -> None:
+    module = _load_module()
+    image = module._image_tag(tmp_path)
+
+    def info(image_tag=image, **state):
+        return {"State": state, "Config": {"Image": image_tag}}
+
+    assert module.run_route(info(Running=True), image) == "exec"
+    assert module.run_route(info(Running=False, Status="exited"), image) == "start"
+    assert module.run_route(None, image) == "up"
+    assert module.run_route(info(Running=True, Paused=True), image) == "run"
+    assert module.run_route(info(Running=True, Health={"Status": "unhealthy"}), image) == "run"
+    assert module.run_route(info("other:tag", Running=True), image) == "run"
+
+
+def test_unhealthy_container_falls_back_to_a_one_shot_run(
+    monkeypatch, tmp_path: Path
+) -> None:
+    module = _load_module()
+    stack = tmp_path / ".clud" / "docker-build" / "soldr"
+    stack.mkdir(parents=True)
+    (stack / "stack.toml").write_text(
+        module.STACK_TOML.replace('SOLDR_TRUST_MODE = "permissive"',
+                                  'SOLDR_TRUST_MODE = "strict"'))
+    calls: list[tuple[str, ...]] = []
+    paused = _running(module, tmp_path)
+    paused["State"]["Paused"] = True
+    monkeypatch.setattr(module, "_inspect_container", lambda _name: paused)
+    monkeypatch.setattr(module, "cmd_up", lambda _path: calls.append(("UP",)) or 0)
+    monkeypatch.setattr(
+        module, "_docker",
+        lambda *args, **_k: calls.append(args) or SimpleNamespace(returncode=3))
+
+    assert module.cmd_run(tmp_path, ["cargo", "check"]) == 3
+    (argv,) = calls
+    assert argv[:5] == ("run", "--rm", "--init", "-w", "/src")
+    assert f"{tmp_path.resolve()}:/src:ro" in argv
+    assert f"{module._volume_name(tmp_path, 'target')}:/target" in argv
+    assert "SOLDR_TRUST_MODE=strict" in argv
+    assert argv[-4:] == (module._image_tag(tmp_path), "soldr", "cargo", "check")
+
+    records = [json.loads(line) for line in (stack / module.RUN_LOG_NAME).read_text().splitlines()]
+    assert [(r["route"], r["exit"]) for r in records] == [("run", 3)]
+    assert records[0]["setup_seconds"] >= 0
+    assert records[0]["total_seconds"] == pytest.approx(
+        records[0]["setup_seconds"] + records[0]["command_seconds"], abs=1e-3
+    )
+
+
+def test_forced_one_shot_and_stopped_container_routes(monkeypatch, tmp_path: Path) -> None:
+    module = _load_module()
+    calls: list[tuple[str, ...]] = []
+    monkeypatch.setattr(
+        module, "_docker",
+        lambda *args, **_k: calls.append(args) or SimpleNamespace(returncode=0))
+    stopped = _running(module, tmp_path)
+    stopped["State"]["Running"] = False
+    monkeypatch.setattr(module, "_inspect_container", lambda _name: stopped)
+
+    assert module.cmd_run(tmp_path, ["true"]) == 0
+    assert [c[0] for c in calls] == ["start", "exec"]
+
+    calls.clear()
+    monkeypatch.setenv(module.RUN_MODE_ENV, "run")
+    monkeypatch.setattr(module, "_inspect_container", lambda _name: _running(module, tmp_path))
+    assert module.cmd_run(tmp_path, ["true"]) == 0
+    assert [c[0] for c in calls] == ["run"]
+
+
+def test_run_timings_summarize_per_route() -> None:
+    module = _load_module()
+    summary = module.summarize_run_timings([
+        {"route": "exec", "setup_seconds": 0.01, "command_seconds": 0.08},
+        {"route": "exec", "setup_seconds": 0.03, "command_seconds": 0.10},
+        {"route": "run", "setup_seconds": 0.02, "command_seconds": 0.9, "total_seconds": 0.92},
+        {"bogus": True},
+    ])
+    assert summary["exec"] == {
+        "count": 2, "total_p50": pytest.approx(0.11), "setup_p50": 0.02, "command_p50": 0.09,
+    }
+    assert summary["run"]["total_p50"] == 0.92
+    assert summary["run"]["count"] == 1
@@ -0,0 +1,153 @@
+"""Unit tests for the soldr docker-build stack's `snapshot` / `seed` pair.
+
+Key derivation and snapshot selection are pure and pinned directly; the
+export / import paths run against a scripted `_docker` that plays the
+container's part (writing the archive into the bind-mounted snapshot dir),
+so no Docker daemon is needed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = (
+    ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker"
+    / "docker_build_soldr.py"
+)
+
+
+@pytest.fixture
+def mod(tmp_path, monkeypatch):
+    name = "clud_test_docker_build_soldr_snapshot"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setenv(module.SNAPSHOT_DIR_ENV, str(tmp_path / "snapshots"))
+    try:
+        yield module
+    finally:
+        sys.modules.pop(name, None)
+
+
+def _project(root: Path, lock: str = "lock-v1\n") -> Path:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "Cargo.lock").write_text(lock)
+    stack = root / ".clud" / "docker-build" / "soldr"
+    stack.mkdir(parents=True, exist_ok=True)
+    (stack / "Dockerfile").write_text("ARG RUST_VERSION=1.94.1\nARG SOLDR_VERSION=0.8.44\n")
+    return root
+
+
+def test_key_follows_lockfile_toolchain_and_soldr_version(mod, tmp_path):
+    a = _project(tmp_path / "a")
+    b = _project(tmp_path / "b")
+    assert mod.snapshot_components(a) == mod.snapshot_components(b)
+
+    (b / "Cargo.lock").write_text("lock-v2\n")
+    ca, cb = mod.snapshot_components(a), mod.snapshot_components(b)
+    assert ca["lock"] != cb["lock"]
+    assert (ca["toolchain"], ca["soldr"]) == (cb["toolchain"], cb["soldr"])
+    assert mod.snapshot_key(ca) != mod.snapshot_key(cb)
+
+    (b / "rust-toolchain.toml").write_text('[toolchain]\nchannel = "1.95.0"\n')
+    assert mod.snapshot_components(b)["toolchain"] != ca["toolchain"]
+    assert mod._dockerfile_arg("ARG SOLDR_VERSION=0.9.0\n", "SOLDR_VERSION") == "0.9.0"
+
+
+def test_best_snapshot_prefers_exact_then_same_toolchain(mod):
+    want = {"lock": "L1", "toolchain": "T", "soldr": "S"}
+    near_old = {"components": {"lock": "L0", "toolchain": "T", "soldr": "S"}, "created": 1}
+    near_new = {"components": {"lock": "L2", "toolchain": "T", "soldr": "S"}, "created": 5}
+    other = {"components": {"lock": "L1", "toolchain": "T2", "soldr": "S"}, "created": 9}
+    exact = {"components": dict(want), "created": 2}
+
+    assert mod.best_snapshot([near_old, near_new, other, exact], want) == (exact, "exact")
+    assert mod.best_snapshot([near_old, near_new, other], want) == (near_new, "same-toolchain")
+    # Never seed across a toolchain bump: every artifact would be stale.
+    assert mod.best_snapshot([other], want) is None
+
+
+def _fake_docker(calls, *, existing=""):
+    def fake(*args, check=True, capture=False):
+        calls.append(args)
+        if args[:1] == ("run",) and "zstd -T0" in args[-1]:
+            snap = next(a.split(":", 1)[0] for a in args if a.endswith(":/snap"))
+            role = args[-1].rsplit("/", 1)[-1].removesuffix(".tar.zst")
+            Path(snap, f"{role}.tar.zst").write_bytes(b"z" * 10)
+        if args[:2] == ("ps", "-aq"):
+            return SimpleNamespace(returncode=0, stdout=existing)
+        if args[:1] == ("volume",) and args[1] == "create":
+            return SimpleNamespace(returncode=0, stdout=args[-1] + "\n")
+        return SimpleNamespace(returncode=0, stdout="")
+    return fake
+
+
+def test_snapshot_exports_each_volume_and_seed_imports_it(mod, tmp_path, monkeypatch):
+    src = _project(tmp_path / "main")
+    calls: list[tuple[str, ...]] = []
+    monkeypatch.setattr(mod, "_docker", _fake_docker(calls))
+    assert mod.cmd_snapshot(src) == 0
+
+    key = mod.snapshot_key(mod.snapshot_components(src))
+    snap = tmp_path / "snapshots" / key
+    meta = json.loads((snap / "meta.json").read_text())
+    assert meta["archive_bytes"] == {role: 10 for role in mod.SNAPSHOT_ROLES}
+    assert not (tmp_path / "snapshots" / f"{key}.partial").exists()
+    exports = [c for c in calls if c[:1] == ("run",)]
+    assert [c[3].split(":")[0] for c in exports] == [
+        mod._volume_name(src, role) for role in mod.SNAPSHOT_ROLES
+    ]
+    assert all(c[3].endswith(":/data:ro") for c in exports)
+    # Either side of the pipe failing must fail the export.
+    assert all(c[-3:-1] == ("bash", "-c") for c in exports)
+    assert all(c[-1].startswith("set -o pipefail; ") for c in exports)
+
+    # A new worktree on the same lockfile imports into its own volumes.
+    calls.clear()
+    wt = _project(tmp_path / "feature")
+    monkeypatch.setattr(mod, "_build_image", lambda _p: calls.append(("BUILD",)))
+    assert mod.cmd_seed(wt) == 0
+    imports = [c for c in calls if c[:1] == ("run",)]
+    assert [c[3] for c in imports] == [
+        f"{mod._volume_name(wt, role)}:/data" for role in mod.SNAPSHOT_ROLES
+    ]
+    assert all(c[5] == f"{snap.resolve()}:/snap:ro" for c in imports)
+    assert all(c[-1].startswith("set -o pipefail; ") for c in imports)
+
+
+def test_seed_refuses_a_live_group_and_skips_toolchain_mismatch(mod, tmp_path, monkeypatch, capsys):
+    src = _project(tmp_path / "main")
+    calls: list[tuple[str, ...]] = []
+    monkeypatch.setattr(mod, "_docker", _fake_docker(calls))
+    assert mod.cmd_snapshot(src) == 0
+
+    monkeypatch.setattr(mod, "_docker", _fake_docker(calls, existing="abc123\n"))
+    assert mod.cmd_seed(_project(tmp_path / "live")) == 2
+
+    calls.clear()
+    monkeypatch.setattr(mod, "_docker", _fake_docker(calls))
+    bumped = _project(tmp_path / "bumped")
+    (bumped / "rust-toolchain").write_text("1.96.0\n")
+    assert mod.cmd_seed(bumped) == 0
+    assert "first build will be cold" in capsys.readouterr().out
+    assert not [c for c in calls if c[:1] == ("run",)]
+
+
+def test_snapshot_keeps_only_the_newest(mod, tmp_path, monkeypatch):
+    calls: list[tuple[str, ...]] = []
+    monkeypatch.setattr(mod, "_docker", _fake_docker(calls))
+    monkeypatch.setattr(mod, "SNAPSHOT_KEEP", 2)
+    for n in range(3):
+        assert mod.cmd_snapshot(_project(tmp_path / f"p{n}", lock=f"lock-{n}\n")) == 0
+    kept = sorted(p.parent.name for p in (tmp_path / "snapshots").glob("*/meta.json"))
+    assert len(kept) == 2
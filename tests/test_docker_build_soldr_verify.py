@@ -0,0 +1,170 @@
+"""Unit tests for the soldr docker-build stack's `verify` benchmark.
+
+The parsers and the budget check are pure and pinned directly; the command
+path runs against a scripted `_docker` so the phase order (clean -> up ->
+cold -> warm no-op -> edit -> incremental) and the JSON report are asserted
+without a live Docker daemon.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = (
+    ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker"
+    / "docker_build_soldr.py"
+)
+
+
+@pytest.fixture
+def mod():
+    name = "clud_test_docker_build_soldr_verify"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    try:
+        yield module
+    finally:
+        sys.modules.pop(name, None)
+
+
+def test_cache_stats_parse_text_and_json(mod):
+    text = "Compile requests  12\nCache hits        9\nCache misses      3\n"
+    assert mod.parse_cache_stats(text) == (9, 3)
+    assert mod.parse_cache_stats('{"stats": {"hits": 4, "misses": 1}}') == (4, 1)
+    assert mod.parse_cache_stats("zccache: command not found") is None
+    assert mod.cache_delta((9, 3), (19, 3)) == {"hits": 10, "misses": 0, "hit_rate": 1.0}
+    assert mod.cache_delta((1, 1), (1, 1))["hit_rate"] is None
+    assert mod.cache_delta(None, (1, 1)) is None
+
+
+def test_du_output_maps_to_volume_roles(mod):
+    sizes = mod.parse_du("1024\t/target\n77\t/root/.soldr\nbogus\n")
+    assert sizes == {"target": 1024, "soldr-home": 77}
+
+
+def test_warm_noop_budget_and_baseline_tolerance(mod):
+    report = {"phases": [
+        {"name": "cold", "wall_seconds": 200.0},
+        {"name": "warm-noop", "wall_seconds": 31.0},
+    ]}
+    assert mod.verify_budget(report, None) == [
+        "warm-noop took 31.0s (budget 30s)",
+    ]
+    baseline = {"phases": [{"name": "cold", "wall_seconds": 150.0}]}
+    violations = mod.verify_budget(report, baseline, tolerance=0.25,
+                                   warm_noop_budget=60)
+    assert violations == ["cold took 200.0s vs baseline 150.0s (+25% allowed)"]
+    assert mod.verify_budget(report, baseline, tolerance=0.5, warm_noop_budget=60) == []
+
+
+def test_verify_runs_three_phases_and_writes_the_report(mod, tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    lib = tmp_path / "src" / "lib.rs"
+    lib.write_text("pub fn f() {}\n")
+    stack = tmp_path / ".clud" / "docker-build" / "soldr"
+    stack.mkdir(parents=True)
+    (stack / "Dockerfile").write_text("FROM scratch\n")
+    mtime_before = lib.stat().st_mtime - 100
+    os.utime(lib, (mtime_before, mtime_before))
+
+    calls: list[tuple[str, ...]] = []
+    hits = iter(range(0, 100, 5))
+
+    def fake_docker(*args, check=True, capture=False):
+        calls.append(args)
+        if args[:1] == ("exec",) and "zccache" in args:
+            n = next(hits)
+            return SimpleNamespace(returncode=0, stdout=f"Cache hits {n}\nCache misses 1\n")
+        if args[:1] == ("exec",) and "du" in args:
+            return SimpleNamespace(returncode=0, stdout="4096\t/target\n")
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(mod, "_docker", fake_docker)
+    monkeypatch.setattr(mod, "cmd_up", lambda _p: calls.append(("UP",)) or 0)
+    baseline = tmp_path / "base.json"
+    code = mod.cmd_verify(tmp_path, ["--save-baseline", str(baseline)])
+    assert code == 0
+
+    builds = [c for c in calls if c[:3] == ("exec", "-w", "/src")]
+    assert len(builds) == 3
+    assert builds[0][-3:] == ("soldr", "cargo", "build")
+    # `clean` (rm -f the container) happens before `up` and the cold build.
+    assert calls.index(("UP",)) < calls.index(builds[0])
+    assert any(c[:2] == ("rm", "-f") for c in calls[: calls.index(("UP",))])
+    assert lib.stat().st_mtime > mtime_before  # the incremental edit
+
+    report = json.loads((stack / "verify.json").read_text())
+    assert [p["name"] for p in report["phases"]] == ["cold", "warm-noop", "incremental"]
+    assert report["phases"][0]["zccache"] == {"hits": 5, "misses": 0, "hit_rate": 1.0}
+    assert report["phases"][0]["volume_bytes"] == {"target": 4096}
+    assert report["touched"] == "src/lib.rs"
+    assert report["ok"] is True
+    assert json.loads(baseline.read_text()) == report
+
+
+def test_verify_falls_back_to_soldr_and_warns_without_stats(mod, tmp_path, monkeypatch, capsys):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.rs").write_text("fn main() {}\n")
+    stack = tmp_path / ".clud" / "docker-build" / "soldr"
+    stack.mkdir(parents=True)
+    (stack / "Dockerfile").write_text("FROM scratch\n")
+    stats_via_soldr = [True]
+
+    def fake_docker(*args, check=True, capture=False):
+        if args[:3] == ("exec", mod._container_name(tmp_path), "zccache"):
+            return SimpleNamespace(returncode=127, stdout="")
+        if args[2:4] == ("soldr", "zccache"):
+            if stats_via_soldr[0]:
+                return SimpleNamespace(returncode=0, stdout="Cache hits 3\nCache misses 1\n")
+            return SimpleNamespace(returncode=1, stdout="")
+        return SimpleNamespace(returncode=0, stdout="")
+
+    monkeypatch.setattr(mod, "_docker", fake_docker)
+    monkeypatch.setattr(mod, "cmd_up", lambda _p: 0)
+    assert mod.cmd_verify(tmp_path, []) == 0
+    report = json.loads((stack / "verify.json").read_text())
+    assert report["phases"][0]["zccache"] == {"hits": 0, "misses": 0, "hit_rate": None}
+    assert "warning" not in capsys.readouterr().err
+
+    stats_via_soldr[0] = False
+    assert mod.cmd_verify(tmp_path, []) == 0
+    report = json.loads((stack / "verify.json").read_text())
+    assert report["phases"][0]["zccache"] is None
+    assert "verify: warning: no zccache stats" in capsys.readouterr().err
+
+
+def test_verify_stops_at_the_first_failed_phase(mod, tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.rs").write_text("fn main() {}\n")
+    stack = tmp_path / ".clud" / "docker-build" / "soldr"
+    stack.mkdir(parents=True)
+    (stack / "Dockerfile").write_text("FROM scratch\n")
+
+    def fake_docker(*args, check=True, capture=False):
+        failed = args[:3] == ("exec", "-w", "/src")
+        return SimpleNamespace(returncode=101 if failed else 1, stdout="")
+
+    monkeypatch.setattr(mod, "_docker", fake_docker)
+    monkeypatch.setattr(mod, "cmd_up", lambda _p: 0)
+    assert mod.cmd_verify(tmp_path, ["--", "cargo", "test"]) == 101
+    report = json.loads((stack / "verify.json").read_text())
+    assert [p["name"] for p in report["phases"]] == ["cold"]
+    assert report["command"] == ["soldr", "cargo", "test"]
+    assert report["ok"] is False
+
+
+def test_no_subcommand_prints_usage_instead_of_benchmarking(mod, capsys):
+    assert mod.main(["."]) == 2
+    assert "Subcommands:" in capsys.readouterr().err
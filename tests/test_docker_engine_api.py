@@ -0,0 +1,356 @@
+"""Unit tests for the shared Docker Engine API client and its consumers.
+
+The client speaks HTTP/1.1 over a Unix socket, so every test here runs it
+against a local stand-in engine (`FakeEngine`) bound to a short-lived
+temp socket — no Docker daemon, no network. The consumer tests then point
+`docker_recover.py` and `docker_build_soldr.py` at the same stand-in and
+assert their inventories come from the API, not from the CLI.
+"""
+
+from __future__ import annotations
+
+import http.server
+import importlib.util
+import json
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+DOCKER_TOOLS = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "docker"
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="the Engine API client targets Unix sockets"
+)
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, DOCKER_TOOLS / filename)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def api():
+    try:
+        yield _load("clud_docker_engine_api", "docker_engine_api.py")
+    finally:
+        sys.modules.pop("clud_docker_engine_api", None)
+
+
+class FakeEngine:
+    """A stand-in engine: canned JSON per `(method, path)`, requests recorded."""
+
+    def __init__(self, socket_path: Path, routes: dict) -> None:
+        self.routes = routes
+        self.requests: list[tuple[str, str, dict]] = []
+        engine = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                path = unquote(parts.path)
+                engine.requests.append((self.command, path, query))
+                status, body = engine.routes.get(
+                    (self.command, path), (404, {"message": "no such route"})
+                )
+                if callable(body):
+                    body = body(query)
+                raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _serve  # noqa: N815 - http.server dispatch name
+            do_DELETE = _serve  # noqa: N815
+
+            def address_string(self):
+                return "fake-engine"
+
+            def log_message(self, *_args):
+                pass
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        self.server = Server(str(socket_path), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def sock():
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can exceed it.
+    import tempfile
+
+    directory = Path(tempfile.mkdtemp(prefix="clud-eng-"))
+    try:
+        yield directory / "docker.sock"
+    finally:
+        import shutil
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+PING = {("GET", "/_ping"): (200, b"OK")}
+
+
+def test_socket_path_honours_docker_host(api):
+    assert api.resolve_socket_path({}, platform_name="linux") == api.DEFAULT_SOCKET
+    assert (
+        api.resolve_socket_path({"DOCKER_HOST": "unix:///run/user/1000/docker.sock"},
+                                platform_name="linux")
+        == "/run/user/1000/docker.sock"
+    )
+    # Remote engines and Windows pipes stay on the CLI.
+    assert api.resolve_socket_path({"DOCKER_HOST": "tcp://10.0.0.2:2376"},
+                                   platform_name="linux") is None
+    assert api.resolve_socket_path({}, platform_name="win32") is None
+
+
+def test_connect_returns_none_without_a_socket(api, sock):
+    assert api.connect(env={"DOCKER_HOST": f"unix://{sock}"}) is None
+
+
+def test_connect_pings_and_lists_over_one_connection(api, sock):
+    routes = {
+        **PING,
+        ("GET", "/images/json"): (200, [{"Id": "sha256:a", "RepoTags": ["r:1"]}]),
+        ("GET", "/volumes"): (200, {"Volumes": [{"Name": "v1"}], "Warnings": None}),
+    }
+    with FakeEngine(sock, routes) as engine:
+        client = api.connect(env={"DOCKER_HOST": f"unix://{sock}"})
+        assert client is not None
+        assert client.images()[0]["Id"] == "sha256:a"
+        assert client.volumes(filters={"dangling": ["true"]}) == [{"Name": "v1"}]
+        client.close()
+    _method, _path, query = engine.requests[-1]
+    assert json.loads(query["filters"]) == {"dangling": ["true"]}
+    assert engine.requests[1][2] == {"all": "1"}
+
+
+def test_http_errors_are_attributed_not_raised_for_deletes(api, sock):
+    routes = {
+        ("DELETE", "/images/sha256:busy"): (409, {"message": "image is being used"}),
+        ("DELETE", "/volumes/gone"): (204, b""),
+    }
+    with FakeEngine(sock, routes):
+        client = api.EngineClient(str(sock))
+        assert client.remove_image("sha256:busy") == (409, "image is being used")
+        assert client.remove_volume("gone") == (204, "")
+        with pytest.raises(api.EngineApiError) as err:
+            client.system_df()
+        assert err.value.status == 404
+        client.close()
+
+
+def test_reset_connections_retry_reads_but_never_deletes(api, sock):
+    accepted: list[bytes] = []
+
+    class Hangup(socketserver.BaseRequestHandler):
+        def handle(self):
+            # Read the request, then close without answering: what a client
+            # sees when a kept-alive connection went stale under it.
+            accepted.append(self.request.recv(65536).split(b" ", 1)[0])
+
+    server = socketserver.ThreadingUnixStreamServer(str(sock), Hangup)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = api.EngineClient(str(sock))
+        with pytest.raises(api.EngineApiError, match="closed the connection"):
+            client.request("GET", "/_ping")
+        assert accepted == [b"GET", b"GET"]
+        with pytest.raises(api.EngineApiError, match="closed the connection"):
+            client.remove_volume("data")
+        assert accepted == [b"GET", b"GET", b"DELETE"]
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_container_inspect_returns_none_when_absent(api, sock):
+    routes = {("GET", "/containers/idle/json"): (200, {"State": {"Running": True}})}
+    with FakeEngine(sock, routes):
+        client = api.EngineClient(str(sock))
+        assert client.container("idle") == {"State": {"Running": True}}
+        assert client.container("gone") is None
+        client.close()
+
+
+# ---- consumers -------------------------------------------------------------
+def test_docker_recover_gc_inventory_comes_from_the_api(api, sock, monkeypatch):
+    dr = _load("clud_test_docker_recover_api", "docker_recover.py")
+    try:
+        routes = {
+            **PING,
+            ("GET", "/containers/json"): (
+                200,
+                lambda q: [
+                    {"Id": "c-run", "State": "running", "Created": 100,
+                     "ImageID": "sha256:used", "Image": "app:1"},
+                    *(
+                        []
+                        if q.get("all") != "1"
+                        else [{"Id": "c-dead", "State": "exited", "Created": 50}]
+                    ),
+                ],
+            ),
+            ("GET", "/images/json"): (
+                200,
+                [
+                    {"Id": "sha256:used", "RepoTags": ["app:1"], "Created": 10, "Size": 5},
+                    {"Id": "sha256:old", "RepoTags": ["<none>:<none>"], "Created": 20,
+                     "Size": 7},
+                ],
+            ),
+            ("GET", "/volumes"): (
+                200,
+                lambda q: {
+                    "Volumes": [{"Name": "a" * 64}]
+                    if "filters" in q
+                    else [{"Name": "a" * 64}, {"Name": "named", "Labels": {}}]
+                },
+            ),
+        }
+
+        def no_cli(*_args, **_kwargs):
+            raise AssertionError("the API path must not shell out to docker")
+
+        monkeypatch.setattr(dr, "_run", no_cli)
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{sock}")
+        with FakeEngine(sock, routes):
+            inventory = dr.gather_gc_inventory()
+        images = {i.id: i for i in inventory.images}
+        assert images["sha256:used"].in_use is True
+        assert images["sha256:old"].dangling
+        assert not images["sha256:old"].in_use
+        assert images["sha256:old"].size_bytes == 7
+        assert {c.id: c.running for c in inventory.containers} == {
+            "c-run": True,
+            "c-dead": False,
+        }
+        volumes = {v.name: v for v in inventory.volumes}
+        assert volumes["a" * 64].anonymous
+        assert not volumes["a" * 64].in_use
+        assert not volumes["named"].anonymous
+        assert volumes["named"].in_use
+    finally:
+        sys.modules.pop("clud_test_docker_recover_api", None)
+
+
+def test_docker_recover_gc_deletes_in_parallel_over_the_api(api, sock, monkeypatch):
+    dr = _load("clud_test_docker_recover_api", "docker_recover.py")
+    try:
+        routes = {
+            ("DELETE", "/containers/dead"): (204, b""),
+            ("DELETE", "/images/sha256:old"): (200, [{"Deleted": "sha256:old"}]),
+            ("DELETE", "/images/sha256:shared"): (
+                409,
+                {"message": "conflict: image is referenced in multiple repositories"},
+            ),
+            ("DELETE", "/volumes/" + "a" * 64): (204, b""),
+        }
+        plan = dr.GcPlan(
+            images=[
+                dr.GcImage("sha256:old", [], 0, 7, False),
+                dr.GcImage("sha256:shared", [], 0, 11, False),
+            ],
+            containers=[dr.GcContainer("dead", False, 0, 2)],
+            volumes=[dr.GcVolume("a" * 64, True, False, 5)],
+            age_hours=24,
+            on_system_volume=False,
+        )
+
+        def no_cli(*_args, **_kwargs):
+            raise AssertionError("the API path must not shell out to docker")
+
+        monkeypatch.setattr(dr, "_run", no_cli)
+        client = api.EngineClient(str(sock))
+        with FakeEngine(sock, routes) as engine:
+            result = dr.execute_gc(plan, client=client)
+        # The workers closed their own connections; the caller's client is
+        # still open for reuse but holds no pool sockets.
+        assert not client._open
+        assert (result.containers_removed, result.images_removed, result.volumes_removed) == (
+            1,
+            1,
+            1,
+        )
+        assert result.freed_bytes == 2 + 7 + 5
+        assert [(f.kind, f.ref) for f in result.failures] == [("images", "sha256:shared")]
+        assert "multiple repositories" in result.failures[0].message
+        assert result.by_class["images"].failed == 1
+        assert engine.requests[0][:2] == ("DELETE", "/containers/dead")
+    finally:
+        sys.modules.pop("clud_test_docker_recover_api", None)
+
+
+def test_docker_recover_falls_back_to_cli_without_a_socket(api, sock, monkeypatch):
+    dr = _load("clud_test_docker_recover_api", "docker_recover.py")
+    try:
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{sock}")  # nothing listening
+        calls = []
+        monkeypatch.setattr(dr, "_run", lambda cmd, **_k: calls.append(cmd))
+        inventory = dr.gather_gc_inventory()
+        assert inventory.images == []
+        assert any(cmd[:3] == ["docker", "image", "ls"] for cmd in calls)
+    finally:
+        sys.modules.pop("clud_test_docker_recover_api", None)
+
+
+def test_soldr_group_discovery_comes_from_the_api(api, sock, monkeypatch):
+    soldr = _load("clud_test_docker_build_soldr_api", "docker_build_soldr.py")
+    try:
+        ns = "com.clud.docker-build"
+        routes = {
+            **PING,
+            ("GET", "/containers/json"): (
+                200,
+                [{"Labels": {f"{ns}.project-key": "abc123",
+                             f"{ns}.project-root": "/nonexistent/worktree"},
+                  "Created": 1_000}],
+            ),
+            ("GET", "/volumes"): (
+                200,
+                {"Volumes": [
+                    {"Name": "clud-docker-build-soldr-legacy1-target",
+                     "CreatedAt": "2026-07-28T11:04:46Z"},
+                    {"Name": "soldr-perf-target", "CreatedAt": "2026-07-28T11:04:46Z"},
+                ]},
+            ),
+        }
+
+        def no_cli(*_args, **_kwargs):
+            raise AssertionError("the API path must not shell out to docker")
+
+        monkeypatch.setattr(soldr, "_docker", no_cli)
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{sock}")
+        with FakeEngine(sock, routes):
+            groups = {g["project_key"]: g for g in soldr._discover_managed_groups("x")}
+        assert set(groups) == {"abc123", "legacy1"}
+        assert groups["abc123"]["root_exists"] is False
+        # The legacy group got its age from the volume's own CreatedAt.
+        assert groups["legacy1"]["age_hours"] != 0.0
+    finally:
+        sys.modules.pop("clud_test_docker_build_soldr_api", None)
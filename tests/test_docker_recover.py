@@ -16,6 +16,7 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import io
+import json
 import ntpath
 import sys
 from pathlib import Path
@@ -330,19 +331,150 @@ def test_wait_for_docker_is_bounded_and_polls(dr):
         return calls["n"] >= 3  # ready on the third poll
 
     sleeps: list[float] = []
-    ready = dr.wait_for_docker(check=check, sleep=sleeps.append, out=io.StringIO())
+    out = io.StringIO()
+    ready = dr.wait_for_docker(check=check, sleep=sleeps.append, out=out)
     assert ready is True
     assert calls["n"] == 3
-    assert sleeps == [dr.READY_INTERVAL_SECONDS, dr.READY_INTERVAL_SECONDS]
+    # Exponential backoff from the initial gap, not a fixed 2s interval.
+    first = dr.READY_BACKOFF_INITIAL_SECONDS
+    assert sleeps == [first, first * 2]
+    assert f"engine ready after 3 attempt(s) in {first * 3:.2f}s" in out.getvalue()
 
 
-def test_wait_for_docker_gives_up_after_attempts(dr):
+def test_wait_for_docker_backoff_is_capped_and_bounded_by_the_budget(dr):
     sleeps: list[float] = []
     ready = dr.wait_for_docker(
         check=lambda: False, attempts=4, interval=2.0, sleep=sleeps.append, out=io.StringIO()
     )
     assert ready is False
-    assert len(sleeps) == 3  # no sleep after the final failed attempt
+    assert max(sleeps) == 2.0  # never slower than the old fixed interval
+    assert sum(sleeps) == pytest.approx(8.0)  # attempts x interval, no more
+
+
+def test_wait_for_docker_wakes_on_the_engine_socket(dr, monkeypatch, tmp_path):
+    if sys.platform != "linux":
+        pytest.skip("inotify is Linux-only")
+    sock = tmp_path / "docker.sock"
+    watcher = dr._SocketDirWatcher(str(sock))
+    try:
+        assert watcher.wait(0.05) is False
+        (tmp_path / "unrelated").touch()
+        assert watcher.wait(0.05) is False
+        sock.touch()
+        assert watcher.wait(5.0) is True
+    finally:
+        watcher.close()
+
+    # Wired into the default readiness path: the check comes back true after
+    # the socket appears, and nothing is slept while the watcher waits.
+    calls = {"n": 0}
+
+    def check():
+        calls["n"] += 1
+        return calls["n"] > 1
+
+    class Watcher:
+        def __init__(self):
+            self.closed = False
+
+        def wait(self, _timeout):
+            return True
+
+        def close(self):
+            self.closed = True
+
+    fake = Watcher()
+    monkeypatch.setattr(dr, "_engine_readiness", lambda: (check, fake))
+    sleeps: list[float] = []
+    out = io.StringIO()
+    assert dr.wait_for_docker(sleep=sleeps.append, out=out) is True
+    assert sleeps == []
+    assert fake.closed
+    assert "socket watch" in out.getvalue()
+
+
+def test_readiness_uses_the_cli_only_when_the_engine_is_not_a_local_socket(
+    dr, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    monkeypatch.setattr(dr, "docker_server_version", lambda: "27.0.1")
+    # A remote engine, then a docker context (Docker Desktop for Linux).
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.2:2376")
+    check, watcher = dr._engine_readiness()
+    assert (watcher, check()) == (None, True)
+    monkeypatch.delenv("DOCKER_HOST")
+    (tmp_path / "config.json").write_text(json.dumps({"currentContext": "desktop-linux"}))
+    check, watcher = dr._engine_readiness()
+    assert (watcher, check()) == (None, True)
+
+    # A local socket that does not answer: no CLI spawn per attempt.
+    (tmp_path / "config.json").write_text(json.dumps({"currentContext": "default"}))
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{tmp_path / 'docker.sock'}")
+    (tmp_path / "docker.sock").touch()
+
+    def no_cli():
+        raise AssertionError("a local socket engine must not poll the CLI")
+
+    monkeypatch.setattr(dr, "docker_server_version", no_cli)
+    check, watcher = dr._engine_readiness()
+    try:
+        assert check() is False
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+def test_wait_for_docker_wakes_when_the_socket_appears(dr, monkeypatch):
+    if sys.platform != "linux":
+        pytest.skip("inotify is Linux-only")
+    import http.server
+    import shutil
+    import socketserver
+    import tempfile
+    import threading
+
+    class Ping(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"OK")
+
+        def address_string(self):
+            return "engine"
+
+        def log_message(self, *_args):
+            pass
+
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can exceed it.
+    directory = Path(tempfile.mkdtemp(prefix="clud-ready-"))
+    sock = directory / "docker.sock"
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{sock}")
+    monkeypatch.setattr(dr, "docker_server_version", lambda: None)
+    servers = []
+
+    def start_engine():
+        server = socketserver.UnixStreamServer(str(sock), Ping)
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Backoff alone would not check again for ~2s after this point.
+    starter = threading.Timer(1.0, start_engine)
+    starter.start()
+    out = io.StringIO()
+    try:
+        assert dr.wait_for_docker(attempts=1, interval=10.0, out=out) is True
+    finally:
+        starter.join()
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(directory, ignore_errors=True)
+    printed = out.getvalue()
+    assert "socket watch" in printed
+    ready_in = float(printed.rsplit(" in ", 1)[1].rstrip("s\n"))
+    assert ready_in < 1.75
 
 
 def test_verify_recovery_checks_api_then_container(dr, monkeypatch):
@@ -853,6 +985,101 @@ def test_doctor_reports_unhealthy_engine(dr, monkeypatch):
     assert dr.cmd_doctor(_namespace()) == dr.EXIT_UNHEALTHY
 
 
+def test_snapshot_probes_run_concurrently(dr):
+    """Two probes that each wait for the other only finish when run in parallel."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet():
+        barrier.wait()
+        return "met"
+
+    results, timings = dr.run_probes({"a": meet, "b": meet}, deadline=5.0)
+    assert results == {"a": "met", "b": "met"}
+    assert [t.status for t in timings] == [dr.PROBE_STATUS_OK] * 2
+
+
+def test_snapshot_deadline_abandons_a_hung_probe(dr):
+    """A hung engine costs one deadline, and its probe degrades to the default."""
+    import threading
+
+    release = threading.Event()
+    try:
+        results, timings = dr.run_probes(
+            {"engine": lambda: release.wait(10) and "late", "disk": lambda: 7},
+            defaults={"engine": ("timeout", "deadline")},
+            deadline=0.2,
+        )
+    finally:
+        release.set()
+    assert results == {"engine": ("timeout", "deadline"), "disk": 7}
+    by_name = {t.name: t for t in timings}
+    assert by_name["engine"].status == dr.PROBE_STATUS_DEADLINE
+    assert by_name["engine"].seconds == pytest.approx(0.2)
+    assert by_name["disk"].status == dr.PROBE_STATUS_OK
+
+
+def test_snapshot_probe_error_uses_default(dr):
+    def boom():
+        raise RuntimeError("probe blew up")
+
+    results, timings = dr.run_probes({"processes": boom}, defaults={"processes": []})
+    assert results == {"processes": []}
+    assert timings[0].status == dr.PROBE_STATUS_ERROR
+
+
+def test_gather_snapshot_probes_engine_once_and_times_every_probe(dr, monkeypatch):
+    calls = {"engine": 0}
+
+    def engine():
+        calls["engine"] += 1
+        return dr.ENGINE_SERVER_ERROR, "500 Internal Server Error"
+
+    monkeypatch.setattr(dr.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(dr, "docker_cli_present", lambda: True)
+    monkeypatch.setattr(dr, "probe_engine", engine)
+    monkeypatch.setattr(dr, "list_docker_processes", lambda: ["dockerd"])
+    monkeypatch.setattr(dr, "host_free_memory", lambda: 8 * 1024**3)
+    monkeypatch.setattr(dr, "host_free_disk", lambda: 100 * 1024**3)
+
+    snap = dr.gather_snapshot()
+    assert calls["engine"] == 1
+    assert snap.server_ok is False
+    assert snap.engine_state == dr.ENGINE_SERVER_ERROR
+    assert snap.runtime_processes == ["dockerd"]
+    assert {t.name for t in snap.probe_timings} == {
+        "engine",
+        "processes",
+        "free-memory",
+        "free-disk",
+    }
+
+
+def test_doctor_prints_probe_latency_table(dr, monkeypatch, capsys):
+    monkeypatch.setattr(dr.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(
+        dr,
+        "gather_snapshot",
+        lambda: dr.HealthSnapshot(
+            client_present=True,
+            server_ok=True,
+            free_disk_bytes=100 * 1024**3,
+            free_mem_bytes=8 * 1024**3,
+            probe_timings=[
+                dr.ProbeTiming("free-disk", 0.001, dr.PROBE_STATUS_OK),
+                dr.ProbeTiming("engine", 25.0, dr.PROBE_STATUS_DEADLINE),
+            ],
+        ),
+    )
+    assert dr.cmd_doctor(_namespace()) == dr.EXIT_OK
+    printed = capsys.readouterr().out
+    assert "probe latency:" in printed
+    # Slowest first, so the culprit is the first row.
+    assert printed.index("engine") < printed.index("free-disk")
+    assert "deadline" in printed
+
+
 # --------------------------------------------------------------------------
 # Garbage collection (dangling Docker objects).
 # --------------------------------------------------------------------------
@@ -911,6 +1138,298 @@ def test_gc_never_touches_running_or_in_use_images(dr):
     assert {c.id for c in plan.containers} == {"dead"}
 
 
+def test_gc_cli_batch_attributes_each_failure(dr):
+    busy = "sha256:" + "b" * 64
+    refs = ["sha256:" + "a" * 64, busy, "sha256:" + "c" * 64]
+    stderr = (
+        "Error response from daemon: conflict: unable to delete bbbbbbbbbbbb "
+        "(cannot be forced) - image is being used by running container 1f2e\n"
+    )
+    outcomes = dict(dr.attribute_cli_batch(refs, 1, stderr))
+    assert outcomes[busy].startswith("Error response from daemon: conflict")
+    assert outcomes[refs[0]] is None
+    assert outcomes[refs[2]] is None
+    # An error naming nothing in the batch is charged to all of it.
+    blamed = dr.attribute_cli_batch(["x", "y"], 1, "permission denied\n")
+    assert blamed == [("x", "permission denied"), ("y", "permission denied")]
+
+
+def test_execute_gc_batches_cli_removals_and_reports_per_class(dr, monkeypatch):
+    plan = dr.GcPlan(
+        images=[
+            _img(dr, f"dangling{i}", hours_old=99, size=10) for i in range(dr.GC_CLI_BATCH + 1)
+        ],
+        containers=[dr.GcContainer(id="dead", running=False, created_epoch=0, size_bytes=3)],
+        volumes=[dr.GcVolume(name="a" * 64, anonymous=True, in_use=False, size_bytes=5)],
+        age_hours=24,
+        on_system_volume=False,
+    )
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        if cmd[:3] == ["docker", "volume", "rm"]:
+            return dr.CompletedProcess(cmd, 1, stdout="", stderr=f"Error: {cmd[3]} is in use\n")
+        return dr.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(dr, "engine_client", lambda: None)
+    monkeypatch.setattr(dr, "_run", fake_run)
+    result = dr.execute_gc(plan)
+    # One call per batch, not per object; containers go first.
+    assert calls[0] == ["docker", "rm", "dead"]
+    image_calls = [c for c in calls if c[:3] == ["docker", "image", "rm"]]
+    assert sorted(len(c) - 3 for c in image_calls) == [1, dr.GC_CLI_BATCH]
+    assert result.images_removed == dr.GC_CLI_BATCH + 1
+    assert result.by_class["images"].freed_bytes == 10 * (dr.GC_CLI_BATCH + 1)
+    assert result.containers_removed == 1
+    assert result.volumes_removed == 0
+    assert result.by_class["volumes"].failed == 1
+    assert [(f.kind, f.ref) for f in result.failures] == [("volumes", "a" * 64)]
+    assert result.freed_bytes == 10 * (dr.GC_CLI_BATCH + 1) + 3
+
+
+def test_free_target_picks_fewest_objects_old_tier_first(dr):
+    def short(name):
+        return dr._short_id("sha256:" + name)
+
+    inv = dr.GcInventory(
+        images=[
+            _img(dr, "old-small", hours_old=48),
+            _img(dr, "old-big", hours_old=48),
+            _img(dr, "young-huge", hours_old=1),
+            _img(dr, "old-in-use", hours_old=48, in_use=True),
+        ],
+        volumes=[
+            dr.GcVolume(name="a" * 64, anonymous=True, in_use=False),
+            dr.GcVolume(name="named", anonymous=False, in_use=False),
+        ],
+    )
+    gib = 1024**3
+    usage = dr.GcDiskUsage(
+        images={
+            short("old-small"): 1 * gib,
+            short("old-big"): 8 * gib,
+            short("young-huge"): 30 * gib,
+            short("old-in-use"): 50 * gib,
+        },
+        volumes={"a" * 64: 4 * gib, "named": 90 * gib},
+    )
+    plan = dr.plan_gc_target(
+        inv, usage, target_bytes=10 * gib, now=NOW, on_system_volume=False
+    )
+    # Old tier, largest first: 8 GiB image + 4 GiB volume reach 10 GiB; the
+    # 1 GiB image is not needed and the young 30 GiB one is not touched.
+    assert {i.id for i in plan.images} == {"sha256:old-big"}
+    assert [v.name for v in plan.volumes] == ["a" * 64]
+    assert plan.reclaimable_bytes == 12 * gib
+    assert plan.shortfall_bytes == 0
+
+    # A target beyond the old tier dips into younger objects, never unsafe ones.
+    plan = dr.plan_gc_target(
+        inv, usage, target_bytes=40 * gib, now=NOW, on_system_volume=False
+    )
+    assert "sha256:young-huge" in {i.id for i in plan.images}
+    assert "sha256:old-in-use" not in {i.id for i in plan.images}
+    assert "named" not in {v.name for v in plan.volumes}
+
+    plan = dr.plan_gc_target(
+        inv, usage, target_bytes=500 * gib, now=NOW, on_system_volume=False
+    )
+    assert plan.shortfall_bytes == 500 * gib - 43 * gib
+
+
+def test_system_df_parses_api_and_cli_shapes(dr):
+    api = dr.parse_system_df(
+        {
+            "Images": [{"Id": "sha256:" + "1" * 64, "Size": 900, "SharedSize": 600}],
+            "Containers": [{"Id": "c" * 64, "SizeRw": 42}],
+            "Volumes": [{"Name": "v", "UsageData": {"Size": 7, "RefCount": 0}}],
+        }
+    )
+    assert api.images == {"1" * 12: 300}
+    assert api.containers == {"c" * 12: 42}
+    assert api.volumes == {"v": 7}
+    cli = dr.parse_system_df(
+        {
+            "Images": [{"ID": "2" * 12, "Size": "2GB", "SharedSize": "1GB", "UniqueSize": "1GB"}],
+            "Containers": [{"ID": "d" * 12, "Size": "5MB"}],
+            "Volumes": [{"Name": "v", "Size": "1.5kB"}],
+        }
+    )
+    assert cli.images == {"2" * 12: 10**9}
+    assert cli.containers == {"d" * 12: 5 * 10**6}
+    assert cli.volumes == {"v": 1500}
+
+
+def test_free_target_size_parsing(dr):
+    assert dr.parse_byte_size("20GiB") == 20 * 1024**3
+    assert dr.parse_byte_size("500MB") == 500 * 10**6
+    assert dr.parse_byte_size("1.5G") == int(1.5 * 1024**3)
+    for bad in ("twenty", "20XB", "0GiB", ""):
+        with pytest.raises(ValueError, match="size"):
+            dr.parse_byte_size(bad)
+    with pytest.raises(SystemExit):
+        dr.build_parser().parse_args(["gc", "--free-target", "lots"])
+
+
+def test_gc_free_target_prints_plan_before_executing(dr, monkeypatch, capsys):
+    monkeypatch.setattr(dr, "docker_server_version", lambda: "27.0")
+    monkeypatch.setattr(dr, "_data_disk_on_system_volume", lambda: False)
+    monkeypatch.setattr(dr, "host_free_disk", lambda: 1024**3)
+    monkeypatch.setattr(
+        dr,
+        "gather_gc_inventory",
+        lambda: dr.GcInventory(images=[_img(dr, "dangling-big", hours_old=99)]),
+    )
+    monkeypatch.setattr(
+        dr, "gather_disk_usage", lambda: dr.GcDiskUsage(images={"dangling-big": 25 * 1024**3})
+    )
+
+    def no_execute(_plan):
+        raise AssertionError("--dry-run must not remove anything")
+
+    monkeypatch.setattr(dr, "execute_gc", no_execute)
+    args = dr.build_parser().parse_args(["gc", "--free-target", "20GiB", "--dry-run"])
+    assert dr.cmd_gc(args) == dr.EXIT_OK
+    printed = capsys.readouterr().out
+    assert "free-target plan: 20.0 GiB requested, ~25.0 GiB projected" in printed
+    assert "dangling-big" in printed
+
+
+# --------------------------------------------------------------------------
+# monitor: trend, trigger, JSONL.
+# --------------------------------------------------------------------------
+GIB = 1024**3
+
+
+def _sample(dr, ts, free_gib, *, state=None):
+    return dr.MonitorSample(
+        ts=ts,
+        engine_state=state or dr.ENGINE_OK,
+        api_latency_ms=1.0,
+        api_via="socket",
+        free_disk_bytes=int(free_gib * GIB),
+        free_mem_bytes=8 * GIB,
+    )
+
+
+def test_monitor_trend_predicts_exhaustion_and_triggers_gc(dr):
+    # 40 GiB free, falling 10 GiB/h: low disk in under 4h.
+    history = [_sample(dr, i * 600.0, 40 - i * 10 / 6) for i in range(6)]
+    rate = dr.disk_trend(history)
+    assert rate == pytest.approx(-10 * GIB)
+    decision = dr.monitor_decision(history, horizon_hours=6)
+    assert decision.remedy == "gc"
+    headroom = history[-1].free_disk_bytes - dr.LOW_DISK_BYTES
+    assert decision.hours_to_low_disk == pytest.approx(headroom / (10 * GIB))
+    # Same fall, shorter horizon: nothing to do yet.
+    assert dr.monitor_decision(history, horizon_hours=1).remedy is None
+    # And not again inside the cooldown.
+    later = dr.monitor_decision(history, horizon_hours=6, last_remedy_ts=history[-1].ts - 60)
+    assert later.remedy is None
+    assert "cooling down" in later.reason
+
+
+def test_monitor_needs_enough_samples_for_a_trend(dr):
+    history = [_sample(dr, 0, 40), _sample(dr, 60, 20)]
+    assert dr.disk_trend(history) is None
+    assert dr.monitor_decision(history).remedy is None
+
+
+def test_monitor_restart_needs_a_streak_and_opt_in(dr):
+    down = [_sample(dr, i * 60.0, 100, state=dr.ENGINE_UNREACHABLE) for i in range(2)]
+    assert "waiting" in dr.monitor_decision(down, allow_restart=True).reason
+    down.append(_sample(dr, 180.0, 100, state=dr.ENGINE_UNREACHABLE))
+    assert dr.monitor_decision(down).remedy is None
+    assert dr.monitor_decision(down, allow_restart=True).remedy == "restart"
+
+
+def test_monitor_skips_gc_while_the_engine_is_down(dr):
+    # Low disk AND a dead engine: gc cannot run, so restart is the rung.
+    down = [_sample(dr, i * 60.0, 1, state=dr.ENGINE_UNREACHABLE) for i in range(3)]
+    decision = dr.monitor_decision(down, allow_restart=True)
+    assert decision.remedy == "restart"
+    assert dr.monitor_decision(down[:1], allow_restart=True).remedy is None
+    up = [*down, _sample(dr, 240.0, 1)]
+    assert dr.monitor_decision(up).remedy == "gc"
+
+
+def test_monitor_watches_the_docker_data_root(dr, tmp_path, monkeypatch):
+    class Client:
+        def __init__(self, root):
+            self.root = root
+
+        def info(self):
+            return {"DockerRootDir": self.root}
+
+    assert dr.monitor_disk_path(Client(str(tmp_path))) == str(tmp_path)
+    # Docker Desktop reports a path inside its VM; watch the cwd instead.
+    monkeypatch.setattr(dr, "_run", lambda _cmd, *_a, **_k: None)
+    assert dr.monitor_disk_path(Client("/var/lib/docker-in-the-vm")) is None
+
+
+def test_monitor_jsonl_rotates(dr, tmp_path):
+    log = tmp_path / "monitor.jsonl"
+    for i in range(10):
+        dr.append_jsonl_rotating(log, {"i": i, "pad": "x" * 40}, max_bytes=200, keep=2)
+    assert log.exists()
+    assert (tmp_path / "monitor.jsonl.1").exists()
+    assert (tmp_path / "monitor.jsonl.2").exists()
+    assert not (tmp_path / "monitor.jsonl.3").exists()
+    last = log.read_text().splitlines()[-1]
+    assert json.loads(last)["i"] == 9
+
+
+def test_cmd_monitor_logs_samples_and_runs_gc_once(dr, monkeypatch, tmp_path, capsys):
+    free = iter([40, 38, 36, 34, 32, 30, 28, 26])
+    clock = iter(range(0, 10_000, 600))
+
+    def fake_sample(_client, **_kwargs):
+        return _sample(dr, float(next(clock)), next(free))
+
+    remedies = []
+    monkeypatch.setattr(dr, "engine_client", lambda: None)
+    monkeypatch.setattr(dr, "docker_root_dir", lambda _client: str(tmp_path))
+    monkeypatch.setattr(dr, "take_monitor_sample", fake_sample)
+    monkeypatch.setattr(
+        dr, "_run_monitor_remedy", lambda remedy, _out: remedies.append(remedy) or {"ok": True}
+    )
+    log = tmp_path / "m.jsonl"
+    args = dr.build_parser().parse_args(
+        ["monitor", "--samples", "7", "--interval", "0", "--log", str(log), "--horizon-hours", "24"]
+    )
+    assert dr.cmd_monitor(args, sleep=lambda _s: None) == dr.EXIT_OK
+    # The trend appears at the 5th sample; the 30-minute cooldown covers
+    # the two after it.
+    assert remedies == ["gc"]
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert len([r for r in records if "event" not in r]) == 7
+    assert [r["remedy"] for r in records if r.get("event") == "remedy"] == ["gc"]
+    assert records[0]["api_via"] == "socket"
+    printed = capsys.readouterr().out
+    assert f"watching free disk on {tmp_path}" in printed
+    assert "running gc" in printed
+
+
+def test_docker_monitor_entry_runs_the_monitor_subcommand(monkeypatch):
+    spec = importlib.util.spec_from_file_location(
+        "clud_test_docker_monitor", SCRIPT.with_name("docker_monitor.py")
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+        seen = []
+        monkeypatch.setattr(
+            module.docker_recover, "cmd_monitor", lambda args: seen.append(args.samples) or 0
+        )
+        assert module.main(["--samples", "3"]) == 0
+        assert seen == [3]
+    finally:
+        sys.modules.pop("docker_recover", None)
+
+
 def test_low_disk_recommends_gc_before_restart(dr):
     report = dr.HealthReport(healthy=False, category=dr.CAT_STORAGE_PRESSURE)
     steps = dr.recommended_remedy(report, disk_low=True)
@@ -1148,7 +1667,7 @@ def test_readiness_poll_emits_progress_and_supports_cold_start(dr):
     )
     text = out.getvalue()
     assert "waiting for the engine" in text
-    assert "readiness attempt 1/5" in text
+    assert "readiness attempt 1 " in text
     assert "engine ready after 3 attempt(s)" in text
 
 
@@ -0,0 +1,306 @@
+"""Spool, flush and socket coverage for `hooks/telemetry.py`.
+
+The hook sends one frame on the daemon's telemetry socket when it can, and
+otherwise appends to a per-session spool that a single flusher ships to
+`/telemetry/bulk`. These tests drive every path against a local stand-in
+daemon (`FakeDaemon`) that records each request on either lane.
+"""
+
+from __future__ import annotations
+
+import http.server
+import importlib.util
+import json
+import os
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tests import process
+
+ROOT = Path(__file__).resolve().parents[1]
+TELEMETRY = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "hooks" / "telemetry.py"
+
+
+@pytest.fixture
+def tel():
+    spec = importlib.util.spec_from_file_location("clud_telemetry_hook", TELEMETRY)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["clud_telemetry_hook"] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop("clud_telemetry_hook", None)
+
+
+class FakeDaemon:
+    """Accepts `POST /telemetry/bulk` with the capability cookie, and frames
+    on a unix socket when `socket_path` is given; records every envelope."""
+
+    def __init__(self, token: str = "cap", socket_path: Path | None = None) -> None:
+        self.batches: list[dict] = []
+        self.headers: list[dict] = []
+        self.lanes: list[str] = []
+        self.fail = False
+        # Ingest socket frames but never answer them.
+        self.mute = False
+        daemon = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                ok = (
+                    not daemon.fail
+                    and self.path == "/telemetry/bulk"
+                    and self.headers.get("Cookie") == f"clud_dashboard_token={token}"
+                )
+                if ok:
+                    daemon.batches.append(json.loads(body))
+                    daemon.headers.append(dict(self.headers))
+                    daemon.lanes.append("http")
+                self.send_response(200 if ok else 403)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *_args):
+                pass
+
+        class FrameHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for frame in self.rfile:
+                    envelope = json.loads(frame)
+                    daemon.batches.append(envelope)
+                    daemon.lanes.append("socket")
+                    if daemon.mute:
+                        continue
+                    reply = {"accepted": len(envelope["entries"])}
+                    self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.servers = [self.server]
+        if socket_path is not None:
+            self.servers.append(
+                socketserver.ThreadingUnixStreamServer(str(socket_path), FrameHandler)
+            )
+        self.threads = [
+            threading.Thread(target=server.serve_forever, daemon=True) for server in self.servers
+        ]
+
+    @property
+    def entries(self) -> list[dict]:
+        return [e for batch in self.batches for e in batch["entries"]]
+
+    def __enter__(self):
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def __exit__(self, *_exc):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.fixture
+def sock():
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can exceed it.
+    directory = Path(tempfile.mkdtemp(prefix="clud-tel-"))
+    try:
+        yield directory / "telemetry.sock"
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+unix_only = pytest.mark.skipif(sys.platform == "win32", reason="the fast path is unix-only")
+
+
+def _record(tel, n: int) -> dict:
+    return tel.build_record({"tool_name": "Bash", "tool_input": {"command": f"echo {n}"}})
+
+
+def test_record_excludes_the_dashboard_token(tel, monkeypatch):
+    monkeypatch.setenv("CLUD_DAEMON_HTTP_TOKEN", "secret")
+    monkeypatch.setenv("CLUD_TASK", "t1")
+    record = _record(tel, 1)
+    assert record["cmd"] == "Bash: echo 1"
+    assert record["env"]["CLUD_TASK"] == "t1"
+    assert "CLUD_DAEMON_HTTP_TOKEN" not in record["env"]
+
+
+def test_concurrent_appends_never_interleave(tel, tmp_path):
+    def writer(k):
+        for n in range(50):
+            tel.spool_record(tmp_path, "s1", {**_record(tel, n), "cmd": f"{k}-{n}" + "x" * 500})
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lines = (tmp_path / "s1.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 400
+    assert len({json.loads(line)["cmd"] for line in lines}) == 400
+
+
+def test_full_spool_counts_drops_instead_of_growing(tel, tmp_path, monkeypatch):
+    monkeypatch.setattr(tel, "SPOOL_MAX_BYTES", 1)
+    assert tel.spool_record(tmp_path, "s1", _record(tel, 1)) is True
+    assert tel.spool_record(tmp_path, "s1", _record(tel, 2)) is False
+    assert tel.spool_record(tmp_path, "s1", _record(tel, 3)) is False
+    assert len((tmp_path / "s1.jsonl").read_text().splitlines()) == 1
+    assert (tmp_path / "s1.dropped").stat().st_size == 2
+
+
+def test_flush_ships_batches_with_the_capability_cookie(tel, tmp_path, monkeypatch):
+    monkeypatch.setattr(tel, "FLUSH_BATCH_MAX_BYTES", 4096)
+    for n in range(60):
+        tel.spool_record(tmp_path, "s1", _record(tel, n))
+    tel.spool_record(tmp_path, "s2", _record(tel, 99))
+    (tmp_path / "s1.dropped").write_bytes(b"...")
+    with FakeDaemon() as daemon:
+        shipped, ok = tel.flush_once(tmp_path, daemon.url, "cap")
+    assert (shipped, ok) == (61, True)
+    assert len(daemon.batches) > 1, "the byte cap must split the spool"
+    assert sum(b["dropped"] for b in daemon.batches) == 3
+    assert daemon.headers[0]["Host"] == daemon.url.removeprefix("http://")
+    assert [e["cmd"] for e in daemon.entries[:60]] == [f"Bash: echo {n}" for n in range(60)]
+    assert not list(tmp_path.glob("s*")), "shipped spools and counters are removed"
+
+
+def test_daemon_down_keeps_records_without_duplicates(tel, tmp_path, monkeypatch):
+    monkeypatch.setattr(tel, "FLUSH_BATCH_MAX_BYTES", 2048)
+    for n in range(30):
+        tel.spool_record(tmp_path, "s1", _record(tel, n))
+    with FakeDaemon() as daemon:
+        daemon.fail = True
+        assert tel.flush_once(tmp_path, daemon.url, "cap") == (0, False)
+        # Records written while the claimed spool waits for a retry.
+        tel.spool_record(tmp_path, "s1", _record(tel, 30))
+        daemon.fail = False
+        tel.flush_once(tmp_path, daemon.url, "cap")
+        tel.flush_once(tmp_path, daemon.url, "cap")
+    cmds = [e["cmd"] for e in daemon.entries]
+    assert cmds == [f"Bash: echo {n}" for n in range(31)]
+
+
+def test_torn_lines_are_reported_as_dropped(tel, tmp_path):
+    tel.spool_record(tmp_path, "s1", _record(tel, 1))
+    with (tmp_path / "s1.jsonl").open("ab") as f:
+        f.write(b'{"parent_pid": 1, "cm\n')
+    with FakeDaemon() as daemon:
+        tel.flush_once(tmp_path, daemon.url, "cap")
+        tel.flush_once(tmp_path, daemon.url, "cap")
+    assert len(daemon.entries) == 1
+    assert sum(b["dropped"] for b in daemon.batches) == 1
+
+
+def test_only_one_flusher_holds_the_spool(tel, tmp_path):
+    lock = tel._FlushLock(tmp_path)
+    assert lock.acquire()
+    try:
+        assert tel.flusher_running(tmp_path)
+        assert tel.run_flusher(tmp_path, "http://127.0.0.1:1", "cap", idle_exit_sec=0) == 0
+    finally:
+        lock.close()
+    assert not tel.flusher_running(tmp_path)
+
+
+def test_hook_spools_and_lazy_flusher_ships(tmp_path):
+    spool = tmp_path / "spool"
+    payload = json.dumps(
+        {"tool_name": "Bash", "tool_input": {"command": "echo hi"}, "session_id": "abc/1"}
+    )
+    env = os.environ.copy()
+    env.update(
+        {
+            "CLUD_TELEMETRY_SPOOL_DIR": str(spool),
+            "CLUD_DAEMON_HTTP_TOKEN": "cap",
+            "CLUD_TELEMETRY_STDIN_IDLE_TIMEOUT_SEC": "0.05",
+        }
+    )
+    env.pop("CLUD_SESSION_ID", None)
+    with FakeDaemon() as daemon:
+        env["CLUD_DAEMON_HTTP_SERVER"] = daemon.url
+        result = process.run(
+            [sys.executable, str(TELEMETRY)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+        deadline = time.monotonic() + 20
+        while not daemon.entries and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert [e["cmd"] for e in daemon.entries] == ["Bash: echo hi"]
+        assert "CLUD_DAEMON_HTTP_TOKEN" not in daemon.entries[0]["env"]
+        # The claimed spool is removed once its batch is acknowledged.
+        while list(spool.glob("*.jsonl*")) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    assert not list(spool.glob("*.jsonl*"))
+
+
+@unix_only
+def test_flusher_prefers_the_socket_and_falls_back_to_http(tel, tmp_path, sock):
+    for n in range(3):
+        tel.spool_record(tmp_path, "s1", _record(tel, n))
+    with FakeDaemon(socket_path=sock) as daemon:
+        tel.flush_once(tmp_path, daemon.url, "cap", sock_path=str(sock))
+        tel.spool_record(tmp_path, "s1", _record(tel, 3))
+        tel.flush_once(tmp_path, daemon.url, "cap", sock_path=str(sock.with_name("gone.sock")))
+    assert daemon.lanes == ["socket", "http"]
+    assert [e["cmd"] for e in daemon.entries] == [f"Bash: echo {n}" for n in range(4)]
+
+
+@unix_only
+def test_a_sent_frame_without_a_reply_is_not_shipped_twice(tel, tmp_path, sock, monkeypatch):
+    monkeypatch.setattr(tel, "SOCKET_REPLY_TIMEOUT_SEC", 0.05)
+    for n in range(2):
+        tel.spool_record(tmp_path, "s1", _record(tel, n))
+    with FakeDaemon(socket_path=sock) as daemon:
+        daemon.mute = True
+        assert tel.flush_once(tmp_path, daemon.url, "cap", sock_path=str(sock)) == (2, True)
+        assert tel.flush_once(tmp_path, daemon.url, "cap", sock_path=str(sock)) == (0, True)
+    assert daemon.lanes == ["socket"]
+    assert [e["cmd"] for e in daemon.entries] == ["Bash: echo 0", "Bash: echo 1"]
+    assert not list(tmp_path.glob("*.jsonl*"))
+
+
+@unix_only
+def test_hook_sends_one_frame_and_skips_the_spool(tmp_path, sock):
+    spool = tmp_path / "spool"
+    env = os.environ.copy()
+    env.update(
+        {
+            "CLUD_TELEMETRY_SPOOL_DIR": str(spool),
+            "CLUD_DAEMON_TELEMETRY_SOCKET": str(sock),
+            "CLUD_TELEMETRY_STDIN_IDLE_TIMEOUT_SEC": "0.05",
+        }
+    )
+    env.pop("CLUD_DAEMON_HTTP_SERVER", None)
+    payload = json.dumps({"tool_name": "Read", "tool_input": {"file_path": "/x"}})
+    with FakeDaemon(socket_path=sock) as daemon:
+        result = process.run(
+            [sys.executable, str(TELEMETRY)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=30,
+        )
+    assert result.returncode == 0, result.stderr
+    assert daemon.lanes == ["socket"]
+    assert [e["cmd"] for e in daemon.entries] == ["Read: /x"]
+    assert not spool.exists()
@@ -0,0 +1,111 @@
+"""Workspace mode and result cache for `hooks/uv_run_hook_guard.py`."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+GUARD = ROOT / "crates" / "clud-bin" / "assets" / "tools" / "hooks" / "uv_run_hook_guard.py"
+
+
+@pytest.fixture
+def guard(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("clud_uv_run_hook_guard", GUARD)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["clud_uv_run_hook_guard"] = module
+    try:
+        spec.loader.exec_module(module)
+        monkeypatch.setenv(module.CACHE_ENV, str(tmp_path / "cache.json"))
+        # Fixture files are written moments before each scan.
+        monkeypatch.setattr(module, "CACHE_RACY_WINDOW_SEC", 0)
+        yield module
+    finally:
+        sys.modules.pop("clud_uv_run_hook_guard", None)
+
+
+def _polyglot(repo: Path, command: str) -> Path:
+    (repo / ".git").mkdir(parents=True)
+    (repo / "Cargo.toml").write_text("[workspace]\n")
+    (repo / "pyproject.toml").write_text('[build-system]\nbuild-backend = "maturin"\n')
+    (repo / ".claude").mkdir()
+    hook = {"hooks": [{"type": "command", "command": command}]}
+    settings = {"hooks": {"PreToolUse": [{"matcher": "Bash", **hook}]}}
+    (repo / ".claude" / "settings.json").write_text(json.dumps(settings))
+    return repo
+
+
+def _bump(path: Path, body: str) -> None:
+    path.write_text(body)
+    stamp = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_workspace_finds_checkouts_and_agent_worktrees(guard, tmp_path):
+    ws = tmp_path / "ws"
+    _polyglot(ws / "main", "uv run pytest")
+    _polyglot(ws / "main" / ".claude" / "worktrees" / "agent-a", "bash ./ci.sh")
+    (ws / "main" / ".claude" / "worktrees" / "agent-a" / "ci.sh").write_text("uv run ruff\n")
+    _polyglot(ws / "safe", "uv run --no-sync pytest")
+    (ws / "notes").mkdir()
+
+    repos = guard.workspace_repos(ws)
+    assert [r.name for r in repos] == ["main", "safe", "agent-a"]
+    offenders = guard.scan_many(repos, jobs=4)
+    assert [(o.command, o.indirect_via and o.indirect_via.name) for o in offenders] == [
+        ("uv run pytest", None),
+        ("uv run ruff", "ci.sh"),
+    ]
+
+
+def test_unchanged_repos_are_answered_from_the_cache(guard, tmp_path, monkeypatch):
+    repo = _polyglot(tmp_path / "repo", "./ci.sh")
+    clean = _polyglot(tmp_path / "clean", "echo ok")
+    scanned: list[str] = []
+    real = guard._scan_with_inputs
+    monkeypatch.setattr(
+        guard, "_scan_with_inputs", lambda root: scanned.append(root.name) or real(root)
+    )
+
+    assert guard.scan_many([repo, clean]) == []
+    assert guard.scan_many([repo, clean]) == []
+    assert scanned == ["repo", "clean"], "the second run must not re-scan"
+
+    # A followed script that didn't exist is still part of the key.
+    _bump(repo / "ci.sh", "uv run pytest\n")
+    assert [o.command for o in guard.scan_many([repo, clean])] == ["uv run pytest"]
+    _bump(repo / "ci.sh", "uv run --frozen pytest\n")
+    assert guard.scan_many([repo, clean]) == []
+    assert scanned == ["repo", "clean", "repo", "repo"]
+
+    assert guard.scan_many([repo], use_cache=False) == []
+    assert scanned[-1] == "repo"
+
+
+def test_cached_offenders_still_warn(guard, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(guard.time, "sleep", lambda _s: None)
+    ws = tmp_path / "ws"
+    _polyglot(ws / "a", "uv run pytest")
+    _polyglot(ws / "b", "uv run ruff")
+    for _ in range(2):
+        assert guard.main(["uv_run_hook_guard.py", "--workspace", str(ws)]) == 0
+        err = capsys.readouterr().err
+        assert "detected 2 bare `uv run`" in err
+        assert "command: uv run pytest" in err
+        assert "command: uv run ruff" in err
+    cached = json.loads((tmp_path / "cache.json").read_text())
+    assert sorted(Path(r).name for r in cached["repos"]) == ["a", "b"]
+
+
+def test_an_unreadable_cache_is_a_miss(guard, tmp_path):
+    (tmp_path / "cache.json").write_text("{not json")
+    repo = _polyglot(tmp_path / "repo", "uv run pytest")
+    assert len(guard.scan_many([repo])) == 1
+    assert json.loads((tmp_path / "cache.json").read_text())["version"] == guard.CACHE_VERSION